@@ -77,9 +77,11 @@ def parse_args():
         "-ep",
         "--endpoint",
         type=str,
+        nargs="+",
+        action=SplitArguments,
         required=True,
-        help="fqdn/ip:port of s3 endpoint for io operations without http/https."
-        "protocol in endpoint is based on use_ssl flag.",
+        help="One or more(space/comma separated) fqdn/ip:port of s3 endpoints for io operations "
+        "without http/https. protocol in endpoint is based on use_ssl flag.",
         default="s3.seagate.com",
     )
     parser.add_argument(
@@ -130,6 +132,20 @@ def parse_args():
         action="store_true",
         help="Run test sequentially from workload.",
     )
+    parser.add_argument(
+        "-rs",
+        "--resume",
+        action="store_true",
+        help="Resume workloads from on-disk object catalog(catalog_dir) of previous run.",
+    )
+    parser.add_argument(
+        "-el",
+        "--event_loop",
+        type=str,
+        choices=["asyncio", "uvloop"],
+        default=None,
+        help="Event loop used by workload processes, default is event_loop from corio config.",
+    )
     return parser.parse_args()
 
 
@@ -43,7 +43,7 @@ class TestMixObjectOps(S3Api):
 
         :param access_key: access key.
         :param secret_key: secret key.
-        :param endpoint_url: endpoint with http or https.
+        :param endpoint_url: endpoint or list of endpoints with http or https.
         :param test_id: Test ID string.
         :param use_ssl: To use secure connection.
         :param object_size: Object size to be used for bucket operation
@@ -61,7 +61,6 @@ class TestMixObjectOps(S3Api):
         random.seed(kwargs.get("seed"))
         self.access_key = access_key
         self.secret_key = secret_key
-        self.endpoint_url = endpoint_url
         self.object_name = None
         if not S3bench.install_s3bench():
             raise Exception("s3bench tool is not installed.")
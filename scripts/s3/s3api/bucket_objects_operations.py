@@ -17,8 +17,8 @@
 #
 """Script type5 s3 bucket objects operation workload for io stability."""
 
+import asyncio
 import random
-import time
 from datetime import datetime, timedelta
 
 from src.commons.constants import MIN_DURATION
@@ -54,6 +54,7 @@ class TestType5BucketObjectOps(S3ApiIOUtils):
             secret_key,
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
+            checksum_algorithm=kwargs.get("checksum_algorithm"),
             test_id=f"{kwargs.get('test_id')}_bucket_objects_operations",
         )
         random.seed(kwargs.get("seed"))
@@ -83,29 +84,27 @@ class TestType5BucketObjectOps(S3ApiIOUtils):
                 self.kwargs.get("overwrite_percentage_per_bucket"),
                 read_percentage_per_bucket=self.kwargs.get("read_percentage_per_bucket"),
             )
-            self.starts_sessions(self.write_data, distribution, object_size)
+            await self.write_data(distribution, object_size)
             while True:
                 if iteration > 1:
                     self.log.info("Iteration %s is started.", iteration)
                 if delay:
                     sleep_time = self.get_random_sleep_time(delay)
                     self.log.info("sleep for %s hrs", sleep_time / (60**2))
-                    time.sleep(sleep_time)
+                    await asyncio.sleep(sleep_time)
                 if self.kwargs.get("read_percentage_per_bucket"):
-                    self.starts_sessions(self.read_distribution_data, distribution, object_size)
+                    await self.read_distribution_data(distribution, object_size)
                 else:
-                    self.starts_sessions(self.read_all_data, distribution)
+                    await self.read_all_data(distribution)
                 if self.kwargs.get("overwrite_percentage_per_bucket"):
-                    self.starts_sessions(
-                        self.overwrite_distribution_data, distribution, object_size
-                    )
+                    await self.overwrite_distribution_data(distribution, object_size)
                 if self.kwargs.get("delete_percentage_per_bucket"):
-                    self.starts_sessions(self.delete_distribution_data, distribution)
+                    await self.delete_distribution_data(distribution)
                 if self.kwargs.get("put_percentage_per_bucket"):
-                    self.starts_sessions(self.write_distribution_data, distribution, object_size)
+                    await self.write_distribution_data(distribution, object_size)
                 self.log.info("Iteration %s is completed.", iteration)
                 if (self.finish_time - datetime.now()).total_seconds() < MIN_DURATION:
-                    self.starts_sessions(self.cleanup_data, buckets)
+                    await self.cleanup_data(buckets)
                     return True, "bucket object workload execution completed successfully."
                 iteration += 1
         except Exception as err:
@@ -22,8 +22,9 @@ import random
 from datetime import datetime, timedelta
 from time import perf_counter_ns
 
+from src.commons.constants import DATA_DIR_PATH
 from src.commons.constants import MIN_DURATION
-from src.commons.utils import utility
+from src.commons.utils.datagen import StreamingPayload
 from src.libs import IAMClient
 from src.libs.s3api import S3Api
 
@@ -62,6 +63,7 @@ class TestBucketOps(S3Api):
             secret_key,
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
+            checksum_algorithm=kwargs.get("checksum_algorithm"),
             test_id=f"{test_id}_bucket_operations",
         )
         random.seed(kwargs.get("seed"))
@@ -72,23 +74,16 @@ class TestBucketOps(S3Api):
         self.kwargs = kwargs
         self.finish_time = datetime.now() + kwargs.get("duration", timedelta(hours=int(100 * 24)))
 
-    # pylint: disable=broad-except, too-many-locals
+    # pylint: disable=broad-except
     async def execute_bucket_workload(self):
         """Execute bucket operations workload for specific duration."""
+        bops_obj, user_name = None, None
         try:
             number_of_buckets = self.kwargs.get("number_of_buckets")
             iteration, buckets = 1, []
-            bops_obj, user_name = None, None
             if number_of_buckets:
                 user_name = f"iam-user-{self.test_id.lower()}-{perf_counter_ns()}"
-                response = await self.create_s3iam_user(user_name)
-                bops_obj = S3Api(
-                    access_key=response["AccessKey"]["AccessKeyId"],
-                    secret_key=response["AccessKey"]["SecretAccessKey"],
-                    endpoint_url=self.kwargs.get("endpoint_url"),
-                    use_ssl=self.kwargs.get("use_ssl"),
-                    test_id=f"{self.test_id}_bucket_operations",
-                )
+                bops_obj = await self.create_s3iam_user_client(user_name)
                 buckets = await self.create_number_of_buckets(bops_obj, number_of_buckets)
             while True:
                 self.log.info("Iteration %s is started for %s", iteration, self.session_id)
@@ -99,48 +94,73 @@ class TestBucketOps(S3Api):
                 else:
                     file_size = self.object_size
                 if number_of_buckets:
-                    bucket_name = random.choice(buckets)  # nosec
-                    file_name = f"object-{self.test_id.lower()}-{perf_counter_ns()}"
-                    file_path = utility.create_file(file_name, file_size)
-                    sha256_in = bops_obj.checksum_file(file_path)
-                    self.s3_url = bops_obj.s3_url
-                    await bops_obj.upload_object(bucket_name, file_name, file_path=file_path)
-                    os.remove(file_path)
-                    await bops_obj.download_object(bucket_name, file_name, file_path)
-                    sha256_out = bops_obj.checksum_file(file_path)
-                    if sha256_in != sha256_out:
-                        raise AssertionError(
-                            f"Failed to match checksum for {bops_obj.s3_url}. "
-                            f"Input file checksum: {sha256_in}"
-                            f"Output file checksum: {sha256_out}"
-                        )
+                    await self.upload_download_object(bops_obj, buckets, file_size)
                 else:
-                    bucket_name = (
-                        f"bucket-op-{self.test_id.lower()}-iter{iteration}-{perf_counter_ns()}"
-                    )
-                    self.log.info("Create bucket %s", bucket_name)
-                    await self.create_bucket(bucket_name)
-                    await self.upload_n_number_objects(bucket_name, file_size)
-                    self.log.info("List all buckets")
-                    await self.list_buckets()
-                    self.log.info("List objects of created %s bucket", bucket_name)
-                    await self.list_objects(bucket_name)
-                    self.log.info("Perform Head bucket")
-                    await self.head_bucket(bucket_name)
-                    self.log.info("Delete bucket %s with all objects in it.", bucket_name)
-                    await self.delete_bucket(bucket_name, True)
+                    await self.create_fill_delete_bucket(iteration, file_size)
                 self.log.info("Iteration %s is completed of %s", iteration, self.session_id)
                 if (self.finish_time - datetime.now()).total_seconds() < MIN_DURATION:
-                    if bops_obj:
-                        for bucket in await bops_obj.list_buckets():
-                            await bops_obj.delete_bucket(bucket, force=True)
                     if user_name:
-                        await self.delete_s3iam_user(user_name)
+                        await self.cleanup_s3iam_user(bops_obj, user_name)
                     return True, "Bucket operation execution completed successfully."
                 iteration += 1
         except Exception as err:
             self.log.exception("bucket url: {%s}\nException: {%s}", self.s3_url, err)
             assert False, f"bucket url: {self.s3_url}\nException: {err}"
+        finally:
+            if bops_obj:
+                await bops_obj.close()
+
+    async def create_s3iam_user_client(self, user_name):
+        """Create s3 iam user and get s3 client of the user, closed by the caller."""
+        response = await self.create_s3iam_user(user_name)
+        return S3Api(
+            access_key=response["AccessKey"]["AccessKeyId"],
+            secret_key=response["AccessKey"]["SecretAccessKey"],
+            endpoint_url=self.kwargs.get("endpoint_url"),
+            use_ssl=self.kwargs.get("use_ssl"),
+            checksum_algorithm=self.checksum_algorithm,
+            test_id=f"{self.test_id}_bucket_operations",
+        )
+
+    async def cleanup_s3iam_user(self, bops_obj, user_name):
+        """Delete buckets of s3 iam user along with all objects in them and delete the user."""
+        for bucket in await bops_obj.list_buckets():
+            await bops_obj.delete_bucket(bucket, force=True)
+        await self.delete_s3iam_user(user_name)
+
+    async def upload_download_object(self, bops_obj, buckets, file_size):
+        """Upload object to random bucket of iam user, download it and compare checksums."""
+        bucket_name = random.choice(buckets)  # nosec
+        file_name = f"object-{self.test_id.lower()}-{perf_counter_ns()}"
+        payload = StreamingPayload(file_size, algorithm=self.checksum_algorithm, hash_on_read=True)
+        self.s3_url = bops_obj.s3_url
+        await bops_obj.upload_object(bucket_name, file_name, body=payload)
+        checksum_in = await bops_obj.checksum_payload(payload)
+        file_path = os.path.join(DATA_DIR_PATH, file_name)
+        await bops_obj.download_object(bucket_name, file_name, file_path)
+        checksum_out = await bops_obj.checksum_file_async(file_path)
+        os.remove(file_path)
+        if checksum_in != checksum_out:
+            raise AssertionError(
+                f"Failed to match checksum for {bops_obj.s3_url}. "
+                f"Input file checksum: {checksum_in}"
+                f"Output file checksum: {checksum_out}"
+            )
+
+    async def create_fill_delete_bucket(self, iteration, file_size):
+        """Create bucket, upload objects, list and head it, then delete it with all objects."""
+        bucket_name = f"bucket-op-{self.test_id.lower()}-iter{iteration}-{perf_counter_ns()}"
+        self.log.info("Create bucket %s", bucket_name)
+        await self.create_bucket(bucket_name)
+        await self.upload_n_number_objects(bucket_name, file_size)
+        self.log.info("List all buckets")
+        await self.list_buckets()
+        self.log.info("List objects of created %s bucket", bucket_name)
+        await self.list_objects(bucket_name)
+        self.log.info("Perform Head bucket")
+        await self.head_bucket(bucket_name)
+        self.log.info("Delete bucket %s with all objects in it.", bucket_name)
+        await self.delete_bucket(bucket_name, True)
 
     async def upload_n_number_objects(self, bucket_name, file_size):
         """Upload n number of objects."""
@@ -149,12 +169,8 @@ class TestBucketOps(S3Api):
         for i in range(1, number_of_objects + 1):
             file_name = f"object-{i}-{perf_counter_ns()}"
             self.log.info("Object '%s', object size %s bytes", file_name, file_size)
-            file_path = utility.create_file(file_name, file_size)
-            await self.upload_object(bucket_name, file_name, file_path=file_path)
+            await self.upload_object(bucket_name, file_name, body=StreamingPayload(file_size))
             self.log.info("'%s' uploaded successfully.", self.s3_url)
-            self.log.info("Delete generated file")
-            if os.path.exists(file_path):
-                os.remove(file_path)
 
     async def create_number_of_buckets(self, bkt_ops_obj, number_of_buckets):
         """Create s3 buckets as per number_of_buckets."""
@@ -24,6 +24,7 @@ from math import modf
 from time import perf_counter_ns
 from typing import Union
 
+from config import S3_CFG
 from src.commons.constants import MIN_DURATION
 from src.commons.utils.k8s import ClusterServices
 from src.commons.utils.utility import get_master_details
@@ -40,9 +41,14 @@ class TestTypeXObjectOps(S3ApiParallelIO):
 
         :param access_key: access key.
         :param secret_key: secret key.
-        :param endpoint_url: endpoint with http or https.
+        :param endpoint_url: endpoint or list of endpoints with http or https.
         :param test_id: Test ID string.
         :param use_ssl: To use secure connection.
+        :param checksum_algorithm: Algorithm to validate data, sha256/md5/etag/crc32c/xxh3.
+        :param rate: Operations per second in open-loop mode, default is closed-loop on sessions.
+        :param arrival: Arrivals of open-loop operations constant or poisson.
+        :param op_mix: Weights of put, get, head and delete operations of mixed workload.
+        :param dataset_objects: Band(start, end) of number of objects of mixed workload.
         :param object_size: Object size to be used for bucket operation
         :param seed: Seed to be used for random data generator
         :param session: session name.
@@ -53,20 +59,27 @@ class TestTypeXObjectOps(S3ApiParallelIO):
             secret_key,
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
+            checksum_algorithm=kwargs.get("checksum_algorithm"),
             test_id=f"{kwargs.get('test_id')}_mix_s3io_operations",
+            rate=kwargs.get("rate"),
+            arrival=kwargs.get("arrival"),
+            seed=kwargs.get("seed"),
         )
         random.seed(kwargs.get("seed"))
         self.access_key = access_key
         self.secret_key = secret_key
-        self.endpoint_url = endpoint_url
         self.iteration = 1
         self.sessions = kwargs.get("sessions")
         if kwargs.get("duration"):
             self.finish_time = datetime.now() + kwargs.get("duration")
         else:
             self.finish_time = datetime.now() + timedelta(hours=int(100 * 24))
+        self.op_mix = kwargs.get("op_mix")
+        self.dataset_objects = kwargs.get("dataset_objects")
         if "total_storage_size" in kwargs:
             self.initialize_variables(**kwargs)
+            # Data written by previous run is in catalog reloaded on resume.
+            self.total_written_data = self.catalog.total_size()
         else:
             self.distribution = kwargs.get("object_size")
 
@@ -202,7 +215,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     write_object_distribution = await self.get_object_distribution(
                         object_size, operation="write"
                     )
-                    self.execute_workload(
+                    await self.execute_workload_async(
                         operations="write",
                         distribution=write_object_distribution,
                         sessions=self.sessions,
@@ -216,7 +229,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     read_object_distribution = await self.get_object_distribution(
                         object_size, operation="read"
                     )
-                    self.execute_workload(
+                    await self.execute_workload_async(
                         operations="read",
                         distribution=read_object_distribution,
                         sessions=self.sessions,
@@ -233,7 +246,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     delete_object_distribution = await self.get_object_distribution(
                         object_size, operation="delete"
                     )
-                    self.execute_workload(
+                    await self.execute_workload_async(
                         operations="delete",
                         distribution=delete_object_distribution,
                         sessions=self.sessions,
@@ -250,7 +263,9 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                             self.s3_url,
                             self.cleanup_percentage,
                         )
-                        self.execute_workload(operations="cleanup", sessions=self.sessions)
+                        await self.execute_workload_async(
+                            operations="cleanup", sessions=self.sessions
+                        )
                         self.total_written_data *= 0
                         self.log.info("Data cleanup competed...")
                 await self.display_storage_consumed(operation="")
@@ -264,17 +279,42 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                 self.log.exception(exception)
                 assert False, exception
             if (self.finish_time - datetime.now()).total_seconds() < MIN_DURATION:
-                self.execute_workload(operations="cleanup", sessions=self.sessions)
+                await self.execute_workload_async(operations="cleanup", sessions=self.sessions)
                 return True, "Object workload execution completed successfully."
             self.iteration += 1
 
+    async def execute_mixed_op_workload(self):
+        """Execute interleaved put, get, head and delete as per op mix for specific time."""
+        bucket_name = f"s3mixed-bucket-{perf_counter_ns()}"
+        await self.create_bucket(bucket_name)
+        while True:
+            try:
+                self.log.info("iteration %s is started...", self.iteration)
+                await self.run_mixed_operations(
+                    bucket_name,
+                    S3_CFG.mixed_ops_per_iteration,
+                    self.sessions,
+                    self.op_mix,
+                    self.distribution,
+                    dataset_objects=self.dataset_objects,
+                    object_prefix="s3mixed-object",
+                )
+            except Exception as err:
+                self.log.exception("bucket url: {%s}\nException: {%s}", self.s3_url, err)
+                assert False, f"bucket url: {self.s3_url}\nException: {err}"
+            if (self.finish_time - datetime.now()).total_seconds() < MIN_DURATION:
+                await self.execute_workload_async(operations="cleanup", sessions=self.sessions)
+                return True, "Mixed operations execution completed successfully."
+            self.log.info("iteration %s is completed...", self.iteration)
+            self.iteration += 1
+
     async def execute_object_crud_workload(self):
         """Execute plain object operation workload for given distribution for specific time."""
         while True:
             try:
                 self.log.info("iteration %s is started...", self.iteration)
                 # Write data to fill storage as per write percentage/distribution.
-                self.execute_workload(
+                await self.execute_workload_async(
                     operations="write",
                     distribution=self.distribution,
                     sessions=self.sessions,
@@ -285,7 +325,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     self.distribution.values(),
                 )
                 # Read data as per read percentage/distribution.
-                self.execute_workload(
+                await self.execute_workload_async(
                     operations="read",
                     distribution=self.distribution,
                     sessions=self.sessions,
@@ -297,7 +337,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     self.distribution.values(),
                 )
                 # Delete data as per delete percentage.
-                self.execute_workload(
+                await self.execute_workload_async(
                     operations="delete",
                     distribution=self.distribution,
                     sessions=self.sessions,
@@ -308,13 +348,13 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     self.distribution.values(),
                 )
                 self.log.info("Cleaning up remaining buckets and objects")
-                self.execute_workload(operations="cleanup", sessions=self.sessions)
+                await self.execute_workload_async(operations="cleanup", sessions=self.sessions)
                 await asyncio.sleep(0)
             except Exception as err:
                 self.log.exception("bucket url: {%s}\nException: {%s}", self.s3_url, err)
                 assert False, f"bucket url: {self.s3_url}\nException: {err}"
             if (self.finish_time - datetime.now()).total_seconds() < MIN_DURATION:
-                self.execute_workload(operations="cleanup", sessions=self.sessions)
+                await self.execute_workload_async(operations="cleanup", sessions=self.sessions)
                 return True, "Bucket operation execution completed successfully."
             self.log.info("iteration %s is completed...", self.iteration)
             self.iteration += 1
@@ -17,7 +17,6 @@
 #
 """Script type5 s3 object operation negative scenario workload for io stability."""
 
-import os
 import random
 from datetime import timedelta, datetime
 from time import perf_counter_ns
@@ -26,6 +25,7 @@ from botocore.exceptions import ClientError
 
 from src.commons.constants import MIN_DURATION
 from src.commons.utils import utility
+from src.commons.utils.datagen import StreamingPayload
 from src.libs.s3api import S3Api
 
 
@@ -83,7 +83,7 @@ class TestType5ObjectRRNegative(S3Api):
                 response = await self.create_multipart_upload(mpart_bucket, s3mpart_object)
                 mpu_id = response["UploadId"]
                 for i in range(1, number_of_parts + 1):
-                    byte_s = os.urandom(round(single_part_size))
+                    byte_s = StreamingPayload(round(single_part_size), name=s3mpart_object)
                     await self.upload_part(
                         byte_s, mpart_bucket, s3mpart_object, upload_id=mpu_id, part_number=i
                     )
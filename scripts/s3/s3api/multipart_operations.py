@@ -20,14 +20,15 @@
 #
 """File contains s3 multipart test script for io stability."""
 
-import hashlib
-import os
+import asyncio
 import random
 from datetime import datetime, timedelta
 from time import perf_counter_ns
 
 from src.commons.constants import MIN_DURATION
 from src.commons.utils import utility
+from src.commons.utils.datagen import StreamingPayload
+from src.commons.utils.hashing import AsyncHasher
 from src.libs.s3api import S3Api
 
 
@@ -50,6 +51,7 @@ class TestMultiParts(S3Api):
         :param endpoint_url: endpoint with http or https.
         :param test_id: Test ID string.
         :param use_ssl: To use secure connection.
+        :param checksum_algorithm: Algorithm to validate data, sha256/md5/etag/crc32c/xxh3.
         :param object_size: Size of the object in bytes.
         :param session: session name.
         :param part_range: Number of parts to be uploaded from given range.
@@ -62,6 +64,7 @@ class TestMultiParts(S3Api):
             secret_key,
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
+            checksum_algorithm=kwargs.get("checksum_algorithm"),
             test_id=(
                 f"{test_id}_multipart_partcopy_operations"
                 if self.part_copy
@@ -101,10 +104,10 @@ class TestMultiParts(S3Api):
                 upload_obj_checksum = await self.create_upload_list_completed_mpart(
                     number_of_parts, mpart_bucket, s3mpart_object, s3_object
                 )
-                all_object = await self.list_objects(mpart_bucket)
-                assert s3mpart_object in all_object, f"Failed to upload object {s3mpart_object}"
+                assert await self.object_exists(
+                    mpart_bucket, s3mpart_object
+                ), f"Failed to upload object {s3mpart_object}"
                 self.log.info("Object %s is uploaded successfully",s3mpart_object)
-                await self.head_object(mpart_bucket, s3mpart_object)
                 self.log.info("Getting Checksum of object  %s after upload", s3mpart_object)
                 download_obj_checksum = await self.get_s3object_checksum(
                     mpart_bucket, s3mpart_object, single_part_size
@@ -172,35 +175,42 @@ class TestMultiParts(S3Api):
         """Upload, list and complete multipart operations."""
         response = await self.create_multipart_upload(mpart_bucket, s3mpart_object)
         random_part = random.randrange(1, number_of_parts + 1)
-        parts = []
-        file_hash = hashlib.sha256()
+        payloads = {}
         for i in range(1, number_of_parts + 1):
-            byte_s = os.urandom(round(await self.get_workload_size() / number_of_parts))
-            if self.part_copy and i == random_part:
-                await self.upload_object(body=byte_s, bucket=mpart_bucket, key=s3_object)
-                assert s3_object in await self.list_objects(mpart_bucket), (
-                    f"Failed to upload " f"object {s3_object}"
-                )
-                upload_resp = await self.upload_part_copy(
-                    f"{mpart_bucket}/{s3_object}",
-                    mpart_bucket,
-                    s3_object,
-                    part_number=i,
-                    upload_id=response["UploadId"],
-                )
-            else:
-                upload_resp = await self.upload_part(
-                    byte_s,
-                    mpart_bucket,
-                    s3mpart_object,
-                    upload_id=response["UploadId"],
-                    part_number=i,
-                )
-            etag = upload_resp["CopyPartResult"]["ETag"] if self.part_copy else upload_resp["ETag"]
+            payloads[i] = StreamingPayload(
+                round(await self.get_workload_size() / number_of_parts), name=s3mpart_object
+            )
+        parts = []
+        if self.part_copy:
+            await self.upload_object(body=payloads[random_part], bucket=mpart_bucket, key=s3_object)
+            assert await self.object_exists(mpart_bucket, s3_object), (
+                f"Failed to upload " f"object {s3_object}"
+            )
+            upload_resp = await self.upload_part_copy(
+                f"{mpart_bucket}/{s3_object}",
+                mpart_bucket,
+                s3_object,
+                part_number=random_part,
+                upload_id=response["UploadId"],
+            )
+            etag = upload_resp["CopyPartResult"]["ETag"]
             assert etag is not None, f"Failed upload part: {upload_resp}"
-            parts.append({"PartNumber": i, "ETag": etag})
-            file_hash.update(byte_s)
-        upload_obj_checksum = file_hash.hexdigest()
+            parts.append({"PartNumber": random_part, "ETag": etag})
+        # Parts are uploaded concurrently while whole object is hashed in part order.
+        uploaded, upload_obj_checksum = await asyncio.gather(
+            self.upload_parts(
+                mpart_bucket,
+                s3mpart_object,
+                response["UploadId"],
+                [
+                    (i, payload)
+                    for i, payload in payloads.items()
+                    if not (self.part_copy and i == random_part)
+                ],
+            ),
+            self.get_payloads_checksum(payloads.values()),
+        )
+        parts = sorted(parts + uploaded, key=lambda part: part["PartNumber"])
         self.log.info("Checksum of uploaded object: %s", upload_obj_checksum)
         await self.list_parts(response["UploadId"], mpart_bucket, s3mpart_object)
         await self.list_multipart_uploads(mpart_bucket)
@@ -209,3 +219,11 @@ class TestMultiParts(S3Api):
         )
         self.log.info("'s3://%s/%s' uploaded successfully.", mpart_bucket, s3mpart_object)
         return upload_obj_checksum
+
+    async def get_payloads_checksum(self, payloads) -> str:
+        """Get checksum of data of payloads in given order."""
+        file_hash = AsyncHasher(self.checksum_algorithm)
+        for payload in payloads:
+            for chunk in payload.iter_chunks():
+                await file_hash.update(chunk)
+        return await file_hash.hexdigest()
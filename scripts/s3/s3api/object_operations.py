@@ -24,7 +24,7 @@ from datetime import timedelta, datetime
 from time import perf_counter_ns
 
 from src.commons.constants import MIN_DURATION
-from src.commons.utils import utility
+from src.commons.utils.datagen import StreamingPayload
 from src.libs.s3api import S3Api
 
 
@@ -46,6 +46,7 @@ class TestS3Object(S3Api):
         :param endpoint_url: endpoint with http or https.
         :param test_id: Test ID string.
         :param use_ssl: To use secure connection.
+        :param checksum_algorithm: Algorithm to validate data, sha256/md5/etag/crc32c/xxh3.
         :param object_size: Size of the object in bytes.
         :param seed: Seed for random number generator.
         :param session: session name.
@@ -57,6 +58,7 @@ class TestS3Object(S3Api):
             secret_key,
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
+            checksum_algorithm=kwargs.get("checksum_algorithm"),
             test_id=f"{test_id}_object_operations",
         )
         random.seed(kwargs.get("seed"))
@@ -88,14 +90,15 @@ class TestS3Object(S3Api):
                 else:
                     range_read = self.range_read
                 file_name = f"object-bucket-op-{perf_counter_ns()}"
-                file_path = utility.create_file(file_name, file_size)
+                payload = StreamingPayload.for_object(
+                    bucket, file_name, file_size, algorithm=self.checksum_algorithm
+                )
                 self.log.info("Object '%s', object size %s bytes", file_name, file_size)
-                checksum_in = self.checksum_file(file_path)
-                self.log.debug("Checksum IN = %s", checksum_in)
-                await self.upload_object(bucket, file_name, file_path=file_path)
-                self.log.info("s3://%s/%s uploaded successfully.", bucket, file_name)
+                record = await self.upload_payload(bucket, file_name, payload)
+                self.log.info("s3://%s/%s uploaded successfully: %s", bucket, file_name, record)
                 self.log.info("Perform Head bucket.")
-                await self.head_object(bucket, file_name)
+                response = await self.head_object(bucket, file_name)
+                assert response["ETag"] == record["etag"], f"ETag mismatch for {file_name}."
                 self.log.info("Get Object and check data integrity.")
                 if range_read:
                     part = int(file_size / self.parts)
@@ -116,29 +119,24 @@ class TestS3Object(S3Api):
                             file_size,
                             f'bytes={f"{start_loc}-{end_loc}"}',
                         )
-                        assert await self.get_s3object_checksum(
-                            bucket,
-                            file_name,
-                            ranges=f'bytes={f"{start_loc}-{end_loc}"}',
-                        ) == self.checksum_part_file(file_path, start_loc, range_read), (
-                            f"Checksum of downloaded part for range  "
+                        assert await self.verify_s3object(
+                            bucket, file_name, file_size, offset=start_loc, size=range_read
+                        ), (
+                            f"Data of downloaded part for range "
                             f"({f'{start_loc}-{end_loc}'}) does not "
                             f"match for s3://{bucket}/{file_name}."
                         )
                         self.log.info(
-                            "Able to read and match byte range '{%s}' for %s with original file "
-                            "%s",
+                            "Able to read and match byte range '{%s}' for %s with original data.",
                             f"{start_loc}-{end_loc}",
-                            f"s3://{bucket}/{file_name}.",
-                            file_path,
+                            f"s3://{bucket}/{file_name}",
                         )
                 else:
-                    assert checksum_in == await self.get_s3object_checksum(
-                        bucket, file_name
+                    assert await self.verify_s3object(
+                        bucket, file_name, file_size
                     ), f"Data integrity failed for object: {file_name}."
                 self.log.info("Delete object.")
                 await self.delete_object(bucket, file_name)
-                os.remove(file_path)
                 self.log.info("Iteration %s is completed of %s...", self.iteration, self.session_id)
             except Exception as err:
                 self.log.exception("bucket url: {%s}\nException: {%s}", self.s3_url, err)
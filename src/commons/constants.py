@@ -65,6 +65,8 @@ DT_STRING = datetime.now().strftime("%d_%m_%Y_%H_%M_%S")
 # Supported type of object size.
 KB = 1000
 KIB = 1024
+# Max size of source object of a single copy object request.
+MAX_COPY_OBJECT_SIZE = 5 * KIB**3
 
 # resource utilization package.
 NMON = "nmon"
@@ -89,6 +91,42 @@ terminate_process_list = [
 COMPLETED_SESSION = "Ended Session {}_"
 COMPLETED_ITERATIONS = "Iteration {} is completed"
 
+# Retry policies.
+RETRY = "retry"
+RETRY_THROTTLE = "throttle"
+RETRY_FAIL = "fail"
+THROTTLE_ERROR_CODES = (
+    "SlowDown",
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottled",
+    "RequestLimitExceeded",
+    "TooManyRequests",
+    "TooManyRequestsException",
+    "ServiceUnavailable",
+)
+
+# Checksum algorithms used to validate object data.
+SHA256 = "sha256"
+MD5 = "md5"
+ETAG = "etag"
+CRC32C = "crc32c"
+XXH3 = "xxh3"
+CHECKSUM_ALGORITHMS = (SHA256, MD5, ETAG, CRC32C, XXH3)
+
+# Arrivals of operations in open-loop(rate) mode.
+CONSTANT = "constant"
+POISSON = "poisson"
+ARRIVALS = (CONSTANT, POISSON)
+
+# Operations of mixed(interleaved) workload.
+PUT = "put"
+GET = "get"
+HEAD = "head"
+DELETE = "delete"
+MIXED_OPERATIONS = (PUT, GET, HEAD, DELETE)
+
 # Bucket
 INVALID_BUCKET = "Invalid bucket url: {%s}\nException: {%s}"
 ERROR_CODE_RESPONSE = "Error Code: %s Error Message: %s"
@@ -65,8 +65,14 @@ async def create_session(funct: list, start_time: float, **kwargs: dict) -> tupl
     session = kwargs.get("session")
     LOGGER.info("Starting Session %s, PID - %s", session, os.getpid())
     LOGGER.info("kwargs : %s", kwargs)
-    func = getattr(funct[0](**kwargs), funct[1])
-    resp = await func()
+    workload = funct[0](**kwargs)
+    func = getattr(workload, funct[1])
+    try:
+        resp = await func()
+    finally:
+        # Release pooled connections held by the workload.
+        if hasattr(workload, "close"):
+            await workload.close()
     LOGGER.info(resp)
     LOGGER.info("Ended Session %s, PID - %s", session, os.getpid())
     return resp
@@ -269,7 +275,7 @@ def schedule_execution_plan(parsed_input: dict, options: munch.Munch, return_dic
     processes = {}
     commons_params = {
         "access_secret_keys": get_s3_keys(S3_CFG.access_key, S3_CFG.secret_key),
-        "endpoint_url": S3_CFG.endpoint,
+        "endpoint_url": S3_CFG.endpoints,
         "use_ssl": S3_CFG.use_ssl,
         "seed": options.seed,
         "sequential_run": options.sequential_run,
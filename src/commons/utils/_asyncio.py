@@ -18,15 +18,54 @@
 """AsyncIO utility."""
 
 import asyncio
+import logging
+from contextlib import asynccontextmanager
 
 import nest_asyncio
 
-nest_asyncio.apply()
+from config import CORIO_CFG
+from src.commons.constants import ROOT
+
+LOGGER = logging.getLogger(ROOT)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Patch event loops to be re-entrant, unless compatibility mode(nest_asyncio: False) is set.
+NEST_ASYNCIO = CORIO_CFG.get("nest_asyncio", True)
+
+
+@asynccontextmanager
+async def aclosing(agen):
+    """Close the async generator on exit even if it is not exhausted(contextlib.aclosing)."""
+    try:
+        yield agen
+    finally:
+        await agen.aclose()
+
+
+def new_event_loop():
+    """
+    Create new event loop as per configured event loop type.
+
+    uvloop is used if configured and installed, it can't be nested so nest_asyncio is applied
+    only on asyncio loops and only if compatibility mode(nest_asyncio: False) is not set.
+    """
+    if CORIO_CFG.get("event_loop") == "uvloop":
+        if uvloop:
+            return uvloop.new_event_loop()
+        LOGGER.warning("uvloop is not installed, using asyncio event loop.")
+    loop = asyncio.new_event_loop()
+    if NEST_ASYNCIO:
+        nest_asyncio.apply(loop)
+    return loop
 
 
 def run_event_loop_until_complete(logger, func, *args, **kwargs):
     """Run the event."""
-    new_loop = asyncio.new_event_loop()
+    new_loop = new_event_loop()
     asyncio.set_event_loop(new_loop)
     try:
         new_loop.run_until_complete(func(*args, **kwargs))
@@ -46,6 +85,7 @@ def run_event_loop_until_complete(logger, func, *args, **kwargs):
 
 async def schedule_tasks(logger, tasks):
     """Schedule tasks and wait unit complete or first exception."""
+    tasks = [asyncio.ensure_future(task) for task in tasks]
     done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
     if pending:
         logger.critical("Terminating pending task: %s", pending)
@@ -0,0 +1,358 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Streaming random payloads for s3 uploads without going through local files."""
+
+import hashlib
+import io
+import os
+import random
+from itertools import count
+
+from config import S3_CFG
+from src.commons import constants as const
+from src.commons.utils.hashing import new_digest
+
+
+class DataPool:
+    """
+    Process wide pool of pre-generated random data.
+
+    Pool is allocated once per process and payload data is served as read only memoryview
+    slices of it, so no random data is generated or copied per object. Pool data is derived
+    from the global seed, so every process(and every rerun) with the same seed, pool size and
+    chunk size has the same pool. Pool is extended by one block at the end with data from its
+    start, so any block sized slice from any offset is contiguous.
+    """
+
+    pool = None
+
+    def __init__(self, size: int, block_size: int, seed: int = None):
+        """
+        Allocate and fill the data pool.
+
+        :param size: Size of the pool in bytes.
+        :param block_size: Maximum size of a single slice.
+        :param seed: Seed of pool data, default is random.
+        """
+        self.size = size
+        self.block_size = block_size
+        self.seed = seed
+        generator = random.Random(seed)  # nosec
+        data = bytearray(size + block_size)
+        for offset in range(0, size, const.KIB**2):
+            end = min(offset + const.KIB**2, size)
+            data[offset:end] = generator.getrandbits((end - offset) * 8).to_bytes(
+                end - offset, "little"
+            )
+        data[size:] = data[:block_size]
+        self.buffer = memoryview(data).toreadonly()
+        self.stamps = count(1)
+
+    @classmethod
+    def get_pool(cls):
+        """Get the data pool of the process, allocated on first use."""
+        if cls.pool is None:
+            cls.pool = cls(
+                max(S3_CFG.data_pool_size, S3_CFG.chunk_size),
+                S3_CFG.chunk_size,
+                S3_CFG.get("seed"),
+            )
+        return cls.pool
+
+    def get_slice(self, offset: int, size: int) -> memoryview:
+        """Get zero-copy slice of size(up to block size) bytes starting from offset of pool."""
+        offset %= self.size
+        return self.buffer[offset : offset + min(size, self.block_size)]
+
+    def get_stamp(self, name: str = None) -> bytes:
+        """Get unique stamp of name, process id and counter written at the head of payload."""
+        return f"{name or 'corio'}:{os.getpid()}:{next(self.stamps)}\n".encode()
+
+
+class SeekableReader(io.RawIOBase):
+    """Base of seekable read only streams of known size, subclass implements read."""
+
+    def __init__(self, size: int):
+        """
+        Initialize seekable reader.
+
+        :param size: Size of stream in bytes.
+        """
+        super().__init__()
+        self.size = size
+        self.position = 0
+
+    def __len__(self) -> int:
+        """Size of stream."""
+        return self.size
+
+    def readable(self) -> bool:
+        """Stream is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Stream is seekable."""
+        return True
+
+    def tell(self) -> int:
+        """Get current position of stream."""
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Change the position of stream."""
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self.position = offset
+        return self.position
+
+    def read(self, size: int = -1) -> bytes:
+        """Read size bytes(all remaining by default) from current position."""
+        raise NotImplementedError
+
+    def readinto(self, buffer) -> int:
+        """Read bytes into pre-allocated buffer."""
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def readall(self) -> bytes:
+        """Read all remaining bytes."""
+        return self.read()
+
+
+class PayloadHasher:
+    """
+    Checksum state of a payload, data is hashed in order up to hashed bytes.
+
+    Digest is kept once payload is hashed completely and carried over to clones of the payload,
+    so the same data is never hashed twice.
+    """
+
+    def __init__(self, algorithm: str = None, on_read: bool = False):
+        """
+        Initialize payload hasher.
+
+        :param algorithm: Checksum algorithm, default is checksum_algorithm config.
+        :param on_read: Hash payload while it is read.
+        """
+        self.algorithm = algorithm
+        self.on_read = on_read
+        self.file_hash = new_digest(algorithm)
+        self.hashed = 0
+        self.digest = None
+
+    def update(self, offset: int, data) -> None:
+        """Hash data read from offset of payload if it continues the data hashed so far."""
+        if self.digest is None and offset <= self.hashed < offset + len(data):
+            self.file_hash.update(data[self.hashed - offset :])
+            self.hashed = offset + len(data)
+
+    def hexdigest(self, payload) -> str:
+        """Get checksum of payload, data not hashed yet is read by read_range of payload."""
+        if self.digest is None:
+            while self.hashed < payload.size:
+                self.update(self.hashed, payload.read_range(self.hashed, payload.block_size))
+            self.digest = self.file_hash.hexdigest()
+        return self.digest
+
+    def clone(self):
+        """Get new hasher of same algorithm for a clone of payload, digest is kept if known."""
+        hasher = PayloadHasher(self.algorithm, self.on_read)
+        hasher.digest = self.digest
+        return hasher
+
+
+class StreamingPayload(SeekableReader):
+    """
+    Seekable read only random payload of given size served from the process data pool.
+
+    Payload starts with a unique stamp(name, process id, counter), so the server can't dedupe
+    objects, followed by data pool blocks at offsets derived from payload seed. Re-reading the
+    payload after seek(retries, request signing) returns the same bytes and reads are zero-copy
+    memoryview slices of the pool within a block. Checksum is calculated only when asked for:
+    while payload is read for the first time if hash_on_read is set, so it is available once
+    upload is done without reading the data again, else by checksum() on demand. Payload of an
+    object(for_object) is a pure function of global seed, bucket, key, size and version, so it
+    can be regenerated by any process to validate the object.
+    """
+
+    def __init__(self, size: int, seed: int = None, name: str = None, **kwargs):
+        """
+        Initialize streaming payload.
+
+        :param size: Size of payload in bytes.
+        :param seed: Seed of pool offsets, default is random.
+        :param name: Name(e.g. object key) written in the unique stamp at the head of payload.
+        :keyword algorithm: Checksum algorithm, default is checksum_algorithm config.
+        :keyword hash_on_read: Hash payload while it is read, default is False.
+        """
+        super().__init__(size)
+        self.pool = DataPool.get_pool()
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(8), "little")
+        self.block_size = self.pool.block_size
+        self.stamp = self.pool.get_stamp(name)[:size]
+        self.version = 0
+        self.hasher = PayloadHasher(kwargs.get("algorithm"), kwargs.get("hash_on_read", False))
+
+    @property
+    def algorithm(self) -> str:
+        """Checksum algorithm of payload."""
+        return self.hasher.algorithm
+
+    @property
+    def hashed(self) -> int:
+        """Number of bytes from start of payload hashed so far."""
+        return self.hasher.hashed
+
+    @classmethod
+    def for_object(cls, bucket: str, key: str, size: int, version: int = 0, **kwargs):
+        """
+        Get payload of the object, derived from global seed, bucket, key, size and version.
+
+        :param bucket: Name of the bucket.
+        :param key: Name of the object.
+        :param size: Size of the object in bytes.
+        :param version: Version of the object, incremented on every overwrite.
+        :keyword algorithm: Checksum algorithm, default is checksum_algorithm config.
+        :keyword hash_on_read: Hash payload while it is read, default is False.
+        """
+        name = f"{bucket}/{key}:{version}"
+        seed_hash = hashlib.blake2b(
+            f"{S3_CFG.get('seed')}/{name}/{size}".encode(), digest_size=8
+        ).digest()
+        payload = cls(size, int.from_bytes(seed_hash, "little"), **kwargs)
+        payload.stamp = f"{name}\n".encode()[:size]
+        payload.version = version
+        return payload
+
+    def get_block(self, block_num: int) -> memoryview:
+        """Get data of the block as slice of data pool."""
+        block_len = min(self.block_size, self.size - len(self.stamp) - block_num * self.block_size)
+        # Knuth multiplicative hash spreads blocks of payload across the pool.
+        return self.pool.get_slice((self.seed + block_num * 2654435761) % self.pool.size, block_len)
+
+    def read_range(self, offset: int, size: int):
+        """Get size bytes of payload starting from offset without changing the position."""
+        size = max(0, min(size, self.size - offset))
+        chunks = []
+        if offset < len(self.stamp) and size:
+            chunks.append(self.stamp[offset : offset + size])
+            offset += len(chunks[0])
+            size -= len(chunks[0])
+        while size > 0:
+            block_num, block_offset = divmod(offset - len(self.stamp), self.block_size)
+            chunk = self.get_block(block_num)[block_offset : block_offset + size]
+            chunks.append(chunk)
+            offset += len(chunk)
+            size -= len(chunk)
+        if len(chunks) == 1:
+            return chunks[0]
+        return b"".join(chunks)
+
+    def iter_chunks(self):
+        """Iterate over payload data block by block without changing the position."""
+        offset = 0
+        while offset < self.size:
+            chunk = self.read_range(offset, self.block_size)
+            yield chunk
+            offset += len(chunk)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read size bytes(all remaining by default) from current position, zero-copy in a block."""
+        if size is None or size < 0:
+            size = self.size - self.position
+        data = self.read_range(self.position, size)
+        if self.hasher.on_read:
+            self.hasher.update(self.position, data)
+        self.position += len(data)
+        return data
+
+    def checksum(self) -> str:
+        """Get checksum of payload, data not read yet is hashed without moving the position."""
+        return self.hasher.hexdigest(self)
+
+    def matches(self, offset: int, data) -> bool:
+        """Compare data read from offset of object with payload data at same offset."""
+        return self.read_range(offset, len(data)) == data
+
+    def checksum_range(self, offset: int, size: int) -> str:
+        """Get checksum of size bytes of payload starting from offset."""
+        file_hash = new_digest(self.algorithm)
+        end = min(offset + size, self.size)
+        while offset < end:
+            data = self.read_range(offset, min(self.block_size, end - offset))
+            file_hash.update(data)
+            offset += len(data)
+        return file_hash.hexdigest()
+
+    def clone(self):
+        """Get new payload with same data, position is reset and checksum is shared if known."""
+        payload = StreamingPayload(self.size, self.seed)
+        payload.stamp = self.stamp
+        payload.version = self.version
+        payload.hasher = self.hasher.clone()
+        return payload
+
+    def get_part(self, offset: int, size: int):
+        """Get view of size bytes of payload from offset, used as body of multipart part."""
+        return PayloadPart(self, offset, size)
+
+    def to_file(self, file_path: str) -> str:
+        """Write payload to file, used when on-disk file is required."""
+        with open(file_path, "wb") as f_out:
+            for chunk in self.iter_chunks():
+                f_out.write(chunk)
+        return file_path
+
+
+class PayloadPart(SeekableReader):
+    """
+    Seekable read only view of a byte range of payload, used as body of a multipart part.
+
+    Data is served by read_range of the payload without moving its position, so all parts of a
+    payload can be uploaded concurrently.
+    """
+
+    def __init__(self, payload: StreamingPayload, offset: int, size: int):
+        """
+        Initialize payload part.
+
+        :param payload: Payload of whole object.
+        :param offset: Start of part in payload.
+        :param size: Size of part in bytes, trimmed at end of payload.
+        """
+        super().__init__(max(0, min(size, payload.size - offset)))
+        self.payload = payload
+        self.offset = offset
+
+    def read(self, size: int = -1) -> bytes:
+        """Read size bytes(all remaining by default) from current position of part."""
+        if size is None or size < 0:
+            size = self.size - self.position
+        size = max(0, min(size, self.size - self.position))
+        data = self.payload.read_range(self.offset + self.position, size)
+        self.position += len(data)
+        return data
@@ -0,0 +1,237 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Hashing service to calculate digests off the event loop."""
+
+import asyncio
+import hashlib
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from config import S3_CFG
+from src.commons import constants as const
+
+LOGGER = logging.getLogger(const.ROOT)
+
+try:
+    import crc32c
+except ImportError:
+    crc32c = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+class Crc32cHash:
+    """CRC32C digest with hashlib like update/hexdigest interface."""
+
+    name = const.CRC32C
+
+    def __init__(self):
+        """Initialize crc32c digest."""
+        self.value = 0
+
+    def update(self, data) -> None:
+        """Update the crc with data."""
+        self.value = crc32c.crc32c(data, self.value)
+
+    def hexdigest(self) -> str:
+        """Get the crc as hex string."""
+        return f"{self.value:08x}"
+
+
+@lru_cache(maxsize=None)
+def get_checksum_algorithm(algorithm: str = None) -> str:
+    """
+    Get supported checksum algorithm, default is checksum_algorithm config.
+
+    Algorithm whose optional module(crc32c, xxhash) is not installed falls back to sha256, it is
+    resolved once per process so the warning is logged only once.
+    """
+    algorithm = (algorithm or S3_CFG.checksum_algorithm).lower()
+    if algorithm not in const.CHECKSUM_ALGORITHMS:
+        raise AssertionError(
+            f"Unsupported checksum algorithm: {algorithm}, supported: {const.CHECKSUM_ALGORITHMS}"
+        )
+    if (algorithm == const.CRC32C and crc32c is None) or (
+        algorithm == const.XXH3 and xxhash is None
+    ):
+        LOGGER.warning("Module for %s is not installed, using sha256.", algorithm)
+        return const.SHA256
+    return algorithm
+
+
+def new_digest(algorithm: str = None):
+    """
+    Get new digest object(update/hexdigest) of checksum algorithm.
+
+    etag uses MD5, which is the ETag of single part objects.
+    :param algorithm: sha256, md5, etag, crc32c or xxh3, default is checksum_algorithm config.
+    """
+    algorithm = get_checksum_algorithm(algorithm)
+    if algorithm == const.CRC32C:
+        return Crc32cHash()
+    if algorithm == const.XXH3:
+        return xxhash.xxh3_128()
+    if algorithm in (const.MD5, const.ETAG):
+        return hashlib.md5()  # nosec
+    return hashlib.sha256()
+
+
+def hash_file(
+    file_path: str, offset: int = 0, size: int = None, chunk_size: int = 0, algorithm: str = None
+) -> str:
+    """
+    Calculate checksum of size bytes(till end by default) of file starting from offset.
+
+    Module level function so that it can be run in process pool as well.
+    """
+    chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
+    size = os.path.getsize(file_path) - offset if size is None else size
+    file_hash = new_digest(algorithm)
+    with open(file_path, "rb") as f_obj:
+        f_obj.seek(offset)
+        while size > 0:
+            chunk = f_obj.read(min(chunk_size, size))
+            if not chunk:
+                break
+            file_hash.update(chunk)
+            size -= len(chunk)
+    return file_hash.hexdigest()
+
+
+class HashingService:
+    """
+    Process wide executors used for hashing.
+
+    Streamed data is hashed in thread pool as hashlib releases the GIL while hashing large
+    buffers. Hash state can't be shared across processes, so process pool(hash_executor: process)
+    is used only for local file checksums where whole file is hashed by one worker.
+    """
+
+    thread_executor = None
+    process_executor = None
+
+    @classmethod
+    def get_thread_executor(cls) -> ThreadPoolExecutor:
+        """Get thread pool used to hash streamed chunks."""
+        if cls.thread_executor is None:
+            cls.thread_executor = ThreadPoolExecutor(
+                max_workers=S3_CFG.hash_workers, thread_name_prefix="corio-hash"
+            )
+        return cls.thread_executor
+
+    @classmethod
+    def get_file_executor(cls):
+        """Get executor used to hash local files as per hash_executor config."""
+        if S3_CFG.hash_executor == "process":
+            if cls.process_executor is None:
+                cls.process_executor = ProcessPoolExecutor(max_workers=S3_CFG.hash_workers)
+            return cls.process_executor
+        return cls.get_thread_executor()
+
+    @classmethod
+    async def checksum_file(
+        cls, file_path: str, offset: int = 0, size: int = None, algorithm: str = None
+    ) -> str:
+        """Calculate checksum of file(or its part) in executor without blocking event loop."""
+        return await asyncio.get_running_loop().run_in_executor(
+            cls.get_file_executor(),
+            hash_file,
+            file_path,
+            offset,
+            size,
+            0,
+            get_checksum_algorithm(algorithm),
+        )
+
+
+class AsyncHasher:
+    """
+    Hash chunks of a stream in hashing thread pool in order, with bounded queue depth.
+
+    Chunks are queued and hashed by one job at a time, so order of chunks is kept while reading
+    next chunks from network overlaps with hashing. Caller waits in update once queue depth is
+    reached, so memory held per stream stays bounded.
+    """
+
+    # Chunks smaller than this are hashed on event loop, offloading costs more than hashing.
+    inline_size = 64 * const.KIB
+
+    def __init__(self, algorithm: str = None, max_pending: int = 0):
+        """
+        Initialize async hasher.
+
+        :param algorithm: Checksum algorithm, default is checksum_algorithm config.
+        :param max_pending: Max chunks queued for hashing, default is hash_queue_depth config.
+        """
+        self.file_hash = new_digest(algorithm)
+        self.max_pending = max_pending if max_pending else S3_CFG.hash_queue_depth
+        self.pending = []
+        self.job = None
+
+    def hash_chunks(self, chunks: list) -> None:
+        """Hash queued chunks in order, runs in executor."""
+        for chunk in chunks:
+            self.file_hash.update(chunk)
+
+    def start_job(self) -> None:
+        """Start hashing of queued chunks in executor if no job is running."""
+        if self.job is None and self.pending:
+            chunks, self.pending = self.pending, []
+            self.job = asyncio.get_running_loop().run_in_executor(
+                HashingService.get_thread_executor(), self.hash_chunks, chunks
+            )
+            self.job.add_done_callback(self.job_done)
+
+    def job_done(self, job) -> None:
+        """Start next job once current job is done."""
+        if self.job is job:
+            self.job = None
+            self.start_job()
+
+    async def wait_job(self) -> None:
+        """Wait for running job to complete, raise the error of job if any."""
+        job = self.job
+        await asyncio.shield(job)
+        self.job_done(job)
+
+    async def update(self, chunk) -> None:
+        """Queue chunk for hashing, wait while queue is full."""
+        if self.job is None and not self.pending and len(chunk) < self.inline_size:
+            self.file_hash.update(chunk)
+            return
+        self.pending.append(chunk)
+        self.start_job()
+        while self.job is not None and len(self.pending) >= self.max_pending:
+            await self.wait_job()
+
+    async def hexdigest(self) -> str:
+        """Wait till all queued chunks are hashed and get the hex digest."""
+        self.start_job()
+        while self.job is not None:
+            await self.wait_job()
+        return self.file_hash.hexdigest()
@@ -25,15 +25,19 @@ import glob
 import logging
 import math
 import os
+import random
 import re
 import shutil
 import time
+from asyncio import sleep as async_sleep
 from base64 import b64encode
 from datetime import datetime
 from subprocess import Popen, PIPE, CalledProcessError
 from typing import Union
 
 import psutil as ps
+from botocore.exceptions import ClientError
+from botocore.exceptions import ParamValidationError
 
 from config import CLUSTER_CFG
 from config import CORIO_CFG
@@ -45,6 +49,9 @@ LOGGER = logging.getLogger(const.ROOT)
 
 EXEC_STATUS = {}
 
+# Separate random generator for retry jitter to keep seeded workload randomness untouched.
+JITTER = random.Random()
+
 
 def log_cleanup() -> None:
     """
@@ -362,14 +369,59 @@ def get_test_file_path(test_id: str) -> str:
     return fpath
 
 
+def get_retry_policy(error: Exception) -> str:
+    """
+    Get the retry policy for given error.
+
+    throttle: Server asked to slow down(SlowDown, 429, 503), retry with larger backoff.
+    retry: Server side(5xx) failure, connection reset/timeout or any other failure, retry.
+    fail: Client side(4xx) or parameter validation failure, fail fast without retry.
+    :param error: Exception raised by the function.
+    """
+    if isinstance(error, ClientError):
+        error_code = error.response.get("Error", {}).get("Code")
+        status_code = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        if error_code in const.THROTTLE_ERROR_CODES or status_code in (429, 503):
+            return const.RETRY_THROTTLE
+        if not status_code or status_code >= 500:
+            return const.RETRY
+        return const.RETRY_FAIL
+    if isinstance(error, ParamValidationError):
+        return const.RETRY_FAIL
+    return const.RETRY
+
+
+def get_backoff_delay(attempt: int, retry_delay: float, max_delay: float, policy: str) -> float:
+    """
+    Get capped exponential backoff delay with jitter for retry attempt.
+
+    :param attempt: Number of the failed attempt starting from 1.
+    :param retry_delay: Base delay between two retries.
+    :param max_delay: Maximum delay between two retries.
+    :param policy: Retry policy of the failure.
+    """
+    base_delay = retry_delay * 2 if policy == const.RETRY_THROTTLE else retry_delay
+    delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+    # Equal jitter: keep half of the delay and randomize the other half.
+    return delay / 2 + JITTER.uniform(0, delay / 2)
+
+
 # pylint: disable=broad-except
-def retries(asyncio=True, max_retry=S3_CFG.s3max_retry, retry_delay=S3_CFG.retry_delay):
+def retries(
+    asyncio=True,
+    max_retry=S3_CFG.s3max_retry,
+    retry_delay=S3_CFG.retry_delay,
+    max_delay=S3_CFG.retry_max_delay,
+):
     """
-    Retry/polling in case all types of failures.
+    Retry/polling in case of retryable failures with capped exponential backoff and jitter.
 
+    Throttling, server side(5xx) and connection failures are retried, client side(4xx) failures
+    fail fast. Asyncio wrapper waits using asyncio sleep so other tasks of event loop keep running.
     :param asyncio: True if wrapper used for asyncio else for normal function.
     :param max_retry: Max number of times retires on failure.
-    :param retry_delay: Delay between two retries.
+    :param retry_delay: Base delay between two retries.
+    :param max_delay: Max delay between two retries.
     """
 
     def outer_wrapper(func):
@@ -378,33 +430,39 @@ def retries(asyncio=True, max_retry=S3_CFG.s3max_retry, retry_delay=S3_CFG.retry
 
             async def inner_wrapper(*args, **kwargs):
                 """Inner wrapper method."""
-                for i in reversed(range(max_retry + 1)):
+                attempt = 1
+                while True:
                     try:
                         return await func(*args, **kwargs)
                     except Exception as err:
                         LOGGER.info("AsyncIO Function name: %s", func.__name__)
                         LOGGER.error(err, exc_info=True)
-                        if i <= 1:
+                        policy = get_retry_policy(err)
+                        if policy == const.RETRY_FAIL or attempt >= max_retry:
                             raise err
-                    # Delay between each retry in seconds.
-                    time.sleep(retry_delay)
-                return await func(*args, **kwargs)
+                        # Delay between each retry in seconds.
+                        await async_sleep(
+                            get_backoff_delay(attempt, retry_delay, max_delay, policy)
+                        )
+                    attempt += 1
 
         else:
 
             def inner_wrapper(*args, **kwargs):
                 """Inner wrapper method."""
-                for j in reversed(range(max_retry + 1)):
+                attempt = 1
+                while True:
                     try:
                         return func(*args, **kwargs)
                     except Exception as err:
                         LOGGER.info("Function name: %s", func.__name__)
                         LOGGER.error(err, exc_info=True)
-                        if j <= 1:
+                        policy = get_retry_policy(err)
+                        if policy == const.RETRY_FAIL or attempt >= max_retry:
                             raise err
-                    # Delay between each retry in seconds.
-                    time.sleep(retry_delay)
-                return func(*args, **kwargs)
+                        # Delay between each retry in seconds.
+                        time.sleep(get_backoff_delay(attempt, retry_delay, max_delay, policy))
+                    attempt += 1
 
         return inner_wrapper
 
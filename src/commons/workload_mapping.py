@@ -100,6 +100,10 @@ SCRIPT_MAPPING = {
         mix_object_crud_operations.TestTypeXObjectOps,
         "execute_mix_object_workload",
     ],
+    "mixed_object_ops": [
+        mix_object_crud_operations.TestTypeXObjectOps,
+        "execute_mixed_op_workload",
+    ],
     "type3_write_once_read_iterations": [
         mix_object_crud_operations.TestTypeXObjectOps,
         "execute_mix_object_workload",
@@ -52,9 +52,10 @@ def apply_master_config(workload: dict, master_cfg: dict) -> dict:
         operation = config["operation"]
         required_params = list(master_cfg[tool][operation].keys()) + required
         LOGGER.debug("Required params are %s", required_params)
+        optional_params = master_cfg.get("optional", [])
         # Check for unknown parameters
         for param in existing_params:
-            if param not in required_params:
+            if param not in required_params and param not in optional_params:
                 raise AssertionError(f"Wrong parameter {param} in {test} test.")
         to_be_added = required_params - existing_params
         # Add missing parameters from master config file
@@ -20,14 +20,118 @@
 #
 
 """Python Library to perform bucket operations using aiobotocore module."""
+import asyncio
 import random
 import string
+import os
 import time
+from collections import deque
+from itertools import islice
 
+from config import S3_CFG
 from src.commons.utils.utility import retries
 from src.libs.s3api.client import S3Client
 
 
+class KeyRange:
+    """Range of keys under prefix after start_after key till end key(exclusive, None for all)."""
+
+    __slots__ = ("prefix", "start_after", "end", "position")
+
+    def __init__(self, prefix: str, start_after: str = "", end: str = None):
+        """Initialize key range."""
+        self.prefix = prefix
+        self.start_after = start_after
+        self.end = end
+        # Position of the character keys listed so far differ at.
+        self.position = None
+
+    def listed(self, first_key: str, last_key: str) -> None:
+        """Move start of the range past listed page of keys."""
+        self.start_after = last_key
+        self.position = min(len(os.path.commonprefix([first_key, last_key])), len(last_key) - 1)
+
+    def split(self):
+        """
+        Split rest of the range after a page is listed and get the upper part, None if it can't.
+
+        Range is split in the middle of the first differing character of last listed key and
+        end key if they are apart, else right after last listed key by incrementing its
+        character at the position listed keys differ at, as the next keys are likely to differ
+        there as well. Keys up to split key(inclusive) are kept in this range.
+        """
+        split_key = None if self.position is None else self.get_split_key()
+        if split_key is None:
+            return None
+        upper = KeyRange(self.prefix, split_key, self.end)
+        # Smallest key after split key, so split key itself stays in this range.
+        self.end = split_key + "\x00"
+        # Range is split again only after its next page is listed.
+        self.position = None
+        return upper
+
+    def get_split_key(self):
+        """Get the key rest of the range is split at, None if it can't be split."""
+        lower, position = self.start_after, self.position
+        if self.end is not None:
+            index = len(os.path.commonprefix([lower, self.end]))
+            low = ord(lower[index]) if index < len(lower) else 0
+            if ord(self.end[index]) - low > 1:
+                return lower[:index] + chr((low + ord(self.end[index])) // 2)
+            position = max(position, index + 1)
+        if position >= len(lower) or ord(lower[position]) >= 0xD7FF:
+            return None
+        return lower[:position] + chr(ord(lower[position]) + 1)
+
+
+class KeySpace:
+    """
+    Key ranges of keyspace being listed by parallel listing and queue of their listed pages.
+
+    Idle worker takes a pending range, or splits a range being listed, so listing of a flat
+    keyspace is spread across workers as well.
+    """
+
+    def __init__(self, prefixes: list, concurrency: int, page_size: int):
+        """
+        Initialize keyspace.
+
+        :param prefixes: Prefixes listed as separate ranges.
+        :param concurrency: Max ranges listed at a time.
+        :param page_size: Max entries per page.
+        """
+        self.pending = deque(KeyRange(prefix) for prefix in prefixes)
+        self.active = []
+        self.ranges = len(self.pending)
+        self.page_size = page_size
+        self.changed = asyncio.Condition()
+        self.queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def next_range(self):
+        """Get pending range or split one being listed, None once all ranges are listed."""
+        async with self.changed:
+            while True:
+                key_range = self.pending.popleft() if self.pending else None
+                for listing in self.active if key_range is None else []:
+                    key_range = listing.split()
+                    if key_range:
+                        self.ranges += 1
+                        break
+                if key_range:
+                    self.active.append(key_range)
+                    return key_range
+                if not self.active:
+                    return None
+                await self.changed.wait()
+
+    async def page_listed(self, key_range: KeyRange, done: bool) -> None:
+        """Wake up idle workers once a page of range is listed, drop the range if it is done."""
+        async with self.changed:
+            if done:
+                self.active.remove(key_range)
+            self.changed.notify_all()
+
+
 class S3Bucket(S3Client):
     """Class for bucket operations."""
 
@@ -104,26 +208,275 @@ class S3Bucket(S3Client):
         :param force: Value for delete bucket with object or without object.
         :return: Response of delete bucket.
         """
-        async with self.get_client() as client:
-            if force:
-                self.log.info(
-                    "This might cause data loss as you have opted for bucket deletion"
-                    " with objects in it"
+        if force:
+            self.log.info(
+                "This might cause data loss as you have opted for bucket deletion"
+                " with objects in it"
+            )
+            errors = await self.delete_keys(
+                bucket_name, self.iter_keys(bucket_name, parallel=True)
+            )
+            if errors:
+                raise AssertionError(
+                    f"Failed to delete {len(errors)} objects of {bucket_name}: {errors[:10]}"
                 )
-                # list s3 objects using paginator
-                paginator = client.get_paginator("list_objects")
-                async for result in paginator.paginate(Bucket=bucket_name):
-                    for content in result.get("Contents", []):
-                        self.s3_url = f"s3://{bucket_name}/{content['Key']}"
-                        resp = await client.delete_object(Bucket=bucket_name, Key=content["Key"])
-                        self.log.debug(resp)
-                self.log.info("All objects deleted successfully.")
+            self.log.info("All objects deleted successfully.")
+        async with self.get_client() as client:
             self.s3_url = f"s3://{bucket_name}"
             response = await client.delete_bucket(Bucket=bucket_name)
             self.log.info("Bucket '%s' deleted successfully. Response: %s", bucket_name, response)
 
         return response
 
+    @retries()
+    async def list_objects_page(self, bucket_name: str, **kwargs) -> dict:
+        """
+        List single page of objects using list_objects_v2.
+
+        :param bucket_name: Name of the bucket.
+        :keyword kwargs: Prefix, Delimiter, StartAfter, MaxKeys, ContinuationToken etc.
+        :return: Response of list objects v2.
+        """
+        async with self.get_client() as client:
+            self.s3_url = f"s3://{bucket_name}/{kwargs.get('Prefix', '')}"
+            return await client.list_objects_v2(Bucket=bucket_name, **kwargs)
+
+    async def iter_objects(self, bucket_name: str, prefix: str = "", **kwargs):
+        """
+        Iterate over objects of the bucket page by page using list_objects_v2.
+
+        Objects are yielded as Contents entries(Key, Size, ETag etc.) and common prefixes, if
+        delimiter is given, as CommonPrefixes entries(Prefix). Client is released before entries
+        of a page are yielded, so consumer can make requests(e.g. delete them) while listing.
+        Latency of every page is logged at debug and summary of listing at info level.
+        :param bucket_name: Name of the bucket.
+        :param prefix: List objects starting with prefix only.
+        :keyword delimiter: Group keys having delimiter after prefix into common prefixes.
+        :keyword start_after: List objects after this key.
+        :keyword max_keys: Max entries to list, default is all.
+        :keyword page_size: Max entries per page, default is 1000.
+        """
+        max_keys = kwargs.get("max_keys")
+        page_size = kwargs.get("page_size", 1000)
+        params = {"Prefix": prefix}
+        if kwargs.get("delimiter"):
+            params["Delimiter"] = kwargs["delimiter"]
+        if kwargs.get("start_after"):
+            params["StartAfter"] = kwargs["start_after"]
+        pages, listed, total_time = 0, 0, 0.0
+        while max_keys is None or listed < max_keys:
+            params["MaxKeys"] = page_size if max_keys is None else min(page_size, max_keys - listed)
+            start_time = time.perf_counter()
+            response = await self.list_objects_page(bucket_name, **params)
+            page_time = time.perf_counter() - start_time
+            entries = response.get("Contents", []) + response.get("CommonPrefixes", [])
+            pages += 1
+            total_time += page_time
+            self.log.debug(
+                "list_objects s3://%s/%s page %s: %s entries in %.3f seconds",
+                bucket_name,
+                prefix,
+                pages,
+                len(entries),
+                page_time,
+            )
+            for entry in entries[: None if max_keys is None else max_keys - listed]:
+                listed += 1
+                yield entry
+            if not response.get("IsTruncated"):
+                break
+            params["ContinuationToken"] = response["NextContinuationToken"]
+        self.log.info(
+            "list_objects s3://%s/%s: %s entries in %s pages, %.3f seconds(%.3f per page)",
+            bucket_name,
+            prefix,
+            listed,
+            pages,
+            total_time,
+            total_time / pages if pages else 0,
+        )
+
+    async def iter_objects_parallel(self, bucket_name: str, prefix: str = "", **kwargs):
+        """
+        Iterate over objects of the bucket listing key ranges of keyspace concurrently.
+
+        Listing starts with keyspace under prefix(or each of given prefixes) as a range. Once a
+        worker is idle, remaining part of a range being listed is split at a key after its last
+        listed key(see KeyRange.split) and listed by the idle worker with StartAfter, so flat
+        keyspaces are listed in parallel as well. Entries are merged as a stream in order of
+        arrival, not in key order. Listing throughput is logged at info level.
+        :param bucket_name: Name of the bucket.
+        :param prefix: List objects starting with prefix only, ignored if prefixes are given.
+        :keyword prefixes: List of prefixes listed as separate ranges.
+        :keyword concurrency: Max ranges listed at a time, default is list_concurrency.
+        :keyword page_size: Max entries per page, default is 1000.
+        """
+        concurrency = kwargs.get("concurrency", S3_CFG.list_concurrency)
+        keyspace = KeySpace(
+            kwargs.get("prefixes") or [prefix], concurrency, kwargs.get("page_size", 1000)
+        )
+        start_time = time.perf_counter()
+        listed = 0
+
+        async def list_ranges():
+            """List ranges one by one, queue None(or error) once done."""
+            try:
+                key_range = await keyspace.next_range()
+                while key_range:
+                    await self.list_key_range(bucket_name, keyspace, key_range)
+                    key_range = await keyspace.next_range()
+            except Exception as error:  # pylint: disable=broad-except
+                await keyspace.queue.put(error)
+                return
+            await keyspace.queue.put(None)
+
+        workers = [asyncio.ensure_future(list_ranges()) for _ in range(concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                entries = await keyspace.queue.get()
+                if entries is None:
+                    running -= 1
+                    continue
+                if isinstance(entries, Exception):
+                    raise entries
+                listed += len(entries)
+                for entry in entries:
+                    yield entry
+        finally:
+            for worker in workers:
+                worker.cancel()
+        total_time = time.perf_counter() - start_time
+        self.log.info(
+            "list_objects s3://%s/%s: %s entries of %s ranges in %.3f seconds(%.1f per second)",
+            bucket_name,
+            prefix,
+            listed,
+            keyspace.ranges,
+            total_time,
+            listed / total_time if total_time else 0,
+        )
+
+    async def list_key_range(self, bucket_name: str, keyspace: KeySpace, key_range: KeyRange):
+        """
+        List the key range page by page till its end and queue entries of every page.
+
+        :param bucket_name: Name of the bucket.
+        :param keyspace: Keyspace being listed, pages are put in its queue.
+        :param key_range: Key range to be listed.
+        """
+        params = {"Prefix": key_range.prefix, "MaxKeys": keyspace.page_size}
+        if key_range.start_after:
+            params["StartAfter"] = key_range.start_after
+        while True:
+            response = await self.list_objects_page(bucket_name, **params)
+            entries = response.get("Contents", [])
+            if key_range.end is not None:
+                # End of range is moved down by split while page is being listed.
+                entries = [entry for entry in entries if entry["Key"] < key_range.end]
+            if entries:
+                key_range.listed(entries[0]["Key"], entries[-1]["Key"])
+                await keyspace.queue.put(entries)
+            done = not response.get("IsTruncated") or len(entries) < len(
+                response.get("Contents", [])
+            )
+            await keyspace.page_listed(key_range, done)
+            if done:
+                return
+            params.pop("StartAfter", None)
+            params["ContinuationToken"] = response["NextContinuationToken"]
+
+    async def iter_keys(self, bucket_name: str, prefix: str = "", **kwargs):
+        """
+        Iterate over keys of the bucket, see iter_objects(iter_objects_parallel) for keywords.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: List keys starting with prefix only.
+        :keyword parallel: List shards of keyspace concurrently using iter_objects_parallel.
+        """
+        if kwargs.pop("parallel", False):
+            entries = self.iter_objects_parallel(bucket_name, prefix, **kwargs)
+        else:
+            entries = self.iter_objects(bucket_name, prefix, **kwargs)
+        async for entry in entries:
+            if "Key" in entry:
+                yield entry["Key"]
+
+    async def delete_keys(self, bucket_name: str, keys, **kwargs) -> list:
+        """
+        Delete keys using delete_objects batches, multiple batches are in flight at a time.
+
+        Keys are consumed as batches are submitted, so keys streamed from listing are never held
+        in memory beyond batches in flight.
+        :param bucket_name: Name of the bucket.
+        :param keys: Iterable or async iterable of keys.
+        :keyword batch_size: Keys per delete_objects request, default is delete_batch_size.
+        :keyword concurrency: Max batches in flight, default is delete_concurrency.
+        :return: Errors(Key, Code, Message) of keys failed to delete.
+        """
+        batch_size = min(kwargs.get("batch_size", S3_CFG.delete_batch_size), 1000)
+        concurrency = kwargs.get("concurrency", S3_CFG.delete_concurrency)
+        errors, pending = [], set()
+        try:
+            async for batch in self.iter_batches(keys, batch_size):
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        errors.extend(task.result())
+                pending.add(asyncio.ensure_future(self.delete_keys_batch(bucket_name, batch)))
+            for task in asyncio.as_completed(pending):
+                errors.extend(await task)
+        finally:
+            for task in pending:
+                task.cancel()
+        return errors
+
+    @retries()
+    async def delete_keys_batch(self, bucket_name: str, keys: list) -> list:
+        """
+        Delete up to 1000 keys using single delete_objects request in quiet mode.
+
+        :param bucket_name: Name of the bucket.
+        :param keys: List of keys.
+        :return: Errors(Key, Code, Message) of keys failed to delete.
+        """
+        async with self.get_client() as client:
+            self.s3_url = f"s3://{bucket_name}"
+            response = await client.delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+        errors = response.get("Errors", [])
+        for error in errors:
+            self.log.error(
+                "Failed to delete s3://%s/%s: %s %s",
+                bucket_name,
+                error.get("Key"),
+                error.get("Code"),
+                error.get("Message"),
+            )
+        self.log.debug("Deleted %s keys from %s.", len(keys) - len(errors), bucket_name)
+        return errors
+
+    @staticmethod
+    async def iter_batches(items, batch_size: int):
+        """Iterate over lists of batch size items of iterable or async iterable."""
+        if not hasattr(items, "__aiter__"):
+            items = iter(items)
+            batch = list(islice(items, batch_size))
+            while batch:
+                yield batch
+                batch = list(islice(items, batch_size))
+            return
+        batch = []
+        async for item in items:
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     @retries()
     async def create_n_buckets(self, bucket_prefix: str, bucket_count: int) -> list:
         """
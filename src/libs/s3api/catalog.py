@@ -0,0 +1,460 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+
+"""Compact in-memory catalog of objects written by workloads."""
+
+import json
+import os
+import random
+import sqlite3
+from itertools import count
+
+
+# pylint: disable=too-few-public-methods, too-many-instance-attributes
+class ObjectRecord:
+    """Details of an object in catalog, checksum is kept as fixed width digest bytes."""
+
+    __slots__ = (
+        "key_id",
+        "bucket_id",
+        "key",
+        "size",
+        "digest",
+        "etag",
+        "version",
+        "bucket_pos",
+        "index",
+        "index_pos",
+    )
+
+    def __init__(self, key_id: int, bucket_id: int, key: str, size: int, **kwargs):
+        """
+        Initialize object record.
+
+        :param key_id: Unique id of the object in catalog.
+        :param bucket_id: Interned id of the bucket.
+        :param key: Name of the object.
+        :param size: Size of the object in bytes.
+        :keyword checksum: Hex checksum of the object.
+        :keyword etag: ETag of the object.
+        :keyword version: Version of the object, incremented on every overwrite.
+        """
+        self.key_id = key_id
+        self.bucket_id = bucket_id
+        self.key = key
+        self.size = size
+        self.digest = bytes.fromhex(kwargs["checksum"]) if kwargs.get("checksum") else b""
+        self.etag = kwargs.get("etag")
+        self.version = kwargs.get("version", 0)
+        self.bucket_pos = -1
+        self.index = None
+        self.index_pos = -1
+
+    @property
+    def checksum(self) -> str:
+        """Hex checksum of the object."""
+        return self.digest.hex()
+
+
+class ObjectCatalog:
+    """
+    Catalog of objects indexed by bucket and by (bucket, size, prefix).
+
+    Records of a bucket and of every (bucket, size, prefix) are kept in lists, so positional and
+    random access is O(1). Record knows its position in both lists and delete swaps the last
+    record of the list into its place, so delete is O(1) as well. Bucket names are interned as
+    integer ids and keys get integer ids, so a record holds no repeated strings but its key.
+    """
+
+    def __init__(self):
+        """Initialize empty catalog."""
+        self.bucket_ids = {}
+        self.bucket_names = {}
+        self.objects = {}
+        self.buckets = {}
+        self.indexes = {}
+        self.key_ids = count(1)
+        self.bucket_id_itr = count(1)
+
+    def get_buckets(self) -> list:
+        """Get names of buckets in catalog."""
+        return list(self.bucket_ids)
+
+    def add_bucket(self, bucket: str) -> int:
+        """Add bucket to catalog if not added already and get its id."""
+        if bucket not in self.bucket_ids:
+            bucket_id = next(self.bucket_id_itr)
+            self.bucket_ids[bucket] = bucket_id
+            self.bucket_names[bucket_id] = bucket
+            self.buckets[bucket_id] = []
+        return self.bucket_ids[bucket]
+
+    def remove_bucket(self, bucket: str) -> None:
+        """Remove bucket and all of its objects from catalog."""
+        bucket_id = self.bucket_ids.pop(bucket, None)
+        if bucket_id is None:
+            return
+        del self.bucket_names[bucket_id]
+        for record in self.buckets.pop(bucket_id):
+            del self.objects[(bucket_id, record.key)]
+        for index_key in [index_key for index_key in self.indexes if index_key[0] == bucket_id]:
+            del self.indexes[index_key]
+
+    def add(self, bucket: str, key: str, size: int, prefix: str = "", **kwargs) -> ObjectRecord:
+        """
+        Add object to catalog, existing object of same key is replaced.
+
+        :param bucket: Name of the bucket.
+        :param key: Name of the object.
+        :param size: Size of the object in bytes.
+        :param prefix: Prefix of the object used for (bucket, size, prefix) index.
+        :keyword checksum: Hex checksum of the object.
+        :keyword etag: ETag of the object.
+        :keyword version: Version of the object, incremented on every overwrite.
+        :return: Record of the object.
+        """
+        bucket_id = self.add_bucket(bucket)
+        self.remove(bucket, key)
+        record = ObjectRecord(next(self.key_ids), bucket_id, key, size, **kwargs)
+        records = self.buckets[bucket_id]
+        record.bucket_pos = len(records)
+        records.append(record)
+        index = self.indexes.setdefault((bucket_id, size, prefix), [])
+        record.index = index
+        record.index_pos = len(index)
+        index.append(record)
+        self.objects[(bucket_id, key)] = record
+        return record
+
+    def add_record(self, record: dict, prefix: str = "") -> ObjectRecord:
+        """Add object record(s3url, key_size, key_checksum, bucket, key, etag, version)."""
+        return self.add(
+            record["bucket"],
+            record["key"],
+            record["key_size"],
+            prefix,
+            checksum=record.get("key_checksum"),
+            etag=record.get("etag"),
+            version=record.get("version", 0),
+        )
+
+    def get(self, bucket: str, key: str) -> ObjectRecord:
+        """Get record of the object, None if not in catalog."""
+        return self.objects.get((self.bucket_ids.get(bucket), key))
+
+    def remove(self, bucket: str, key: str) -> ObjectRecord:
+        """Remove object from catalog and get its record, None if not in catalog."""
+        record = self.objects.pop((self.bucket_ids.get(bucket), key), None)
+        if record is not None:
+            self.swap_remove(self.buckets[record.bucket_id], record, "bucket_pos")
+            self.swap_remove(record.index, record, "index_pos")
+            record.index = None
+        return record
+
+    @staticmethod
+    def swap_remove(records: list, record: ObjectRecord, position: str) -> None:
+        """Remove record from list by moving the last record of list into its position."""
+        pos = getattr(record, position)
+        last = records.pop()
+        if last is not record:
+            records[pos] = last
+            setattr(last, position, pos)
+        setattr(record, position, -1)
+
+    def get_records(self, bucket: str, size: int = None, prefix: str = None) -> list:
+        """
+        Get list of records of bucket, or of (bucket, size, prefix) if size is given.
+
+        List is owned by catalog, it must not be modified and changes on add/remove.
+        """
+        bucket_id = self.bucket_ids.get(bucket)
+        if size is None:
+            return self.buckets.get(bucket_id, [])
+        return self.indexes.get((bucket_id, size, prefix or ""), [])
+
+    def count(self, bucket: str, size: int = None, prefix: str = None) -> int:
+        """Number of objects in bucket, or in (bucket, size, prefix) if size is given."""
+        return len(self.get_records(bucket, size, prefix))
+
+    def at(self, bucket: str, position: int, size: int = None, prefix: str = None) -> ObjectRecord:
+        """Get record at position of bucket, or of (bucket, size, prefix) if size is given."""
+        return self.get_records(bucket, size, prefix)[position]
+
+    def choice(self, bucket: str, size: int = None, prefix: str = None) -> ObjectRecord:
+        """Get random record of bucket, or of (bucket, size, prefix) if size is given."""
+        return random.choice(self.get_records(bucket, size, prefix))  # nosec
+
+    def total_size(self) -> int:
+        """Total size of objects in catalog."""
+        return sum(record.size for record in self.objects.values())
+
+    def commit(self) -> None:
+        """Nothing to commit for in-memory catalog, kept for interface of on-disk catalog."""
+
+    def close(self) -> None:
+        """Nothing to close for in-memory catalog, kept for interface of on-disk catalog."""
+
+
+class SQLiteObjectCatalog:
+    """
+    On-disk catalog of objects in SQLite, with same interface as ObjectCatalog.
+
+    Records are kept in database(WAL mode) only, so catalog size is not bound by memory and
+    survives crash/restart of the workload. Records have dense positions per bucket and per
+    (bucket, size, prefix) maintained by swap remove, so positional access is an indexed lookup.
+    Only bucket, index ids and their counts are held in memory. Changes are committed once
+    batch size changes are made or on commit, so crash loses at most a batch of changes.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)",
+        "CREATE TABLE IF NOT EXISTS buckets (bucket_id INTEGER PRIMARY KEY, name TEXT UNIQUE)",
+        "CREATE TABLE IF NOT EXISTS indexes (index_id INTEGER PRIMARY KEY, bucket_id INTEGER,"
+        " size INTEGER, prefix TEXT, UNIQUE(bucket_id, size, prefix))",
+        "CREATE TABLE IF NOT EXISTS objects (key_id INTEGER PRIMARY KEY, bucket_id INTEGER,"
+        " key TEXT, size INTEGER, index_id INTEGER, digest BLOB, etag TEXT, version INTEGER,"
+        " bucket_pos INTEGER, index_pos INTEGER)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS objects_key ON objects(bucket_id, key)",
+        "CREATE INDEX IF NOT EXISTS objects_bucket_pos ON objects(bucket_id, bucket_pos)",
+        "CREATE INDEX IF NOT EXISTS objects_index_pos ON objects(index_id, index_pos)",
+    )
+    COLUMNS = (
+        "key_id, bucket_id, key, size, digest, etag, version, bucket_pos, index_id, index_pos"
+    )
+
+    def __init__(
+        self, db_path: str, resume: bool = False, batch_size: int = 1000, meta: dict = None
+    ):
+        """
+        Open the catalog database.
+
+        :param db_path: Path of database file.
+        :param resume: Load catalog of previous run from database, else start with empty one.
+        :param batch_size: Number of changes committed at a time.
+        :param meta: Settings object data depends on(e.g. seed), stored when database is created.
+            Settings stored by previous run are kept on resume and are available as meta.
+        """
+        if not resume:
+            # Stale WAL of previous database would be replayed into the new one.
+            for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+                if os.path.exists(path):
+                    os.remove(path)
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.changes = 0
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in self.SCHEMA:
+            self.conn.execute(statement)
+        self.meta = {
+            name: json.loads(value)
+            for name, value in self.conn.execute("SELECT name, value FROM meta")
+        }
+        for name, value in (meta or {}).items():
+            if name not in self.meta:
+                self.conn.execute(
+                    "INSERT INTO meta (name, value) VALUES (?, ?)", (name, json.dumps(value))
+                )
+                self.meta[name] = value
+        self.bucket_ids = dict(self.conn.execute("SELECT name, bucket_id FROM buckets"))
+        self.bucket_counts = dict(
+            self.conn.execute("SELECT bucket_id, COUNT(*) FROM objects GROUP BY bucket_id")
+        )
+        self.index_ids = {
+            (bucket_id, size, prefix): index_id
+            for index_id, bucket_id, size, prefix in self.conn.execute(
+                "SELECT index_id, bucket_id, size, prefix FROM indexes"
+            )
+        }
+        self.index_counts = dict(
+            self.conn.execute("SELECT index_id, COUNT(*) FROM objects GROUP BY index_id")
+        )
+        self.conn.commit()
+
+    def record_changed(self) -> None:
+        """Count the change and commit once batch size changes are made."""
+        self.changes += 1
+        if self.changes >= self.batch_size:
+            self.commit()
+
+    def commit(self) -> None:
+        """Commit changes made so far."""
+        self.conn.commit()
+        self.changes = 0
+
+    def close(self) -> None:
+        """Commit changes and close the database."""
+        self.commit()
+        self.conn.close()
+
+    def get_buckets(self) -> list:
+        """Get names of buckets in catalog."""
+        return list(self.bucket_ids)
+
+    def add_bucket(self, bucket: str) -> int:
+        """Add bucket to catalog if not added already and get its id."""
+        if bucket not in self.bucket_ids:
+            cursor = self.conn.execute("INSERT INTO buckets (name) VALUES (?)", (bucket,))
+            self.bucket_ids[bucket] = cursor.lastrowid
+            self.record_changed()
+        return self.bucket_ids[bucket]
+
+    def get_index_id(self, bucket_id: int, size: int, prefix: str) -> int:
+        """Get id of (bucket, size, prefix) index, added if not added already."""
+        index_key = (bucket_id, size, prefix)
+        if index_key not in self.index_ids:
+            cursor = self.conn.execute(
+                "INSERT INTO indexes (bucket_id, size, prefix) VALUES (?, ?, ?)", index_key
+            )
+            self.index_ids[index_key] = cursor.lastrowid
+        return self.index_ids[index_key]
+
+    def remove_bucket(self, bucket: str) -> None:
+        """Remove bucket and all of its objects from catalog."""
+        bucket_id = self.bucket_ids.pop(bucket, None)
+        if bucket_id is None:
+            return
+        self.bucket_counts.pop(bucket_id, None)
+        for index_key in [index_key for index_key in self.index_ids if index_key[0] == bucket_id]:
+            self.index_counts.pop(self.index_ids.pop(index_key), None)
+        for table in ("objects", "indexes", "buckets"):
+            self.conn.execute(f"DELETE FROM {table} WHERE bucket_id = ?", (bucket_id,))  # nosec
+        self.commit()
+
+    def add(self, bucket: str, key: str, size: int, prefix: str = "", **kwargs) -> ObjectRecord:
+        """Add object to catalog, existing object of same key is replaced, see ObjectCatalog."""
+        bucket_id = self.add_bucket(bucket)
+        self.remove(bucket, key)
+        index_id = self.get_index_id(bucket_id, size, prefix)
+        record = ObjectRecord(None, bucket_id, key, size, **kwargs)
+        record.bucket_pos = self.bucket_counts.get(bucket_id, 0)
+        record.index = index_id
+        record.index_pos = self.index_counts.get(index_id, 0)
+        cursor = self.conn.execute(
+            "INSERT INTO objects (bucket_id, key, size, index_id, digest, etag, version,"
+            " bucket_pos, index_pos) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                bucket_id,
+                key,
+                size,
+                index_id,
+                record.digest,
+                record.etag,
+                record.version,
+                record.bucket_pos,
+                record.index_pos,
+            ),
+        )
+        record.key_id = cursor.lastrowid
+        self.bucket_counts[bucket_id] = record.bucket_pos + 1
+        self.index_counts[index_id] = record.index_pos + 1
+        self.record_changed()
+        return record
+
+    def add_record(self, record: dict, prefix: str = "") -> ObjectRecord:
+        """Add object record(s3url, key_size, key_checksum, bucket, key, etag, version)."""
+        return self.add(
+            record["bucket"],
+            record["key"],
+            record["key_size"],
+            prefix,
+            checksum=record.get("key_checksum"),
+            etag=record.get("etag"),
+            version=record.get("version", 0),
+        )
+
+    def to_record(self, row: tuple) -> ObjectRecord:
+        """Get object record of database row, index of record is id of its index."""
+        if row is None:
+            return None
+        key_id, bucket_id, key, size, digest, etag, version, *positions = row
+        record = ObjectRecord(key_id, bucket_id, key, size, etag=etag, version=version)
+        record.digest = digest
+        record.bucket_pos, record.index, record.index_pos = positions
+        return record
+
+    def get(self, bucket: str, key: str) -> ObjectRecord:
+        """Get record of the object, None if not in catalog."""
+        return self.to_record(
+            self.conn.execute(
+                f"SELECT {self.COLUMNS} FROM objects WHERE bucket_id = ? AND key = ?",  # nosec
+                (self.bucket_ids.get(bucket), key),
+            ).fetchone()
+        )
+
+    def remove(self, bucket: str, key: str) -> ObjectRecord:
+        """Remove object from catalog and get its record, None if not in catalog."""
+        record = self.get(bucket, key)
+        if record is None:
+            return None
+        self.conn.execute("DELETE FROM objects WHERE key_id = ?", (record.key_id,))
+        # Move the last record of bucket and of index into position of removed record.
+        for column, group, group_id, counts in (
+            ("bucket_pos", "bucket_id", record.bucket_id, self.bucket_counts),
+            ("index_pos", "index_id", record.index, self.index_counts),
+        ):
+            counts[group_id] -= 1
+            self.conn.execute(
+                f"UPDATE objects SET {column} = ? WHERE {group} = ? AND {column} = ?",  # nosec
+                (getattr(record, column), group_id, counts[group_id]),
+            )
+        self.record_changed()
+        return record
+
+    def count(self, bucket: str, size: int = None, prefix: str = None) -> int:
+        """Number of objects in bucket, or in (bucket, size, prefix) if size is given."""
+        bucket_id = self.bucket_ids.get(bucket)
+        if size is None:
+            return self.bucket_counts.get(bucket_id, 0)
+        return self.index_counts.get(self.index_ids.get((bucket_id, size, prefix or "")), 0)
+
+    def at(self, bucket: str, position: int, size: int = None, prefix: str = None) -> ObjectRecord:
+        """Get record at position of bucket, or of (bucket, size, prefix) if size is given."""
+        total = self.count(bucket, size, prefix)
+        if position < 0:
+            position += total
+        if not 0 <= position < total:
+            raise IndexError(f"Position {position} out of range of {total} objects")
+        bucket_id = self.bucket_ids[bucket]
+        if size is None:
+            query, params = "bucket_id = ? AND bucket_pos = ?", (bucket_id, position)
+        else:
+            index_id = self.index_ids[(bucket_id, size, prefix or "")]
+            query, params = "index_id = ? AND index_pos = ?", (index_id, position)
+        return self.to_record(
+            self.conn.execute(
+                f"SELECT {self.COLUMNS} FROM objects WHERE {query}", params  # nosec
+            ).fetchone()
+        )
+
+    def choice(self, bucket: str, size: int = None, prefix: str = None) -> ObjectRecord:
+        """Get random record of bucket, or of (bucket, size, prefix) if size is given."""
+        total = self.count(bucket, size, prefix)
+        if not total:
+            raise IndexError("Cannot choose from an empty catalog")
+        return self.at(bucket, random.randrange(total), size, prefix)  # nosec
+
+    def total_size(self) -> int:
+        """Total size of objects in catalog."""
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
@@ -21,8 +21,12 @@
 
 """RestAPI library using aiobotocore module."""
 
+import asyncio
 import logging
 import os
+from contextlib import AsyncExitStack
+from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
 
 import boto3
@@ -32,7 +36,83 @@ from aiobotocore.session import get_session
 from botocore.config import Config
 
 from config import S3_CFG
+from src.commons.constants import ROOT
 from src.commons.logger import get_logger
+from src.commons.utils.hashing import get_checksum_algorithm
+from src.libs.s3api.endpoints import EndpointBalancer
+from src.libs.s3api.limiter import AdaptiveLimiter
+
+LOGGER = logging.getLogger(ROOT)
+
+
+class S3ClientRegistry:
+    """
+    Process wide registry of pooled aiobotocore clients.
+
+    Clients are shared by all S3Client instances of the process using the same access key,
+    endpoint, region and ssl flag, so sessions with the same identity share connections and
+    botocore metadata. Shared client is closed once the last instance using it is closed.
+    """
+
+    session = None
+    clients = {}
+
+    @classmethod
+    def get_session(cls):
+        """Get the aiobotocore session of the process, loaded once and shared by all clients."""
+        if cls.session is None:
+            cls.session = get_session()
+            # Throttled attempts retried inside botocore are reported to concurrency limiters.
+            cls.session.register("needs-retry.s3", AdaptiveLimiter.on_needs_retry)
+        return cls.session
+
+    @classmethod
+    async def acquire(cls, client_key: tuple, create_client):
+        """
+        Get the shared client for client key, open it on first use.
+
+        :param client_key: (service name, access key, endpoint, region, use_ssl, event loop).
+        :param create_client: Function returning client context for the client key.
+        """
+        if client_key not in cls.clients:
+            cls.clients[client_key] = {
+                "task": client_key[-1].create_task(cls.open_client(client_key, create_client)),
+                "references": 0,
+            }
+        entry = cls.clients[client_key]
+        entry["references"] += 1
+        try:
+            client, _ = await entry["task"]
+        except Exception:
+            cls.clients.pop(client_key, None)
+            raise
+        return client
+
+    @staticmethod
+    async def open_client(client_key: tuple, create_client) -> tuple:
+        """Open long-lived aiobotocore client along with its aiohttp connector."""
+        exit_stack = AsyncExitStack()
+        client = await exit_stack.enter_async_context(create_client())
+        LOGGER.debug("Opened %s client for %s", client_key[0], client_key[2])
+        return client, exit_stack
+
+    @classmethod
+    async def release(cls, client_key: tuple) -> None:
+        """Release the shared client for client key and close it if not used anymore."""
+        entry = cls.clients.get(client_key)
+        if not entry:
+            return
+        entry["references"] -= 1
+        if entry["references"] <= 0:
+            cls.clients.pop(client_key)
+            _, exit_stack = await entry["task"]
+            await exit_stack.aclose()
+            LOGGER.debug("Closed %s client for %s", client_key[0], client_key[2])
+
+    @classmethod
+    def discard(cls, client_key: tuple) -> None:
+        """Drop the shared client for client key, used once its event loop is closed."""
+        cls.clients.pop(client_key, None)
 
 
 # pylint: disable=too-many-instance-attributes
@@ -49,18 +129,47 @@ class S3Client:
         secret_key etc.
         :param access_key: access key.
         :param secret_key: secret key.
-        :param endpoint_url: endpoint url.
+        :param endpoint_url: endpoint url or list of endpoint urls to balance the requests.
+        :param endpoint_policy: Endpoint selection policy round_robin, least_outstanding, latency.
         :param s3_cert_path: s3 certificate path.
         :param region: region.
         :param aws_session_token: aws_session_token.
         :param debug: debug mode.
+        :param max_pool_connections: Maximum number of connections kept in the client pool.
+        :param keepalive_timeout: Idle time in seconds to keep pooled connections alive.
+        :param endpoint_max_concurrency: Max in-flight requests per endpoint, 0 for unlimited.
+        :param process_max_concurrency: Max in-flight requests of process, 0 for unlimited.
+        :param checksum_algorithm: Algorithm to validate object data, sha256, md5, etag, crc32c
+            or xxh3.
         """
         self.access_key = access_key
         self.secret_key = secret_key
         self.region = kwargs.get("region", S3_CFG.region)
         self.aws_session_token = kwargs.get("aws_session_token", None)
         self.use_ssl = kwargs.get("use_ssl", S3_CFG.use_ssl)
-        self.endpoint_url = kwargs.get("endpoint_url", S3_CFG.endpoint)
+        endpoint_url = kwargs.get("endpoint_url", S3_CFG.endpoints)
+        self.endpoints = (
+            list(endpoint_url) if isinstance(endpoint_url, (list, tuple)) else [endpoint_url]
+        )
+        self.endpoint_url = self.endpoints[0]
+        self.balancer = EndpointBalancer.get_balancer(
+            self.endpoints, kwargs.get("endpoint_policy", S3_CFG.endpoint_policy)
+        )
+        self.max_pool_connections = kwargs.get(
+            "max_pool_connections", S3_CFG.max_pool_connections
+        )
+        self.keepalive_timeout = kwargs.get("keepalive_timeout", S3_CFG.keepalive_timeout)
+        self.endpoint_max_concurrency = kwargs.get(
+            "endpoint_max_concurrency", S3_CFG.endpoint_max_concurrency
+        )
+        self.process_limiter = AdaptiveLimiter.get_limiter(
+            "process", kwargs.get("process_max_concurrency", S3_CFG.process_max_concurrency)
+        )
+        self.checksum_algorithm = get_checksum_algorithm(
+            kwargs.get("checksum_algorithm") or S3_CFG.checksum_algorithm
+        )
+        # Shared pooled clients acquired by this instance per client key.
+        self._clients = {}
         self.log = get_logger(
             os.getenv("log_level") or logging.INFO, kwargs.get("test_id", Path(__file__).stem)
         )
@@ -74,25 +183,108 @@ class S3Client:
             )
         )
 
-    def get_client(self, service_name="s3"):
+    @asynccontextmanager
+    async def get_client(self, service_name="s3"):
+        """
+        Get the pooled s3 client of balanced endpoint for asyncio operations.
+
+        Client is taken from process wide registry once per endpoint and event loop and kept
+        open(along with its connection pool) till close is called, so every request reuses the
+        established connections. Request is admitted only under the process and endpoint
+        concurrency limits, its outcome is reported back to endpoint balancer and limiters.
+        :param service_name: Name of the aws service.
+        """
+        endpoint = self.balancer.select()
+        client_key = self.get_client_key(service_name, endpoint.url)
+        if client_key not in self._clients:
+            self._clients[client_key] = client_key[-1].create_task(
+                S3ClientRegistry.acquire(
+                    client_key, partial(self.create_client, service_name, endpoint.url)
+                )
+            )
+        try:
+            client = await self._clients[client_key]
+        except Exception:
+            self._clients.pop(client_key, None)
+            raise
+        limiters = [
+            limiter
+            for limiter in (
+                self.process_limiter,
+                AdaptiveLimiter.get_limiter(endpoint.url, self.endpoint_max_concurrency),
+            )
+            if limiter
+        ]
+        acquired, error = [], None
+        try:
+            for limiter in limiters:
+                await limiter.acquire()
+                acquired.append(limiter)
+            start_time = self.balancer.start(endpoint)
+            try:
+                yield client
+            except BaseException as err:
+                error = err
+                raise
+            finally:
+                # Also reached when the caller is a generator closed while holding the client.
+                self.balancer.complete(endpoint, start_time, error)
+        finally:
+            throttled = error is not None and AdaptiveLimiter.is_throttled(error)
+            for limiter in acquired:
+                limiter.release(throttled)
+
+    def get_client_key(self, service_name="s3", endpoint_url=None) -> tuple:
+        """Get the key of shared client for service name, endpoint on running event loop."""
+        return (
+            service_name,
+            self.access_key,
+            endpoint_url or self.endpoint_url,
+            self.region,
+            self.use_ssl,
+            asyncio.get_running_loop(),
+        )
+
+    def create_client(self, service_name="s3", endpoint_url=None):
         """Create s3 client session for asyncio operations."""
-        session = get_session()
+        session = S3ClientRegistry.get_session()
         return session.create_client(
             service_name=service_name,
             use_ssl=self.use_ssl,
             verify=False,
             aws_access_key_id=self.access_key,
             aws_secret_access_key=self.secret_key,
-            endpoint_url=self.endpoint_url,
+            endpoint_url=endpoint_url or self.endpoint_url,
             region_name=self.region,
             aws_session_token=self.aws_session_token,
             config=AioConfig(
                 connect_timeout=S3_CFG.connect_timeout,
                 read_timeout=S3_CFG.read_timeout,
                 retries={"max_attempts": S3_CFG.s3api_retry},
+                max_pool_connections=self.max_pool_connections,
+                connector_args={"keepalive_timeout": self.keepalive_timeout},
             ),
         )
 
+    async def close(self) -> None:
+        """Release the pooled clients of running event loop and drop the ones of closed loops."""
+        loop = asyncio.get_running_loop()
+        for client_key in list(self._clients):
+            client_loop = client_key[-1]
+            if client_loop is loop:
+                self._clients.pop(client_key)
+                await S3ClientRegistry.release(client_key)
+            elif client_loop.is_closed():
+                self._clients.pop(client_key)
+                S3ClientRegistry.discard(client_key)
+
+    async def execute_and_close(self, func, *args, **kwargs):
+        """Execute the coroutine function and close pooled clients of running loop at the end."""
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            await self.close()
+
     def get_boto3_client(self, service_name="s3"):
         """Create s3 client for without asyncio operations."""
         return boto3.client(
@@ -101,7 +293,7 @@ class S3Client:
             verify=False,
             aws_access_key_id=self.access_key,
             aws_secret_access_key=self.secret_key,
-            endpoint_url=self.endpoint_url,
+            endpoint_url=self.balancer.select().url,
             region_name=self.region,
             aws_session_token=self.aws_session_token,
             config=Config(
@@ -119,7 +311,7 @@ class S3Client:
             verify=False,
             aws_access_key_id=self.access_key,
             aws_secret_access_key=self.secret_key,
-            endpoint_url=self.endpoint_url,
+            endpoint_url=self.balancer.select().url,
             region_name=self.region,
             aws_session_token=self.aws_session_token,
             config=Config(
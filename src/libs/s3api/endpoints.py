@@ -0,0 +1,164 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Load balancing of s3 requests across multiple endpoints."""
+
+import asyncio
+import logging
+import random
+import time
+from itertools import cycle
+
+from botocore.exceptions import ConnectionError as BotoConnectionError
+from botocore.exceptions import HTTPClientError
+
+from config import S3_CFG
+from src.commons.constants import ROOT
+
+LOGGER = logging.getLogger(ROOT)
+
+# Separate random generator for endpoint selection to keep seeded workload randomness untouched.
+SELECTOR = random.Random()
+
+# Supported endpoint selection policies.
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+LATENCY = "latency"
+
+
+class EndpointStats:
+    """Health and load details of a single endpoint."""
+
+    __slots__ = ("url", "outstanding", "latency", "failures", "ejected_till")
+
+    def __init__(self, url: str):
+        """Initialize endpoint stats."""
+        self.url = url
+        self.outstanding = 0
+        self.latency = 0.0
+        self.failures = 0
+        self.ejected_till = 0.0
+
+    def is_healthy(self, now: float) -> bool:
+        """Check endpoint is not ejected at given time."""
+        return self.ejected_till <= now
+
+
+class EndpointBalancer:
+    """
+    Spread requests across endpoints as per round-robin, least-outstanding or latency policy.
+
+    Endpoint having max consecutive connection failures is ejected for eject time and brought back
+    once eject time is over. Balancer is shared by all s3 clients of process using same endpoints.
+    """
+
+    balancers = {}
+
+    def __init__(self, endpoints: list, policy: str = ROUND_ROBIN, **kwargs):
+        """
+        Initialize endpoint balancer.
+
+        :param endpoints: List of endpoint urls.
+        :param policy: Endpoint selection policy round_robin, least_outstanding or latency.
+        :keyword max_failures: Consecutive connection failures after which endpoint is ejected.
+        :keyword eject_time: Time in seconds for which failed endpoint is ejected.
+        """
+        if policy not in (ROUND_ROBIN, LEAST_OUTSTANDING, LATENCY):
+            raise AssertionError(f"Unsupported endpoint policy: {policy}")
+        self.policy = policy
+        self.max_failures = kwargs.get("max_failures", S3_CFG.endpoint_max_failures)
+        self.eject_time = kwargs.get("eject_time", S3_CFG.endpoint_eject_time)
+        self.endpoints = [EndpointStats(url) for url in endpoints]
+        self.rr_itr = cycle(self.endpoints)
+
+    @classmethod
+    def get_balancer(cls, endpoints: list, policy: str = ROUND_ROBIN):
+        """Get balancer shared across process for given endpoints and policy."""
+        balancer_key = (tuple(endpoints), policy)
+        if balancer_key not in cls.balancers:
+            cls.balancers[balancer_key] = cls(endpoints, policy)
+        return cls.balancers[balancer_key]
+
+    def select(self) -> EndpointStats:
+        """Select the endpoint for next request as per policy from healthy endpoints."""
+        if len(self.endpoints) == 1:
+            return self.endpoints[0]
+        now = time.monotonic()
+        healthy = [endpoint for endpoint in self.endpoints if endpoint.is_healthy(now)]
+        if not healthy:
+            # All endpoints are ejected, try the one coming back first.
+            return min(self.endpoints, key=lambda endpoint: endpoint.ejected_till)
+        if self.policy == LEAST_OUTSTANDING:
+            least = min(endpoint.outstanding for endpoint in healthy)
+            return SELECTOR.choice(  # nosec
+                [endpoint for endpoint in healthy if endpoint.outstanding == least]
+            )
+        if self.policy == LATENCY:
+            # Endpoints without latency samples yet get the weight of the fastest one.
+            fastest = min((ep.latency for ep in healthy if ep.latency), default=1.0)
+            weights = [1 / (endpoint.latency or fastest) for endpoint in healthy]
+            return SELECTOR.choices(healthy, weights=weights)[0]  # nosec
+        for _ in range(len(self.endpoints)):
+            endpoint = next(self.rr_itr)
+            if endpoint.is_healthy(now):
+                return endpoint
+        return healthy[0]
+
+    @staticmethod
+    def start(endpoint: EndpointStats) -> float:
+        """Mark request started on endpoint and return start time."""
+        endpoint.outstanding += 1
+        return time.monotonic()
+
+    def complete(self, endpoint: EndpointStats, start_time: float, error=None) -> None:
+        """
+        Mark request completed on endpoint and update latency, health of endpoint.
+
+        :param endpoint: Endpoint used for the request.
+        :param start_time: Start time of the request.
+        :param error: Exception raised by the request if any.
+        """
+        endpoint.outstanding -= 1
+        if error is not None and self.is_endpoint_failure(error):
+            endpoint.failures += 1
+            if endpoint.failures >= self.max_failures:
+                endpoint.ejected_till = time.monotonic() + self.eject_time
+                endpoint.failures = 0
+                LOGGER.warning(
+                    "Endpoint %s ejected for %s seconds: %s", endpoint.url, self.eject_time, error
+                )
+            return
+        latency = time.monotonic() - start_time
+        # Exponentially weighted moving average of request latency.
+        endpoint.latency = (
+            latency if not endpoint.latency else 0.8 * endpoint.latency + 0.2 * latency
+        )
+        if endpoint.failures or endpoint.ejected_till:
+            LOGGER.info("Endpoint %s is healthy.", endpoint.url)
+        endpoint.failures = 0
+        endpoint.ejected_till = 0.0
+
+    @staticmethod
+    def is_endpoint_failure(error: BaseException) -> bool:
+        """Check error is because of unreachable/dead endpoint."""
+        return isinstance(
+            error, (BotoConnectionError, HTTPClientError, ConnectionError, asyncio.TimeoutError)
+        )
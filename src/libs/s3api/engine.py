@@ -0,0 +1,462 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Engines running s3 operations closed-loop, open-loop at rate and as weighted mix."""
+
+import asyncio
+import os
+import random
+from time import perf_counter
+from time import perf_counter_ns
+from typing import Union
+
+from config import S3_CFG
+from src.commons import constants as const
+from src.commons.utils._asyncio import schedule_tasks
+from src.commons.utils.datagen import DataPool
+from src.commons.utils.datagen import StreamingPayload
+from src.libs.s3api import S3Api
+from src.libs.s3api.catalog import ObjectCatalog
+from src.libs.s3api.catalog import SQLiteObjectCatalog
+
+
+class S3ApiEngine(S3Api):
+    """
+    Engines running s3 operations on workers, at target rate or as weighted op mix.
+
+    Objects written by the operations are tracked in object catalog, which is kept on disk if
+    catalog_dir is configured, so objects of a resumed run can be read and validated.
+    """
+
+    # Settings object data is derived from, stored in on-disk catalog.
+    DATA_SETTINGS = ("seed", "data_pool_size", "chunk_size")
+
+    def __init__(self, access_key: str, secret_key: str, endpoint_url: str, **kwargs) -> None:
+        """
+        Initialize operation engines and object catalog.
+
+        :param access_key: access key.
+        :param secret_key: secret key.
+        :param endpoint_url: endpoint with http or https.
+        :param use_ssl: To use secure connection.
+        :param test_id: Test ID string, used as name of on-disk catalog.
+        :param rate: Operations per second in open-loop mode, default is closed-loop on sessions.
+        :param arrival: Arrivals of open-loop operations constant or poisson.
+        :param seed: Seed of random generator of operations, default is global seed.
+        """
+        super().__init__(access_key, secret_key, endpoint_url=endpoint_url, **kwargs)
+        self.rate = float(kwargs.get("rate") or 0)
+        self.arrival = kwargs.get("arrival") or const.CONSTANT
+        if self.arrival not in const.ARRIVALS:
+            raise AssertionError(
+                f"Unsupported arrival: {self.arrival}, supported: {const.ARRIVALS}"
+            )
+        # Separate seeded generator so scheduling randomness is reproducible on its own.
+        self.rng = random.Random(kwargs.get("seed") or S3_CFG.get("seed"))  # nosec
+        if S3_CFG.catalog_dir:
+            self.catalog = SQLiteObjectCatalog(
+                os.path.join(S3_CFG.catalog_dir, f"{kwargs.get('test_id', 'corio')}.db"),
+                resume=S3_CFG.resume,
+                batch_size=S3_CFG.catalog_batch_size,
+                meta={name: S3_CFG.get(name) for name in self.DATA_SETTINGS},
+            )
+            self.restore_data_settings()
+            self.log.info(
+                "Object catalog: %s, resumed objects: %s",
+                self.catalog.db_path,
+                {bucket: self.catalog.count(bucket) for bucket in self.catalog.get_buckets()},
+            )
+        else:
+            self.catalog = ObjectCatalog()
+
+    def restore_data_settings(self) -> None:
+        """
+        Restore data settings(seed, data pool and chunk size) stored in resumed catalog.
+
+        Object data is derived from these settings, so objects written by previous run can be
+        validated only with same settings. Run fails if data pool of the process is already
+        allocated with different settings.
+        """
+        changed = {
+            name: value
+            for name, value in self.catalog.meta.items()
+            if S3_CFG.get(name) != value
+        }
+        if not changed:
+            return
+        if DataPool.pool is not None:
+            raise AssertionError(
+                f"Data settings {changed} of catalog {self.catalog.db_path} differ from data pool"
+                f" of the process, rerun with same seed, data_pool_size and chunk_size."
+            )
+        self.log.warning("Restoring data settings of resumed catalog: %s", changed)
+        S3_CFG.update(changed)
+
+    async def close(self) -> None:
+        """Commit changes of object catalog and release the pooled clients."""
+        self.catalog.commit()
+        await super().close()
+
+    async def run_workers(self, workers: int, operations: int, func, *args, **kwargs) -> None:
+        """
+        Run operations using long lived workers pulling them from a bounded queue.
+
+        Producer queues counters of operations and every worker picks the next one as soon as it
+        is done with previous one, so workers operations stay in flight till queue is drained
+        and slow requests don't hold back the rest of the operations.
+        :param workers: Number of parallel workers(sessions).
+        :param operations: Number of operations to run.
+        :param func: Coroutine function of operation, called with cntr of the operation.
+        :keyword cntr: Counter of the first operation, default is 0.
+        """
+        workers = min(workers, operations)
+        if workers <= 0:
+            return
+        start = kwargs.pop("cntr", 0)
+        queue = asyncio.Queue(maxsize=workers * 2)
+
+        async def produce():
+            """Queue counters of operations followed by stop(None) for every worker."""
+            for cntr in range(start, start + operations):
+                await queue.put(cntr)
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def work():
+            """Run queued operations till stop(None) is received."""
+            cntr = await queue.get()
+            while cntr is not None:
+                await func(*args, cntr=cntr, **kwargs)
+                cntr = await queue.get()
+
+        self.log.info(
+            "Running %s operations of %s on %s workers.", operations, func.__name__, workers
+        )
+        await schedule_tasks(self.log, [produce()] + [work() for _ in range(workers)])
+
+    async def run_at_rate(self, operations: int, func, *args, **kwargs) -> dict:
+        """
+        Run operations open-loop, started at target rate irrespective of their completion.
+
+        Intended start times are spaced evenly(constant) or exponentially(poisson) as per rate, so
+        offered load doesn't drop when the server slows down. Latency is measured from intended
+        start time, so time spent waiting behind slow requests is counted(coordinated omission).
+        Operations starting later than rate_lag_threshold are behind schedule and reported.
+        :param operations: Number of operations to run.
+        :param func: Coroutine function of operation, called with cntr of the operation.
+        :keyword cntr: Counter of the first operation, default is 0.
+        :return: Stats of the run(operations, rate, behind, max_lag, p50, p99, max latency).
+        """
+        if operations <= 0:
+            return {}
+        start = kwargs.pop("cntr", 0)
+        loop = asyncio.get_running_loop()
+        latencies = []
+
+        async def run(cntr: int, intended_start: float):
+            """Run operation and record latency from intended start."""
+            await func(*args, cntr=cntr, **kwargs)
+            latencies.append(loop.time() - intended_start)
+
+        begin = loop.time()
+        schedule = await self.start_at_rate(operations, run, start)
+        stats = {
+            "operations": operations,
+            "rate": operations / (loop.time() - begin),
+            **schedule,
+            **self.get_latency_stats(latencies),
+        }
+        self.log.info(
+            "Open-loop %s operations of %s at target rate %s(%s): %s",
+            operations,
+            func.__name__,
+            self.rate,
+            self.arrival,
+            stats,
+        )
+        return stats
+
+    async def start_at_rate(self, operations: int, run, start: int) -> dict:
+        """
+        Start operations at their intended start times and wait till all of them are done.
+
+        :param operations: Number of operations to run.
+        :param run: Coroutine function called with cntr and intended start of the operation.
+        :param start: Counter of the first operation.
+        :return: Operations behind schedule and max lag of their start.
+        """
+        loop = asyncio.get_running_loop()
+        errors, pending = [], set()
+        schedule = {"behind": 0, "max_lag": 0.0}
+        last_report = 0.0
+        intended = loop.time()
+
+        def done(task):
+            """Drop completed task, keep the error if any."""
+            pending.discard(task)
+            if not task.cancelled() and task.exception():
+                errors.append(task.exception())
+
+        try:
+            for cntr in range(start, start + operations):
+                if intended > loop.time():
+                    await asyncio.sleep(intended - loop.time())
+                while len(pending) >= S3_CFG.rate_max_inflight and not errors:
+                    await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if errors:
+                    raise errors[0]
+                lag = loop.time() - intended
+                if lag > S3_CFG.rate_lag_threshold:
+                    schedule["behind"] += 1
+                    schedule["max_lag"] = max(schedule["max_lag"], lag)
+                    if loop.time() - last_report >= 1:
+                        last_report = loop.time()
+                        self.log.warning(
+                            "Behind schedule by %.3f seconds at %s/%s operations, in flight: %s",
+                            lag,
+                            cntr - start,
+                            operations,
+                            len(pending),
+                        )
+                task = asyncio.ensure_future(run(cntr, intended))
+                pending.add(task)
+                task.add_done_callback(done)
+                intended += self.get_interarrival_time()
+            while pending and not errors:
+                await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+            if errors:
+                raise errors[0]
+        finally:
+            for task in list(pending):
+                task.cancel()
+        return schedule
+
+    def get_interarrival_time(self) -> float:
+        """Get time between intended starts, exponential(poisson) or constant as per rate."""
+        if self.arrival == const.POISSON:
+            return self.rng.expovariate(self.rate)
+        return 1 / self.rate
+
+    @staticmethod
+    def get_latency_stats(latencies: list) -> dict:
+        """Get p50, p99 and max of latencies."""
+        latencies = sorted(latencies)
+        if not latencies:
+            return {}
+        return {
+            name: latencies[min(int(len(latencies) * percentile), len(latencies) - 1)]
+            for name, percentile in (("p50", 0.5), ("p99", 0.99), ("max", 1))
+        }
+
+    async def run_operations(self, workers: int, operations: int, func, *args, **kwargs) -> None:
+        """Run operations open-loop if rate is set else on workers, see run_at_rate/run_workers."""
+        if self.rate:
+            await self.run_at_rate(operations, func, *args, **kwargs)
+        else:
+            await self.run_workers(workers, operations, func, *args, **kwargs)
+
+    # pylint: disable=too-many-locals, too-many-statements
+    async def run_mixed_operations(
+        self,
+        bucket_name: str,
+        operations: int,
+        sessions: int,
+        op_mix: dict,
+        object_size: Union[list, dict, int],
+        **kwargs,
+    ) -> dict:
+        """
+        Run interleaved operations drawn from weighted op mix against objects of the catalog.
+
+        Bucket is filled up to start of dataset_objects band before the timed operations. Get,
+        head and delete use a random object of the bucket, drawn from the objects no other
+        operation is using. Put uploads a new object, or overwrites one once end of the band is
+        reached, so number of objects stays within the band. Operation waits till an object is
+        free if all objects are in use. Delete drawn at start of the band is drawn again, so
+        achieved mix is reported along with the requested one.
+        :param bucket_name: Name of the bucket.
+        :param operations: Number of operations to run.
+        :param sessions: Number of parallel workers, not used in open-loop(rate) mode.
+        :param op_mix: Weights of put, get, head and delete e.g. {get: 60, put: 25, head: 10}.
+        :param object_size: Size of objects uploaded by put, int, list or range dict(start, end).
+        :keyword dataset_objects: Band(start, end) of number of objects in the bucket.
+        :keyword object_prefix: Prefix of objects uploaded by put.
+        :return: Metrics(count, bytes, requested and achieved percent, latency) per operation.
+        """
+        unsupported = set(op_mix) - set(const.MIXED_OPERATIONS)
+        if unsupported:
+            raise AssertionError(
+                f"Unsupported operations {unsupported} in op mix, supported:"
+                f" {const.MIXED_OPERATIONS}"
+            )
+        op_names, weights = zip(*op_mix.items())
+        band = kwargs.get("dataset_objects") or {}
+        band_start, band_end = band.get("start", 0), band.get("end")
+        object_prefix = kwargs.get("object_prefix", "mixed-object")
+        latencies = {operation: [] for operation in op_names}
+        op_bytes = dict.fromkeys(op_names, 0)
+        busy_keys = set()
+        # Operations running, new objects being uploaded and objects being deleted.
+        inflight = {"operations": 0, const.PUT: 0, const.DELETE: 0}
+        op_done = asyncio.Condition()
+        self.catalog.add_bucket(bucket_name)
+
+        async def put_object(record=None, **kwargs) -> int:
+            """Upload new object, or overwrite object of record, and add it to catalog."""
+            size = record.size if record else self.get_object_size(object_size)
+            key = (
+                record.key
+                if record
+                else f"{object_prefix}-{perf_counter_ns()}-{kwargs.get('cntr')}"
+            )
+            payload = StreamingPayload.for_object(
+                bucket_name,
+                key,
+                size,
+                record.version + 1 if record else 0,
+                algorithm=self.checksum_algorithm,
+            )
+            uploaded = await self.upload_payload(bucket_name, key, payload)
+            self.catalog.add_record(uploaded, object_prefix)
+            return size
+
+        def get_free_record():
+            """Get random record of bucket, which no other operation is using, None if all are."""
+            busy = sorted(self.catalog.get(bucket_name, key).bucket_pos for key in busy_keys)
+            free = self.catalog.count(bucket_name) - len(busy)
+            if free <= 0:
+                return None
+            position = self.rng.randrange(free)
+            # Map position among free records to position in bucket.
+            for busy_pos in busy:
+                if busy_pos > position:
+                    break
+                position += 1
+            return self.catalog.at(bucket_name, position)
+
+        async def get_operation() -> tuple:
+            """Draw next operation as per op mix and get the object to use, if any."""
+            operation = self.rng.choices(op_names, weights)[0]
+            while True:
+                objects = (
+                    self.catalog.count(bucket_name)
+                    + inflight[const.PUT]
+                    - inflight[const.DELETE]
+                )
+                if operation == const.DELETE and objects <= band_start:
+                    if not op_mix.get(const.PUT):
+                        raise AssertionError(
+                            f"Objects of {bucket_name} reached {band_start}, op mix has no put"
+                        )
+                    operation = self.rng.choices(op_names, weights)[0]
+                    continue
+                if operation == const.PUT and not (band_end and objects >= band_end):
+                    return operation, None
+                record = get_free_record()
+                if record:
+                    return operation, record
+                if not inflight["operations"]:
+                    if not op_mix.get(const.PUT):
+                        raise AssertionError(f"No objects in {bucket_name}, op mix has no put")
+                    operation = self.rng.choices(op_names, weights)[0]
+                    continue
+                # All objects are in use, wait till any operation is done.
+                async with op_done:
+                    await op_done.wait()
+
+        async def mixed_operation(**kwargs):
+            """Run next operation of mix."""
+            operation, record = await get_operation()
+            inflight["operations"] += 1
+            if record:
+                busy_keys.add(record.key)
+            elif operation == const.PUT:
+                inflight[const.PUT] += 1
+            if operation == const.DELETE:
+                inflight[const.DELETE] += 1
+            start_time = perf_counter()
+            try:
+                if operation == const.PUT:
+                    size = await put_object(record, **kwargs)
+                elif operation == const.DELETE:
+                    size = record.size
+                    await self.delete_object(bucket_name, record.key)
+                    # Record is removed only once object is deleted, failed delete keeps it.
+                    self.catalog.remove(bucket_name, record.key)
+                elif operation == const.HEAD:
+                    size = 0
+                    await self.head_object(bucket_name, record.key)
+                else:
+                    size = record.size
+                    if not await self.verify_s3object(
+                        bucket_name, record.key, record.size, version=record.version
+                    ):
+                        raise AssertionError(f"Data integrity failed for {record.key}.")
+                latencies[operation].append(perf_counter() - start_time)
+                op_bytes[operation] += size
+            finally:
+                inflight["operations"] -= 1
+                if record:
+                    busy_keys.discard(record.key)
+                elif operation == const.PUT:
+                    inflight[const.PUT] -= 1
+                if operation == const.DELETE:
+                    inflight[const.DELETE] -= 1
+                async with op_done:
+                    op_done.notify_all()
+
+        prefill = band_start - self.catalog.count(bucket_name)
+        if prefill > 0:
+            self.log.info(
+                "Filling %s with %s objects before mixed operations", bucket_name, prefill
+            )
+            await self.run_workers(sessions, prefill, put_object)
+            self.catalog.commit()
+        start_time = perf_counter()
+        await self.run_operations(sessions, operations, mixed_operation)
+        duration = perf_counter() - start_time
+        total_weight = sum(weights)
+        done = sum(len(op_latencies) for op_latencies in latencies.values()) or 1
+        metrics = {}
+        for operation, op_latencies in latencies.items():
+            metrics[operation] = {
+                "count": len(op_latencies),
+                "requested_percent": round(100 * op_mix[operation] / total_weight, 2),
+                "achieved_percent": round(100 * len(op_latencies) / done, 2),
+                "ops_per_sec": len(op_latencies) / duration,
+                "bytes": op_bytes[operation],
+                "mib_per_sec": op_bytes[operation] / const.KIB**2 / duration,
+                **self.get_latency_stats(op_latencies),
+            }
+            self.log.info("Mixed operation %s metrics: %s", operation, metrics[operation])
+        self.catalog.commit()
+        self.log.info(
+            "Mixed %s operations on %s in %.3f seconds, objects: %s",
+            operations,
+            bucket_name,
+            duration,
+            self.catalog.count(bucket_name),
+        )
+        return metrics
+
+    def get_object_size(self, object_size: Union[list, dict, int]) -> int:
+        """Get the object size in bytes from int, list or range dict(start, end)."""
+        if isinstance(object_size, list):
+            return random.choice(object_size)  # nosec
+        if isinstance(object_size, dict):
+            return random.randrange(object_size["start"], object_size["end"])  # nosec
+        return object_size
@@ -0,0 +1,151 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Adaptive admission control of in-flight s3 requests."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from weakref import WeakKeyDictionary
+
+from config import S3_CFG
+from src.commons import constants as const
+from src.commons.utils.utility import get_retry_policy
+
+LOGGER = logging.getLogger(const.ROOT)
+
+
+class AdaptiveLimiter:
+    """
+    Limit in-flight requests and adapt the limit with AIMD on throttling.
+
+    Limit is decreased multiplicatively when server throttles(SlowDown/503) and increased
+    additively(by one per limit of successful requests) till max limit. Limit is shared across
+    event loops, in-flight requests and waiters are tracked per event loop as nested loops can't
+    hand over slots to each other.
+    """
+
+    limiters = {}
+
+    def __init__(self, name: str, max_limit: int, **kwargs):
+        """
+        Initialize adaptive limiter.
+
+        :param name: Name of the limiter, endpoint url or process.
+        :param max_limit: Maximum number of in-flight requests.
+        :keyword decrease_factor: Factor by which limit is decreased on throttling.
+        :keyword decrease_interval: Minimum time in seconds between two decreases.
+        """
+        self.name = name
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self.decrease_factor = kwargs.get("decrease_factor", S3_CFG.throttle_decrease_factor)
+        self.decrease_interval = kwargs.get(
+            "decrease_interval", S3_CFG.throttle_decrease_interval
+        )
+        self.last_decrease = 0.0
+        # Per event loop [in-flight requests, waiters].
+        self.loops = WeakKeyDictionary()
+
+    @classmethod
+    def get_limiter(cls, name: str, max_limit: int):
+        """Get limiter shared across process for given name, None if limit is disabled."""
+        if not max_limit:
+            return None
+        if name not in cls.limiters:
+            cls.limiters[name] = cls(name, max_limit)
+        return cls.limiters[name]
+
+    def get_slots(self) -> list:
+        """Get in-flight count and waiters of running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop not in self.loops:
+            self.loops[loop] = [0, deque()]
+        return self.loops[loop]
+
+    async def acquire(self) -> None:
+        """Wait till number of in-flight requests is under the limit."""
+        slots = self.get_slots()
+        if slots[0] < int(self.limit) and not slots[1]:
+            slots[0] += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        slots[1].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over before cancellation, give it back.
+                self.release()
+            raise
+
+    def release(self, throttled: bool = False) -> None:
+        """
+        Release the slot and adapt the limit as per outcome of request.
+
+        :param throttled: True if server throttled the request.
+        """
+        slots = self.get_slots()
+        slots[0] -= 1
+        if throttled:
+            self.decrease()
+        elif self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        while slots[1] and slots[0] < int(self.limit):
+            waiter = slots[1].popleft()
+            if not waiter.done():
+                slots[0] += 1
+                waiter.set_result(None)
+
+    def decrease(self) -> None:
+        """Decrease the limit multiplicatively, once per decrease interval."""
+        now = time.monotonic()
+        if now - self.last_decrease < self.decrease_interval:
+            return
+        self.last_decrease = now
+        self.limit = max(1.0, self.limit * self.decrease_factor)
+        LOGGER.warning("Throttled on %s, concurrency limit reduced to %d", self.name, self.limit)
+
+    @classmethod
+    def on_needs_retry(cls, response=None, endpoint=None, **_kwargs) -> None:
+        """
+        Decrease limits of process and endpoint on throttled attempt of botocore request.
+
+        Handler of botocore needs-retry event. Botocore retries throttled requests internally
+        before the error reaches the caller, so limits are adapted on each throttled attempt.
+        It never asks botocore to retry, retry decision is left to botocore retry handler.
+        :param response: (http response, parsed response) of the attempt, None on exception.
+        :param endpoint: Botocore endpoint of the request.
+        """
+        if response is None:
+            return
+        http_response, parsed = response
+        error_code = (parsed or {}).get("Error", {}).get("Code")
+        if error_code in const.THROTTLE_ERROR_CODES or http_response.status_code in (429, 503):
+            for name in ("process", getattr(endpoint, "host", None)):
+                if name in cls.limiters:
+                    cls.limiters[name].decrease()
+
+    @staticmethod
+    def is_throttled(error: BaseException) -> bool:
+        """Check error is server asking to slow down."""
+        return isinstance(error, Exception) and get_retry_policy(error) == const.RETRY_THROTTLE
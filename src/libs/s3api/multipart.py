@@ -21,6 +21,15 @@
 
 """Python Library to perform multipart operations using aiobotocore module."""
 
+import asyncio
+import os
+from time import perf_counter
+
+from botocore.exceptions import ClientError
+
+from config import S3_CFG
+from src.commons import constants as const
+from src.commons.utils.datagen import StreamingPayload
 from src.commons.utils.utility import retries
 from src.libs.s3api.object import S3Object
 
@@ -33,6 +42,214 @@ class S3MultiParts(S3Object):
         super().__init__(*args, **kwargs)
         self.s3_url = None
 
+    async def upload_object(self, bucket: str, key: str, **kwargs) -> dict:
+        """
+        Upload object, as concurrent multipart upload if it is larger than multipart_threshold.
+
+        Object is split into multipart_part_size parts(grown to keep max 10000 parts) uploaded
+        by upload_parts and multipart upload is aborted if it fails.
+        :param bucket: Name of the bucket.
+        :param key: Name of the object.
+        :keyword file_path: Path of the file.
+        :keyword body: Content of Object, bytes or file like object(e.g. StreamingPayload).
+        :return: Response of the upload s3 object(or complete multipart upload).
+        """
+        size = self.get_body_size(**kwargs)
+        if not S3_CFG.multipart_threshold or size is None or size <= S3_CFG.multipart_threshold:
+            return await super().upload_object(bucket, key, **kwargs)
+        part_size = max(S3_CFG.multipart_part_size, -(-size // 10000))
+        response = await self.create_multipart_upload(bucket, key)
+        upload_id = response["UploadId"]
+        try:
+            parts = await self.upload_parts(
+                bucket, key, upload_id, self.get_body_parts(size, part_size, **kwargs)
+            )
+            response = await self.complete_multipart_upload(upload_id, parts, bucket, key)
+        except BaseException as error:
+            self.log.error("Aborting multipart upload of s3://%s/%s: %s", bucket, key, error)
+            await self.abort_multipart_upload(bucket, key, upload_id)
+            raise
+
+        return response
+
+    async def copy_object(
+        self, src_bucket: str, src_key: str, des_bucket: str, des_key: str, **kwargs
+    ) -> dict:
+        """
+        Copy object, as concurrent multipart copy if it is larger than multipart_copy_threshold.
+
+        :param src_bucket: The name of the source bucket.
+        :param src_key: The name of the source object.
+        :param des_bucket: The name of the destination bucket.
+        :param des_key: The name of the destination object.
+        :keyword object_size: Size of the source object, pass it if known to save a head object.
+        :return: Response of copy object(or complete multipart upload).
+        """
+        object_size = kwargs.pop("object_size", None)
+        threshold = S3_CFG.multipart_copy_threshold
+        if threshold and not kwargs:
+            if object_size is None and threshold >= const.MAX_COPY_OBJECT_SIZE:
+                # Source of unknown size is copied by a single copy object, source too large
+                # for it is rejected by the server and its size is looked up by head object.
+                try:
+                    return await super().copy_object(src_bucket, src_key, des_bucket, des_key)
+                except ClientError as error:
+                    if error.response.get("Error", {}).get("Code") != "InvalidRequest":
+                        raise error
+            if object_size is None:
+                object_size = (await self.head_object(src_bucket, src_key))["ContentLength"]
+            if object_size > threshold:
+                return await self.copy_object_multipart(
+                    src_bucket, src_key, des_bucket, des_key, object_size
+                )
+        return await super().copy_object(src_bucket, src_key, des_bucket, des_key, **kwargs)
+
+    async def copy_object_multipart(
+        self, src_bucket: str, src_key: str, des_bucket: str, des_key: str, object_size: int
+    ) -> dict:
+        """
+        Copy object on server side as multipart upload of concurrent ranged part copies.
+
+        Source is split into multipart_copy_part_size ranges(grown to keep max 10000 parts)
+        copied by up to multipart_concurrency upload part copy requests at a time. Time taken
+        by every part is logged and returned as PartTimings(PartNumber, Size, Duration) along
+        with response of complete multipart upload. Upload is aborted if any part fails.
+        :param src_bucket: The name of the source bucket.
+        :param src_key: The name of the source object.
+        :param des_bucket: The name of the destination bucket.
+        :param des_key: The name of the destination object.
+        :param object_size: Size of the source object.
+        :return: Response of complete multipart upload with PartTimings.
+        """
+        timings = []
+        upload_id = (await self.create_multipart_upload(des_bucket, des_key))["UploadId"]
+        try:
+            parts = await self.copy_parts(
+                f"{src_bucket}/{src_key}",
+                des_bucket,
+                des_key,
+                upload_id=upload_id,
+                object_size=object_size,
+                timings=timings,
+            )
+            response = await self.complete_multipart_upload(upload_id, parts, des_bucket, des_key)
+        except BaseException as error:
+            self.log.error("Aborting multipart copy to s3://%s/%s: %s", des_bucket, des_key, error)
+            await self.abort_multipart_upload(des_bucket, des_key, upload_id)
+            raise
+        response["PartTimings"] = sorted(timings, key=lambda timing: timing["PartNumber"])
+
+        return response
+
+    async def copy_parts(self, copy_source: str, des_bucket: str, des_key: str, **kwargs) -> list:
+        """
+        Copy source as multipart_copy_part_size parts, multipart_concurrency parts at a time.
+
+        Part size is grown to keep max 10000 parts. Pending copies are cancelled if any part
+        fails after its retries.
+        :param copy_source: Source object in bucket/key format.
+        :param des_bucket: The name of the destination bucket.
+        :param des_key: The name of the destination object.
+        :keyword upload_id: Upload id of the multipart upload.
+        :keyword object_size: Size of the source object.
+        :keyword timings: List timings of the parts are added to.
+        :return: Copied parts(PartNumber, ETag) sorted by part number.
+        """
+        object_size = kwargs["object_size"]
+        part_size = max(S3_CFG.multipart_copy_part_size, -(-object_size // 10000))
+        pending = {}
+        copied = []
+        try:
+            for part_number, start in enumerate(range(0, object_size, part_size), 1):
+                while len(pending) >= S3_CFG.multipart_concurrency:
+                    await self.wait_parts(pending, copied)
+                task = asyncio.ensure_future(
+                    self.copy_part(
+                        copy_source,
+                        des_bucket,
+                        des_key,
+                        upload_id=kwargs["upload_id"],
+                        part_number=part_number,
+                        start=start,
+                        end=min(start + part_size, object_size),
+                        timings=kwargs.get("timings", []),
+                    )
+                )
+                pending[task] = (part_number, min(part_size, object_size - start))
+            while pending:
+                await self.wait_parts(pending, copied)
+        finally:
+            self.cancel_parts(pending)
+
+        return sorted(copied, key=lambda part: part["PartNumber"])
+
+    async def copy_part(self, copy_source: str, des_bucket: str, des_key: str, **kwargs) -> dict:
+        """
+        Copy byte range of source as part of multipart upload and time it.
+
+        :param copy_source: Source object in bucket/key format.
+        :param des_bucket: The name of the destination bucket.
+        :param des_key: The name of the destination object.
+        :keyword upload_id: Upload id of the multipart upload.
+        :keyword part_number: Part number of the part.
+        :keyword start: Start of byte range of source.
+        :keyword end: End of byte range of source, exclusive.
+        :keyword timings: List timing(PartNumber, Size, Duration) of the part is added to.
+        :return: Response of upload part copy.
+        """
+        start, end = kwargs["start"], kwargs["end"]
+        start_time = perf_counter()
+        response = await self.upload_part_copy(
+            copy_source,
+            des_bucket,
+            des_key,
+            upload_id=kwargs["upload_id"],
+            part_number=kwargs["part_number"],
+            copy_source_range=f"bytes={start}-{end - 1}",
+        )
+        duration = perf_counter() - start_time
+        kwargs.get("timings", []).append(
+            {"PartNumber": kwargs["part_number"], "Size": end - start, "Duration": duration}
+        )
+        self.log.info(
+            "Copied part %s(%s bytes) of s3://%s to s3://%s/%s in %.3f seconds",
+            kwargs["part_number"],
+            end - start,
+            copy_source,
+            des_bucket,
+            des_key,
+            duration,
+        )
+
+        return response
+
+    @staticmethod
+    def get_body_size(**kwargs) -> int or None:
+        """Get size of body/file_path to be uploaded, None if size is not known."""
+        body = kwargs.get("body")
+        if body is None:
+            file_path = kwargs.get("file_path")
+            return os.path.getsize(file_path) if file_path and os.path.isfile(file_path) else None
+        if isinstance(body, (bytes, bytearray, StreamingPayload)):
+            return len(body)
+        return None
+
+    @staticmethod
+    def get_body_parts(size: int, part_size: int, **kwargs):
+        """Yield (part number, body) of parts of body/file_path, read only when uploaded."""
+        body = kwargs.get("body")
+        offsets = enumerate(range(0, size, part_size), 1)
+        if isinstance(body, StreamingPayload):
+            for part_number, offset in offsets:
+                yield part_number, body.get_part(offset, part_size)
+        elif body is not None:
+            for part_number, offset in offsets:
+                yield part_number, bytes(body[offset : offset + part_size])
+        else:
+            with open(kwargs.get("file_path"), "rb") as f_obj:
+                for part_number, _ in offsets:
+                    yield part_number, f_obj.read(part_size)
+
     @retries()
     async def create_multipart_upload(self, bucket_name: str, obj_name: str) -> dict:
         """
@@ -50,11 +267,11 @@ class S3MultiParts(S3Object):
         return response
 
     @retries()
-    async def upload_part(self, body: bytes, bucket_name: str, object_name: str, **kwargs) -> dict:
+    async def upload_part(self, body, bucket_name: str, object_name: str, **kwargs) -> dict:
         """
         Upload parts of a specific multipart upload.
 
-        :param body: content of the object.
+        :param body: content of the part, bytes or file like object(e.g. StreamingPayload).
         :param bucket_name: Name of the bucket.
         :param object_name: Name of the object.
         :upload_id: upload id of the multipart upload.
@@ -65,6 +282,9 @@ class S3MultiParts(S3Object):
         part_number = kwargs.get("part_number")
         async with self.get_client() as client:
             self.s3_url = s3_url = f"s3://{bucket_name}/{object_name}"
+            if hasattr(body, "seek"):
+                # Rewind stream consumed by the failed attempt in case of retry.
+                body.seek(0)
             response = await client.upload_part(
                 Body=body,
                 Bucket=bucket_name,
@@ -82,6 +302,78 @@ class S3MultiParts(S3Object):
 
         return response
 
+    async def upload_parts(
+        self, bucket_name: str, object_name: str, upload_id: str, parts, **kwargs
+    ) -> list:
+        """
+        Upload parts of a multipart upload concurrently and get the part list to complete it.
+
+        Up to concurrency parts are uploaded at a time while size of parts in flight is within
+        the in-flight byte budget, a part larger than the budget is uploaded alone. Parts are
+        taken from parts iterable only when they can be uploaded, so their bodies can be created
+        lazily. Pending uploads are cancelled if any part fails after its retries.
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :param upload_id: Upload id of the multipart upload.
+        :param parts: Iterable of (part number, body) of parts to be uploaded.
+        :keyword concurrency: Max parts uploaded at a time, default is multipart_concurrency.
+        :keyword inflight_bytes: Max bytes of parts in flight, default is multipart_inflight_bytes.
+        :return: Uploaded parts(PartNumber, ETag) sorted by part number.
+        """
+        concurrency = kwargs.get("concurrency", S3_CFG.multipart_concurrency)
+        inflight_bytes = kwargs.get("inflight_bytes", S3_CFG.multipart_inflight_bytes)
+        pending = {}
+        uploaded = []
+        inflight = 0
+        try:
+            for part_number, body in parts:
+                size = len(body)
+                while pending and (
+                    len(pending) >= concurrency or inflight + size > inflight_bytes
+                ):
+                    inflight -= await self.wait_parts(pending, uploaded)
+                task = asyncio.ensure_future(
+                    self.upload_part(
+                        body, bucket_name, object_name, upload_id=upload_id, part_number=part_number
+                    )
+                )
+                pending[task] = (part_number, size)
+                inflight += size
+            while pending:
+                inflight -= await self.wait_parts(pending, uploaded)
+        finally:
+            self.cancel_parts(pending)
+
+        return sorted(uploaded, key=lambda part: part["PartNumber"])
+
+    @staticmethod
+    def cancel_parts(pending: dict) -> None:
+        """Cancel pending part uploads(or copies), used once a part fails or reading stops."""
+        for task in pending:
+            task.cancel()
+
+    @staticmethod
+    async def wait_parts(pending: dict, uploaded: list) -> int:
+        """
+        Wait till any of the pending part uploads completes.
+
+        :param pending: Pending upload tasks mapped to their (part number, size).
+        :param uploaded: List of uploaded parts, completed parts are added to it.
+        :return: Size of completed parts in bytes.
+        """
+        done, _ = await asyncio.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+        size = 0
+        for task in done:
+            part_number, part_size = pending.pop(task)
+            response = task.result()
+            etag = response.get("CopyPartResult", response).get("ETag")
+            if etag is None:
+                raise AssertionError(f"Failed upload part {part_number}: {response}")
+            uploaded.append({"PartNumber": part_number, "ETag": etag})
+            size += part_size
+
+        return size
+
     @retries()
     async def list_parts(self, mpu_id: str, bucket_name: str, object_name: str) -> list:
         """
@@ -183,10 +475,14 @@ class S3MultiParts(S3Object):
         :param object_name: Name of the object.
         :upload_id: upload id of the multipart upload.
         :part_number: part number to be uploaded.
+        :copy_source_range: byte range of copy source to be copied e.g. bytes=0-1023.
         :return: response of the upload part copy.
         """
         upload_id = kwargs.get("upload_id")
         part_number = kwargs.get("part_number")
+        copy_range = {}
+        if kwargs.get("copy_source_range"):
+            copy_range["CopySourceRange"] = kwargs["copy_source_range"]
         async with self.get_client() as client:
             self.s3_url = s3_url = f"s3://{bucket_name}/{object_name}"
             response = await client.upload_part_copy(
@@ -195,6 +491,7 @@ class S3MultiParts(S3Object):
                 UploadId=upload_id,
                 PartNumber=part_number,
                 CopySource=copy_source,
+                **copy_range,
             )
             self.log.info(
                 "upload_part_copy: copy source: %s to %s, Response: %s",
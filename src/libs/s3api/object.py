@@ -21,15 +21,27 @@
 
 """Python Library to perform object operations using aiobotocore module."""
 
-import hashlib
+import asyncio
 import os
+import re
+from collections import deque
+from itertools import islice
 from typing import List
 
+from botocore.exceptions import ClientError
+
 from config import S3_CFG
+from src.commons import constants as const
+from src.commons.utils._asyncio import aclosing
+from src.commons.utils.datagen import StreamingPayload
+from src.commons.utils.hashing import AsyncHasher
+from src.commons.utils.hashing import HashingService
+from src.commons.utils.hashing import new_digest
 from src.commons.utils.utility import retries
 from src.libs.s3api.bucket import S3Bucket
 
 
+# pylint: disable=too-many-public-methods
 class S3Object(S3Bucket):
     """Class for object operations."""
 
@@ -46,14 +58,17 @@ class S3Object(S3Bucket):
         :param bucket: Name of the bucket.
         :param key: Name of the object.
         :keyword file_path: Path of the file.
-        :keyword body: Content of Object
+        :keyword body: Content of Object, bytes or file like object(e.g. StreamingPayload).
         :return: Response of the upload s3 object.
         """
         self.s3_url = s3_url = f"s3://{bucket}/{key}"
         async with self.get_client() as s3client:
             body = kwargs.get("body", None)
             file_path = kwargs.get("file_path", None)
-            if body:
+            if body is not None:
+                if hasattr(body, "seek"):
+                    # Rewind stream consumed by the failed attempt in case of retry.
+                    body.seek(0)
                 response = await s3client.put_object(Body=body, Bucket=bucket, Key=key)
             elif file_path:
                 with open(file_path, "rb") as rb_obj:
@@ -66,23 +81,79 @@ class S3Object(S3Bucket):
 
         return response
 
-    @retries()
-    async def list_objects(self, bucket: str) -> list:
+    async def upload_payload(self, bucket: str, key: str, payload, **kwargs) -> dict:
+        """
+        Upload payload in a single pass and get the record of uploaded object.
+
+        Payload is generated and sent to the server chunk by chunk, so size and ETag of the
+        object are known once upload completes without reading the data again. Data is
+        validated by comparing it with regenerated payload, so checksum is calculated only if
+        asked for.
+        :param bucket: Name of the bucket.
+        :param key: Name of the object.
+        :param payload: Payload to be uploaded e.g. StreamingPayload.for_object.
+        :keyword checksum: Calculate checksum of payload for the record, default is False.
+        :return: Record of uploaded object with s3url, key_size, key_checksum, etag and version.
+        """
+        response = await self.upload_object(bucket, key, body=payload)
+        return {
+            "s3url": f"s3://{bucket}/{key}",
+            "key_size": payload.size,
+            "key_checksum": (
+                await self.checksum_payload(payload) if kwargs.get("checksum") else None
+            ),
+            "bucket": bucket,
+            "key": key,
+            "etag": response["ETag"],
+            "version": payload.version,
+        }
+
+    @staticmethod
+    async def checksum_payload(payload) -> str:
+        """
+        Get checksum of payload without blocking the event loop.
+
+        Payload sent as single part with hash_on_read is hashed while it is read, so its digest
+        is ready. Otherwise(e.g. parts of multipart upload) rest of payload is hashed in hashing
+        thread pool.
+        :param payload: Uploaded payload e.g. StreamingPayload.
+        """
+        if payload.hashed >= payload.size:
+            return payload.checksum()
+        return await asyncio.get_running_loop().run_in_executor(
+            HashingService.get_thread_executor(), payload.checksum
+        )
+
+    async def list_objects(self, bucket: str, prefix: str = "", **kwargs) -> list:
         """
         List Objects.
 
+        Keys are collected into a list, use iter_keys/iter_objects to stream large buckets.
         :param bucket: Name of the bucket.
-        :return: Response of the list objects.
+        :param prefix: List objects starting with prefix only.
+        :keyword kwargs: delimiter, start_after, max_keys and page_size of iter_objects.
+        :return: List of keys of the objects.
         """
-        objects = []
-        async with self.get_client() as s3client:
-            self.s3_url = f"s3://{bucket}"
-            paginator = s3client.get_paginator("list_objects")
-            async for result in paginator.paginate(Bucket=bucket):
-                objects += [c["Key"] for c in result.get("Contents", [])]
-        self.log.info("list_objects %s Objects: %s", bucket, objects)
+        return [key async for key in self.iter_keys(bucket, prefix, **kwargs)]
+
+    @retries()
+    async def object_exists(self, bucket: str, key: str) -> bool:
+        """
+        Check object exists using head object.
 
-        return objects
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :return: True if object exists else False.
+        """
+        async with self.get_client() as s3client:
+            self.s3_url = f"s3://{bucket}/{key}"
+            try:
+                await s3client.head_object(Bucket=bucket, Key=key)
+            except ClientError as error:
+                if error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404:
+                    return False
+                raise error
+        return True
 
     @retries()
     async def delete_object(self, bucket: str, key: str) -> dict:
@@ -136,7 +207,7 @@ class S3Object(S3Bucket):
 
     @retries()
     async def get_object(
-        self, bucket: str, key: str, ranges: str = None, chunk_size: int = 0
+        self, bucket: str, key: str, ranges: str = None, chunk_size: int = 0, **kwargs
     ) -> dict:
         """
         Get object or byte range of the object.
@@ -145,29 +216,286 @@ class S3Object(S3Bucket):
         :param key: Name of object.
         :param ranges: Byte range to be retrieved
         :param chunk_size: get object in chunk sizes.
+        :keyword object_size: Size of the object if known, small objects are read by plain get.
         :return: response.
         """
         chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
+        self.log.info("Chunk size used %s", chunk_size)
+        response = {}
+        content_length = 0
+        chunks = self.iter_object(
+            bucket,
+            key,
+            ranges,
+            chunk_size,
+            response=response,
+            object_size=kwargs.get("object_size"),
+        )
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                content_length += len(chunk)
+        self.log.debug("Reading length: %s", content_length)
+        self.log.info("get_object s3://%s/%s Response: %s", bucket, key, response)
+
+        return response
+
+    async def iter_object(
+        self, bucket: str, key: str, ranges: str = None, chunk_size: int = 0, **kwargs
+    ):
+        """
+        Read object(or byte range of object) and yield its data in order, chunk by chunk.
+
+        Data larger than parallel_read_threshold is fetched as concurrent byte ranges by
+        iter_object_parts if parallel reads are enabled. Data of unknown size is fetched by
+        iter_object_parts as well, as its first ranged get gives size of the object. Otherwise
+        data is read over a single stream by a plain get. Callers close the generator with
+        aclosing, so the connection is released if reading stops early.
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param ranges: Byte range to be read e.g. bytes=0-1023, default is whole object.
+        :param chunk_size: Size of chunks read from stream.
+        :keyword response: Dict to be updated with response of get object.
+        :keyword object_size: Size of the object if known, to read small objects by plain get.
+        """
+        chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
+        self.s3_url = f"s3://{bucket}/{key}"
+        start, end = self.get_range_bounds(ranges)
+        length = kwargs.get("object_size")
+        if length is not None and start is not None:
+            length = (length if end is None else min(end, length)) - start
+        if (
+            S3_CFG.parallel_read_concurrency > 1
+            and start is not None
+            and (length is None or length > S3_CFG.parallel_read_threshold)
+        ):
+            chunks = self.iter_object_parts(bucket, key, ranges, chunk_size, **kwargs)
+        else:
+            chunks = self.iter_object_stream(bucket, key, ranges, chunk_size, **kwargs)
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                yield chunk
+
+    async def iter_object_stream(
+        self, bucket: str, key: str, ranges: str, chunk_size: int, **kwargs
+    ):
+        """
+        Read object(or byte range of object) over a single stream and yield it chunk by chunk.
+
+        Stream and its connection are held till the generator is done or closed.
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param ranges: Byte range to be read e.g. bytes=0-1023, None for whole object.
+        :param chunk_size: Size of chunks read from stream.
+        :keyword response: Dict to be updated with response of get object.
+        """
         async with self.get_client() as s3client:
-            self.s3_url = s3_url = f"s3://{bucket}/{key}"
             if ranges:
                 response = await s3client.get_object(Bucket=bucket, Key=key, Range=ranges)
-                async with response["Body"] as stream:
-                    chunk = await stream.read()
-                    self.log.debug("Reading length: %s", len(chunk))
             else:
-                self.log.info("Chunk size used %s", chunk_size)
                 response = await s3client.get_object(Bucket=bucket, Key=key)
-                async with response["Body"] as stream:
+            kwargs.get("response", {}).update(response)
+            async with response["Body"] as stream:
+                chunk = await stream.read(chunk_size)
+                while chunk:
+                    yield chunk
                     chunk = await stream.read(chunk_size)
-                    content_length = len(chunk)
-                    while chunk:
-                        chunk = await stream.read(chunk_size)
-                        content_length += len(chunk)
-                    self.log.debug("Reading length: %s", content_length)
-            self.log.info("get_object %s Response: %s", s3_url, response)
 
-        return response
+    async def iter_object_parts(
+        self, bucket: str, key: str, ranges: str, chunk_size: int, **kwargs
+    ):
+        """
+        Fetch object(or byte range of object) as parallel_read_part_size byte ranges in order.
+
+        First part is fetched by a ranged get, whose ContentRange gives size of the object,
+        and the rest is fetched by iter_ranges, concurrently if data is larger than
+        parallel_read_threshold. Parts are read completely before they are yielded, so
+        connections and request slots are released while the caller works on the data.
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param ranges: Byte range to be read in start-end format, None for whole object.
+        :param chunk_size: Size of chunks read from stream.
+        :keyword response: Dict to be updated with response of get object.
+        """
+        start, end = self.get_range_bounds(ranges)
+        first_end = start + S3_CFG.parallel_read_part_size
+        response = {}
+        chunks = await self.get_object_range(
+            bucket,
+            key,
+            start,
+            first_end if end is None else min(first_end, end),
+            response=response,
+            exact=False,
+            chunk_size=chunk_size,
+        )
+        # Range of empty object is not satisfiable, it is read over a single stream.
+        if "ContentRange" not in response:
+            chunks = self.iter_object_stream(bucket, key, ranges, chunk_size, **kwargs)
+            async with aclosing(chunks):
+                async for chunk in chunks:
+                    yield chunk
+            return
+        kwargs.get("response", {}).update(response)
+        # Content range is in format 'bytes start-end/size'.
+        size = int(response["ContentRange"].split("/")[-1])
+        end = size if end is None else min(end, size)
+        offset = start + sum(len(chunk) for chunk in chunks)
+        for chunk in chunks:
+            yield chunk
+        if offset < end:
+            concurrency = (
+                S3_CFG.parallel_read_concurrency
+                if end - start > S3_CFG.parallel_read_threshold
+                else 1
+            )
+            chunks = self.iter_ranges(
+                bucket, key, offset, end - offset, concurrency, chunk_size=chunk_size
+            )
+            async with aclosing(chunks):
+                async for chunk in chunks:
+                    yield chunk
+
+    @staticmethod
+    def get_range_bounds(ranges: str = None) -> tuple:
+        """
+        Get start and end(exclusive, None till end of object) of byte range.
+
+        :param ranges: Byte range e.g. bytes=0-1023 or bytes=1024-, default is whole object.
+        :return: (start, end), (None, None) if range is not in start-end format.
+        """
+        if not ranges:
+            return 0, None
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", ranges.strip())
+        if not match:
+            return None, None
+        return int(match.group(1)), int(match.group(2)) + 1 if match.group(2) else None
+
+    async def iter_ranges(
+        self, bucket: str, key: str, offset: int, size: int, concurrency: int = 0, **kwargs
+    ):
+        """
+        Fetch size bytes of object from offset as concurrent byte range gets, yield in order.
+
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param offset: Start of data to be read.
+        :param size: Size of data to be read.
+        :param concurrency: Max ranges fetched at a time, default is parallel_read_concurrency.
+        :keyword chunk_size: Size of chunks read from stream, default is chunk_size config.
+        """
+        part_size = S3_CFG.parallel_read_part_size
+        end = offset + size
+        starts = iter(range(offset, end, part_size))
+        tasks = deque()
+
+        def fetch(start: int):
+            """Start fetching the part from start."""
+            tasks.append(
+                asyncio.ensure_future(
+                    self.get_object_range(
+                        bucket, key, start, min(start + part_size, end), **kwargs
+                    )
+                )
+            )
+
+        try:
+            for start in islice(starts, concurrency or S3_CFG.parallel_read_concurrency):
+                fetch(start)
+            while tasks:
+                chunks = await tasks.popleft()
+                start = next(starts, None)
+                if start is not None:
+                    fetch(start)
+                for chunk in chunks:
+                    yield chunk
+        finally:
+            # Reader stopped early or failed, drop the parts still being fetched.
+            while tasks:
+                tasks.pop().cancel()
+
+    @retries()
+    async def get_object_range(
+        self, bucket: str, key: str, start: int, end: int, **kwargs
+    ) -> list:
+        """
+        Get byte range start to end(exclusive) of the object as list of chunks.
+
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param start: Start of byte range.
+        :param end: End of byte range, exclusive.
+        :keyword response: Dict to be updated with response of get object.
+        :keyword exact: Fail if less data is read than range, default is True. Otherwise range
+            past end of object is trimmed by server and no chunks are returned if range is not
+            satisfiable.
+        :keyword chunk_size: Size of chunks read from stream, default is chunk_size config.
+        """
+        chunk_size = kwargs.get("chunk_size") or S3_CFG.chunk_size
+        chunks = []
+        exact = kwargs.get("exact", True)
+        async with self.get_client() as s3client:
+            try:
+                response = await s3client.get_object(
+                    Bucket=bucket, Key=key, Range=f"bytes={start}-{end - 1}"
+                )
+            except ClientError as error:
+                if exact or error.response.get("Error", {}).get("Code") != "InvalidRange":
+                    raise error
+                return chunks
+            kwargs.get("response", {}).update(response)
+            async with response["Body"] as stream:
+                chunk = await stream.read(chunk_size)
+                while chunk:
+                    chunks.append(chunk)
+                    chunk = await stream.read(chunk_size)
+        read = sum(len(chunk) for chunk in chunks)
+        if read != end - start and (exact or read != response["ContentLength"]):
+            raise IOError(f"Read {read} bytes of s3://{bucket}/{key} range {start}-{end - 1}")
+        self.log.debug("get_object_range s3://%s/%s bytes %s-%s", bucket, key, start, end - 1)
+
+        return chunks
+
+    @retries()
+    async def verify_s3object(self, bucket: str, key: str, object_size: int, **kwargs) -> bool:
+        """
+        Read object(or byte range) in chunks and compare it with expected object data.
+
+        Expected data is regenerated block by block from global seed, bucket, key, size and
+        version, so no checksum needs to be stored and client memory stays constant whatever
+        the object size is.
+        :param bucket: The name of the s3 bucket.
+        :param key: Name of object.
+        :param object_size: Size of the object in bytes.
+        :keyword version: Version of the object, incremented on every overwrite.
+        :keyword offset: Start of byte range to be verified.
+        :keyword size: Size of byte range to be verified, default is till end of object.
+        :return: True if object data matches with expected data else False.
+        """
+        payload = StreamingPayload.for_object(bucket, key, object_size, kwargs.get("version", 0))
+        offset, size = kwargs.get("offset", 0), kwargs.get("size")
+        end = payload.size if size is None else min(offset + size, payload.size)
+        s3_url = f"s3://{bucket}/{key}"
+        ranges = f"bytes={offset}-{end - 1}" if offset or size is not None else None
+        response = {}
+        position = offset
+        chunks = self.iter_object(
+            bucket, key, ranges, response=response, object_size=object_size
+        )
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                if not payload.matches(position, chunk):
+                    self.log.error("Data mismatch in %s at offset %s", s3_url, position)
+                    return False
+                position += len(chunk)
+        self.log.info("verify_s3object %s Response %s", s3_url, response)
+        if position != end:
+            self.log.error(
+                "Read %s bytes of %s, expected %s", position - offset, s3_url, end - offset
+            )
+            return False
+        self.log.debug("verify_s3object %s, bytes %s-%s matched.", s3_url, offset, end - 1)
+
+        return True
 
     @retries()
     async def download_object(
@@ -184,16 +512,13 @@ class S3Object(S3Bucket):
         """
         chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
         self.log.info("Chunk size used %s", chunk_size)
-        async with self.get_client() as s3client:
-            self.s3_url = s3_url = f"s3://{bucket}/{key}"
-            response = await s3client.get_object(Bucket=bucket, Key=key)
-            self.log.info("download_object %s Response %s", s3_url, response)
-            async with response["Body"] as stream:
-                chunk = await stream.read(chunk_size)
-                with open(file_path, "wb+") as file_obj:
-                    while len(chunk) > 0:
-                        file_obj.write(chunk)
-                        chunk = await stream.read(chunk_size)
+        s3_url = f"s3://{bucket}/{key}"
+        response = {}
+        with open(file_path, "wb+") as file_obj:
+            chunks = self.iter_object(bucket, key, None, chunk_size, response=response)
+            async with aclosing(chunks):
+                async for chunk in chunks:
+                    file_obj.write(chunk)
         if os.path.exists(file_path):
             self.log.info("download_object %s Path: %s Response %s", s3_url, file_path, response)
 
@@ -229,9 +554,12 @@ class S3Object(S3Bucket):
         self, bucket: str, key: str, chunk_size: int = 0, ranges: str = None
     ) -> str:
         """
-        Read object in chunk and calculate sha256.
+        Read object in chunk and calculate checksum as per checksum algorithm.
 
-        Do not store the object in local storage.
+        Do not store the object in local storage. Large objects are read as concurrent byte
+        ranges and hashed in order. Chunks are hashed in hashing thread pool, so hashing of large
+        objects does not stall other sessions on the event loop. In etag mode ETag of single
+        part object is its MD5, so it is taken from head object without reading the data.
         :param bucket: The name of the s3 bucket.
         :param key: Name of object.
         :param chunk_size: size to read the content of s3 object.
@@ -239,24 +567,41 @@ class S3Object(S3Bucket):
         """
         chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
         self.log.info("Chunk size used %s", chunk_size)
-        async with self.get_client() as s3client:
-            self.s3_url = s3_url = f"s3://{bucket}/{key}"
-            file_hash = hashlib.sha256()
-            if ranges:
-                response = await s3client.get_object(Bucket=bucket, Key=key, Range=ranges)
-            else:
-                response = await s3client.get_object(Bucket=bucket, Key=key)
-            self.log.info("get_s3object_checksum %s Response %s", s3_url, response)
-            async with response["Body"] as stream:
-                chunk = await stream.read(chunk_size)
-                self.log.debug("Reading chunk length: %s", len(chunk))
-                while len(chunk) > 0:
-                    file_hash.update(chunk)
-                    chunk = await stream.read(chunk_size)
-            sha256_digest = file_hash.hexdigest()
-        self.log.debug("get_s3object_checksum %s, SHA-256: %s", s3_url, sha256_digest)
+        s3_url = f"s3://{bucket}/{key}"
+        if self.checksum_algorithm == const.ETAG and not ranges:
+            async with self.get_client() as s3client:
+                self.s3_url = s3_url
+                response = await s3client.head_object(Bucket=bucket, Key=key)
+            etag = response["ETag"].strip('"')
+            # ETag of multipart object is not MD5 of data, it has part count suffix.
+            if "-" not in etag:
+                self.log.debug("get_s3object_checksum %s, ETag: %s", s3_url, etag)
+                return etag
+        file_hash = AsyncHasher(self.checksum_algorithm)
+        response = {}
+        chunks = self.iter_object(bucket, key, ranges, chunk_size, response=response)
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                await file_hash.update(chunk)
+        self.log.info("get_s3object_checksum %s Response %s", s3_url, response)
+        digest = await file_hash.hexdigest()
+        self.log.debug(
+            "get_s3object_checksum %s, %s: %s", s3_url, self.checksum_algorithm, digest
+        )
+
+        return digest
+
+    async def checksum_file_async(self, file_path: str, offset: int = 0, size: int = None) -> str:
+        """
+        Calculate checksum of file(or size bytes from offset) in hashing executor.
 
-        return sha256_digest
+        :param file_path: Local file path
+        :param offset: Offset to start reading from.
+        :param size: Size in bytes to read from offset, default is till end of file.
+        """
+        return await HashingService.checksum_file(
+            file_path, offset, size, self.checksum_algorithm
+        )
 
     def checksum_file(self, file_path: str, chunk_size: int = 0):
         """
@@ -268,7 +613,7 @@ class S3Object(S3Bucket):
         chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
         self.log.info("Chunk size used %s", chunk_size)
         with open(file_path, "rb") as f_obj:
-            file_hash = hashlib.sha256()
+            file_hash = new_digest(self.checksum_algorithm)
             chunk = f_obj.read(chunk_size)
             self.log.debug("Reading chunk length: %s", len(chunk))
             while len(chunk) > 0:
@@ -293,7 +638,7 @@ class S3Object(S3Bucket):
             raise IOError(f"{offset + read_size} is less than file size {file_size} ")
         chunk_size = read_size if read_size < chunk_size else chunk_size
         self.log.info("Chunk size used %s", chunk_size)
-        file_hash = hashlib.sha256()
+        file_hash = new_digest(self.checksum_algorithm)
         read_length = read_size
         with open(file_path, "rb") as f_obj:
             f_obj.seek(offset)
@@ -322,17 +667,24 @@ class S3Object(S3Bucket):
         s3_resource = self.get_boto3_resource().Bucket(bucket_name)
         if object_prefix:
             objects = s3_resource.objects.filter(Prefix=object_prefix)
-            objects_to_delete = [{"Key": o.key} for o in objects if o.key.startswith(object_prefix)]
-            response = s3_resource.meta.client.delete_objects(
-                Bucket=bucket_name, Delete={"Objects": objects_to_delete}
-            )
-            self.log.info(
-                "deleted all s3 object with prefix '%s' from '%s', response: %s",
-                object_prefix,
+        else:
+            objects = s3_resource.objects.all()
+        # Collection delete sends delete_objects request per page of 1000 keys.
+        response = objects.delete()
+        errors = [error for resp in response for error in resp.get("Errors", [])]
+        for error in errors:
+            self.log.error(
+                "Failed to delete %s/%s: %s %s",
                 s3_url,
-                response,
+                error.get("Key"),
+                error.get("Code"),
+                error.get("Message"),
             )
-        else:
-            response = s3_resource.objects.all().delete()
-            self.log.info("deleted all s3 object from %s, response: %s", s3_url, response)
+        self.log.info(
+            "deleted %s s3 objects with prefix '%s' from '%s', errors: %s",
+            sum(len(resp.get("Deleted", [])) for resp in response),
+            object_prefix or "",
+            s3_url,
+            len(errors),
+        )
         return response
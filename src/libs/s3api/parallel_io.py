@@ -28,8 +28,9 @@ from typing import Union
 from src.commons.utils import utility
 from src.commons.utils._asyncio import run_event_loop_until_complete
 from src.commons.utils._asyncio import schedule_tasks
+from src.commons.utils.datagen import StreamingPayload
 from src.libs.s3api import S3Api
-
+from src.libs.s3api.engine import S3ApiEngine
 
 class S3ApiIOUtils(S3Api):
     """Utils for s3api."""
@@ -180,12 +181,6 @@ class S3ApiIOUtils(S3Api):
             distribution,
         )
 
-    def starts_sessions(self, func, *args, **kwargs) -> None:
-        """Start workload execution on s3 bucket as per distribution data."""
-        self.log.info("Execution started for %s", func.__name__)
-        run_event_loop_until_complete(self.log, func, *args, **kwargs)
-        self.log.info("Execution completed for %s", func.__name__)
-
     def get_object_size(self, object_size: Union[list, dict, int]) -> int:
         """Get the object size in bytes."""
         if isinstance(object_size, list):
@@ -207,19 +202,13 @@ class S3ApiIOUtils(S3Api):
             for _ in range(object_count):
                 file_size = self.get_object_size(objsize)
                 file_name = f"s3object-{file_size}bytes-{perf_counter_ns()}"
-                file_path = utility.create_file(file_name, file_size)
-                checksum_in = self.checksum_file(file_path)
+                payload = StreamingPayload.for_object(
+                    bucket_name, file_name, file_size, algorithm=self.checksum_algorithm
+                )
                 self.s3_url = f"s3://{bucket_name}/{file_name}"
-                response = await self.upload_object(bucket_name, key=file_name, file_path=file_path)
-                data["files"][file_name] = {
-                    "s3url": self.s3_url,
-                    "key_size": file_size,
-                    "key_checksum": checksum_in,
-                    "bucket": bucket_name,
-                    "key": file_name,
-                    "etag": response["ETag"],
-                }
-                self.remove_file(file_path)
+                data["files"][file_name] = await self.upload_payload(
+                    bucket_name, file_name, payload
+                )
 
         for _, values in distribution.items():
             for value in values:
@@ -228,6 +217,14 @@ class S3ApiIOUtils(S3Api):
                 )
         await schedule_tasks(self.log, tasks)
 
+    async def validate_object(self, bucket_name: str, file_name: str, file_info: dict) -> None:
+        """Read object and validate its data regenerated as per size and version."""
+        if not await self.verify_s3object(
+            bucket_name, file_name, file_info["key_size"], version=file_info.get("version", 0)
+        ):
+            raise AssertionError(f"Data integrity failed for s3://{bucket_name}/{file_name}")
+        self.log.info("Matched data for %s", file_name)
+
     async def read_all_data(self, distribution: dict, validate=True) -> None:
         """Read & validate given percentage of object distribution data from s3 bucket."""
         tasks = []
@@ -235,13 +232,12 @@ class S3ApiIOUtils(S3Api):
         async def read_data(data: dict) -> None:
             """Read n number of objects from s3 bucket."""
             for file_name in data["files"]:
-                response = await self.get_object(data["bucket_name"], file_name)
                 if validate:
-                    if data["files"][file_name]["etag"] != response["ETag"]:
-                        raise AssertionError(
-                            f"Failed to match ETag for {file_name}: response: " f"{response}"
-                        )
-                    self.log.info(f"Matched ETag for {file_name}")
+                    await self.validate_object(
+                        data["bucket_name"], file_name, data["files"][file_name]
+                    )
+                else:
+                    await self.get_object(data["bucket_name"], file_name)
 
         for _, values in distribution.items():
             for value in values:
@@ -254,18 +250,17 @@ class S3ApiIOUtils(S3Api):
 
         async def read_data(data):
             """Read n number of objects randomly from s3 bucket."""
-            file_list = data.get("files", [])
+            file_list = list(data.get("files", {}))
             shuffle(file_list)
             file_iter = iter(cycle(file_list))
             for _ in range(data["read_object_count"]):
                 file_name = next(file_iter)
-                response = await self.get_object(data["bucket_name"], file_name)
                 if validate:
-                    if data["files"][file_name]["etag"] != response["ETag"]:
-                        raise AssertionError(
-                            f"Failed to match ETag for {file_name}: response: " f"{response}"
-                        )
-                    self.log.info(f"Matched ETag for {file_name}")
+                    await self.validate_object(
+                        data["bucket_name"], file_name, data["files"][file_name]
+                    )
+                else:
+                    await self.get_object(data["bucket_name"], file_name)
 
         for _, values in distribution.items():
             for value in values:
@@ -280,14 +275,16 @@ class S3ApiIOUtils(S3Api):
             """Delete n number of objects randomly from s3 bucket."""
             file_list = list(data["files"].keys())
             shuffle(file_list)
-            file_iter = iter(cycle(file_list))
-            for _ in range(data["delete_object_count"]):
-                file_name = next(file_iter, "")
-                if file_name and file_name in data["files"]:
-                    await self.delete_object(data["bucket_name"], file_name)
+            if data["delete_object_count"] > len(file_list):
+                self.log.warning(
+                    "Only %s of %s files exists.", len(file_list), data["delete_object_count"]
+                )
+            file_list = file_list[: data["delete_object_count"]]
+            errors = await self.delete_keys(data["bucket_name"], file_list)
+            failed = {error.get("Key") for error in errors}
+            for file_name in file_list:
+                if file_name not in failed:
                     data["files"].pop(file_name, "")
-                else:
-                    self.log.warning("File '%s' does not exists.", file_name)
 
         for _, values in distribution.items():
             for value in values:
@@ -307,19 +304,13 @@ class S3ApiIOUtils(S3Api):
             for _ in range(object_count):
                 file_size = self.get_object_size(objsize)
                 file_name = f"s3object-{file_size}bytes-{perf_counter_ns()}"
-                file_path = utility.create_file(file_name, file_size)
-                checksum_in = self.checksum_file(file_path)
+                payload = StreamingPayload.for_object(
+                    bucket_name, file_name, file_size, algorithm=self.checksum_algorithm
+                )
                 self.s3_url = f"s3://{bucket_name}/{file_name}"
-                response = await self.upload_object(bucket_name, key=file_name, file_path=file_path)
-                self.remove_file(file_path)
-                data["files"][file_name] = {
-                    "s3url": self.s3_url,
-                    "key_size": file_size,
-                    "key_checksum": checksum_in,
-                    "bucket": bucket_name,
-                    "key": file_name,
-                    "etag": response["ETag"],
-                }
+                data["files"][file_name] = await self.upload_payload(
+                    bucket_name, file_name, payload
+                )
 
         for _, values in distribution.items():
             for value in values:
@@ -362,29 +353,20 @@ class S3ApiIOUtils(S3Api):
         ) -> None:
             """Overwrite and read same number of objects from s3 bucket."""
             for _ in range(object_count):
-                file_name = random.choice(data["files"])  # nosec
+                file_name = random.choice(list(data["files"]))  # nosec
                 file_size = self.get_object_size(objsize)
-                file_path = utility.create_file(file_name, file_size)
-                checksum_in = self.checksum_file(file_path)
+                version = data["files"][file_name].get("version", 0) + 1
+                payload = StreamingPayload.for_object(
+                    bucket_name, file_name, file_size, version, algorithm=self.checksum_algorithm
+                )
                 self.s3_url = f"s3://{bucket_name}/{file_name}"
-                response = await self.upload_object(bucket_name, key=file_name, file_path=file_path)
-                self.remove_file(file_path)
-                data["files"][file_name] = {
-                    "s3url": self.s3_url,
-                    "key_size": file_size,
-                    "key_checksum": checksum_in,
-                    "bucket": bucket_name,
-                    "key": file_name,
-                    "etag": response["ETag"],
-                }
-                response = await self.get_object(bucket_name, file_name)
+                data["files"][file_name] = await self.upload_payload(
+                    bucket_name, file_name, payload
+                )
                 if validate:
-                    if validate:
-                        if data["files"][file_name]["etag"] != response["ETag"]:
-                            raise AssertionError(
-                                f"Failed to match ETag for {file_name}: response: " f"{response}"
-                            )
-                        self.log.info(f"Matched ETag for {file_name}")
+                    await self.validate_object(bucket_name, file_name, data["files"][file_name])
+                else:
+                    await self.get_object(bucket_name, file_name)
 
         for _, values in distribution.items():
             for value in values:
@@ -404,7 +386,7 @@ class S3ApiIOUtils(S3Api):
 
 
 # pylint: disable=too-many-arguments
-class S3ApiParallelIO(S3Api):
+class S3ApiParallelIO(S3ApiEngine):
     """S3 object operations class for executing given type-1, 3 and 4 io stability workload."""
 
     def __init__(self, access_key: str, secret_key: str, endpoint_url: str, **kwargs) -> None:
@@ -415,9 +397,12 @@ class S3ApiParallelIO(S3Api):
         :param secret_key: secret key.
         :param endpoint_url: endpoint with http or https.
         :param use_ssl: To use secure connection.
+        :param test_id: Test ID string, used as name of on-disk catalog.
+        :param rate: Operations per second in open-loop mode, default is closed-loop on sessions.
+        :param arrival: Arrivals of open-loop operations constant or poisson.
+        :param seed: Seed of random generator of operations, default is global seed.
         """
         super().__init__(access_key, secret_key, endpoint_url=endpoint_url, **kwargs)
-        self.io_ops_dict = {}
         self.read_files = {}
         self.validated_files = {}
         self.deleted_files = {}
@@ -429,50 +414,56 @@ class S3ApiParallelIO(S3Api):
         sessions: int,
         object_prefix: str,
         validate=False,
+        workers: int = None,
     ) -> None:
         """
         Read data from s3 bucket as per object size.
 
-        Object prefix and number of samples in parallel as per sessions.
+        Object prefix and number of samples in parallel as per sessions(workers).
 
         :param bucket_name: Name of the s3 bucket.
         :param object_size: Object size per sample.
-        :param sessions: total number of sessions used to read samples.
+        :param sessions: total number of sessions(samples) to read.
         :param object_prefix: Object prefix used for read.
         :param validate: Validate the io's.
+        :param workers: Number of parallel workers, default is sessions.
         """
         self.log.info("Reading data...")
         self.log.info("Object size: %s, Number of samples: %s", object_size, sessions)
         if bucket_name not in self.read_files:
             self.read_files[bucket_name] = {}
             if "keys" not in self.read_files[bucket_name]:
-                self.read_files[bucket_name]["keys"] = []
+                self.read_files[bucket_name]["keys"] = set()
             if "total_count" not in self.read_files[bucket_name]:
                 self.read_files[bucket_name]["total_count"] = 0
-        if len(self.read_files[bucket_name]["keys"]) + sessions > len(
-            self.io_ops_dict[bucket_name]
-        ):
-            self.read_files[bucket_name]["keys"] = []
+        keys_count = self.catalog.count(bucket_name, object_size, object_prefix)
+        if not keys_count:
+            self.log.warning(
+                "No objects of size %s to read in %s, skipped.", object_size, bucket_name
+            )
+            return
+        if len(self.read_files[bucket_name]["keys"]) >= keys_count:
+            self.read_files[bucket_name]["keys"] = set()
         rkey_cntr = len(self.read_files[bucket_name]["keys"])
 
         async def read_s3object(**kwargs):
             """Read s3 object."""
             self.log.info("Get Object and check data integrity.")
-            key = list(self.io_ops_dict[bucket_name].keys())[kwargs.get("cntr")]
+            record = self.catalog.at(
+                bucket_name, kwargs.get("cntr") % keys_count, object_size, object_prefix
+            )
+            key = record.key
             self.log.info("Reading s3 object %s", key)
-            if self.io_ops_dict[bucket_name][key]["key_size"] == object_size and key.startswith(
-                object_prefix
-            ):
-                checksum_in = self.io_ops_dict[bucket_name][key]["key_checksum"]
-                if validate:
-                    if checksum_in != await self.get_s3object_checksum(bucket_name, key):
-                        raise AssertionError("Checksum are not equal.")
-                else:
-                    await self.get_object(bucket_name, key)
-                if key not in self.read_files[bucket_name]["keys"]:
-                    self.read_files[bucket_name]["keys"].append(key)
+            if validate:
+                if not await self.verify_s3object(
+                    bucket_name, key, record.size, version=record.version
+                ):
+                    raise AssertionError(f"Data integrity failed for {key}.")
+            else:
+                await self.get_object(bucket_name, key, object_size=record.size)
+            self.read_files[bucket_name]["keys"].add(key)
 
-        await self.schedule_api_sessions(sessions, read_s3object, cntr=rkey_cntr)
+        await self.run_operations(workers or sessions, sessions, read_s3object, cntr=rkey_cntr)
         self.read_files[bucket_name]["total_count"] += sessions
         self.log.info("Reading completed...")
 
@@ -497,39 +488,45 @@ class S3ApiParallelIO(S3Api):
                 self.deleted_files[bucket_name]["keys"] = []
             if "total_count" not in self.deleted_files[bucket_name]:
                 self.deleted_files[bucket_name]["total_count"] = 0
-        dkey_cntr = 0
-        if dkey_cntr + sessions > len(self.io_ops_dict[bucket_name]):
+        keys_count = self.catalog.count(bucket_name, object_size, object_prefix)
+        if sessions > keys_count:
             raise AssertionError(
-                f"Deletion keys count '{dkey_cntr + sessions}' is greater"
-                f" than actual keys '{self.io_ops_dict[bucket_name].keys()}'"
+                f"Deletion keys count '{sessions}' is greater"
+                f" than actual keys count '{keys_count}'"
             )
 
-        async def delete_s3object(**kwargs):
-            """Delete s3 object."""
-            key = list(self.io_ops_dict[bucket_name])[kwargs.get("cntr")]
-            if (
-                key.startswith(object_prefix)
-                and self.io_ops_dict[bucket_name][key]["key_size"] == object_size
-            ):
-                await self.delete_object(bucket_name, key)
-                self.deleted_files[bucket_name]["keys"].append(key)
-
-        await self.schedule_api_sessions(sessions, delete_s3object, cntr=dkey_cntr)
+        keys = [
+            self.catalog.at(bucket_name, pos, object_size, object_prefix).key
+            for pos in range(sessions)
+        ]
+        errors = await self.delete_keys(bucket_name, keys)
+        if errors:
+            raise AssertionError(f"Failed to delete {len(errors)} keys from {bucket_name}.")
+        for key in keys:
+            self.catalog.remove(bucket_name, key)
+        self.catalog.commit()
+        self.deleted_files[bucket_name]["keys"].extend(keys)
         self.deleted_files[bucket_name]["total_count"] += sessions
         self.log.info("Deletion completed...")
 
     async def validate_data(
-        self, bucket_name: str, object_size: int, sessions: int, object_prefix: str
+        self,
+        bucket_name: str,
+        object_size: int,
+        sessions: int,
+        object_prefix: str,
+        workers: int = None,
     ) -> None:
         """
         Validate data from s3 bucket as per object size.
 
-        Object prefix and number of samples in parallel as per sessions.
+        Object prefix and number of samples in parallel as per sessions(workers).
 
         :param bucket_name: Name of the s3 bucket.
         :param object_size: Object size per sample.
         :param sessions: total number objects to validate.
         :param object_prefix: object prefix used to validate specific object.
+        :param workers: Number of parallel workers, default is sessions.
         """
         self.log.info("Validating data...")
         self.log.info(
@@ -541,33 +538,34 @@ class S3ApiParallelIO(S3Api):
         if bucket_name not in self.validated_files:
             self.validated_files[bucket_name] = {}
             if "keys" not in self.validated_files[bucket_name]:
-                self.validated_files[bucket_name]["keys"] = []
+                self.validated_files[bucket_name]["keys"] = set()
             if "total_count" not in self.validated_files[bucket_name]:
                 self.validated_files[bucket_name]["total_count"] = 0
-        if len(self.validated_files[bucket_name]["keys"]) + sessions > len(
-            self.io_ops_dict[bucket_name]
-        ):
-            self.validated_files[bucket_name]["keys"] = []
+        keys_count = self.catalog.count(bucket_name, object_size, object_prefix)
+        if not keys_count:
+            self.log.warning(
+                "No objects of size %s to validate in %s, skipped.", object_size, bucket_name
+            )
+            return
+        if len(self.validated_files[bucket_name]["keys"]) >= keys_count:
+            self.validated_files[bucket_name]["keys"] = set()
         vkey_cntr = len(self.validated_files[bucket_name]["keys"])
 
         async def validate_s3object(**kwargs):
             """Validate object."""
-            key = list(self.io_ops_dict[bucket_name].keys())[kwargs.get("cntr")]
-            if (
-                key.startswith(object_prefix)
-                and self.io_ops_dict[bucket_name][key]["key_size"] == object_size
-            ):
-                checksum_in = self.io_ops_dict[bucket_name][key]["key_checksum"]
-                checksum_dwn = await self.get_s3object_checksum(bucket_name, key)
-                assert checksum_in == checksum_dwn, (
-                    f"Checksum are not equal for {key}: checksum_in: {checksum_in}, "
-                    f"checksum_down: {checksum_dwn}."
-                )
-                self.log.info("Check sum matched for object %s", key)
-                if key not in self.validated_files[bucket_name]["keys"]:
-                    self.validated_files[bucket_name]["keys"].append(key)
-
-        await self.schedule_api_sessions(sessions, validate_s3object, cntr=vkey_cntr)
+            record = self.catalog.at(
+                bucket_name, kwargs.get("cntr") % keys_count, object_size, object_prefix
+            )
+            key = record.key
+            assert await self.verify_s3object(
+                bucket_name, key, record.size, version=record.version
+            ), f"Data integrity failed for {key}."
+            self.log.info("Data matched for object %s", key)
+            self.validated_files[bucket_name]["keys"].add(key)
+
+        await self.run_operations(
+            workers or sessions, sessions, validate_s3object, cntr=vkey_cntr
+        )
         self.validated_files[bucket_name]["total_count"] += sessions
         self.log.info("Validation completed...")
 
@@ -575,143 +573,115 @@ class S3ApiParallelIO(S3Api):
         """
         Delete s3 buckets along with all s3 objects in parallel as per sessions.
 
-        :param sessions: Number of parallel session.
+        :param sessions: Number of parallel session(workers).
         """
         deleted_buckets = []
-        buckets = list(self.io_ops_dict)
+        buckets = self.catalog.get_buckets()
         self.log.info("Bucket list: %s", buckets)
 
         async def delete_bucket(**kwargs):
             """Delete s3 bucket."""
-            i = kwargs.get("cntr")
-            if len(buckets) >= i:
-                bucket_name = buckets[i]
-                await self.delete_bucket(bucket_name, force=True)
-                deleted_buckets.append(bucket_name)
-                del self.io_ops_dict[bucket_name]
-
-        await self.schedule_api_sessions(sessions, delete_bucket)
+            bucket_name = buckets[kwargs.get("cntr")]
+            await self.delete_bucket(bucket_name, force=True)
+            deleted_buckets.append(bucket_name)
+            self.catalog.remove_bucket(bucket_name)
+
+        await self.run_workers(sessions, len(buckets), delete_bucket)
         self.log.info("Deleted buckets: %s", deleted_buckets)
 
     async def write_data(
-        self, bucket_name: str, object_size: int, object_prefix: str, sessions: int
+        self,
+        bucket_name: str,
+        object_size: int,
+        object_prefix: str,
+        sessions: int,
+        workers: int = None,
     ) -> None:
         """
         Write data to s3 bucket as per object size.
 
-        Object prefix and number of samples in parallel as per sessions.
+        Object prefix and number of samples in parallel as per sessions(workers).
 
         :param object_prefix: Object name prefix used while creating unique object.
         :param bucket_name: Name of the s3 bucket.
         :param object_size: Object size per sample.
         :param sessions: total number of sessions(samples) used to upload samples.
+        :param workers: Number of parallel workers, default is sessions.
         """
         self.log.info("Writing data...")
-        file_name = f"{object_prefix}-{perf_counter_ns()}"
-        file_path = utility.create_file(file_name, object_size)
         self.log.info(
             "Object: '%s', object size: %s, Number of samples: %s",
             object_prefix,
             utility.convert_size(object_size),
             sessions,
         )
-        checksum_in = self.checksum_file(file_path)
-        self.log.debug("Checksum of '%s' = %s", file_name, checksum_in)
-        kcnt = (len(self.io_ops_dict[bucket_name]) if bucket_name in self.io_ops_dict else 0) + 1
+        kcnt = self.catalog.count(bucket_name) + 1
 
         async def upload_s3object(**kwargs):
             """Upload s3 object."""
-            key = f"{object_prefix}-{perf_counter_ns()}-{checksum_in}-{kwargs.get('cntr')}"
+            key = f"{object_prefix}-{perf_counter_ns()}-{kwargs.get('cntr')}"
             self.s3_url = s3_url = f"s3://{bucket_name}/{key}"
-            response = await self.upload_object(bucket_name, key, file_path=file_path)
+            payload = StreamingPayload.for_object(
+                bucket_name, key, object_size, algorithm=self.checksum_algorithm
+            )
             self.log.info("Uploading s3 object: url: %s", s3_url)
-            if bucket_name not in self.io_ops_dict:
-                self.io_ops_dict[bucket_name] = {
-                    key: {
-                        "s3url": s3_url,
-                        "key_size": object_size,
-                        "key_checksum": checksum_in,
-                        "bucket": bucket_name,
-                        "key": key,
-                        "etag": response["ETag"],
-                    }
-                }
-            else:
-                self.io_ops_dict[bucket_name][key] = {
-                    "s3url": s3_url,
-                    "key_size": object_size,
-                    "key_checksum": checksum_in,
-                    "bucket": bucket_name,
-                    "key": key,
-                    "etag": response["ETag"],
-                }
+            record = await self.upload_payload(bucket_name, key, payload)
+            self.catalog.add_record(record, object_prefix)
             self.log.info("s3://%s/%s uploaded successfully.", bucket_name, key)
 
         self.log.info(
-            "Scheduling to upload file %s, size %s, for samples %s ",
+            "Scheduling to upload object %s, size %s, for samples %s ",
             object_prefix,
-            file_path,
+            object_size,
             sessions,
         )
-        await self.schedule_api_sessions(sessions, upload_s3object, cntr=kcnt)
-        os.remove(file_path)
-
-    @staticmethod
-    def get_session_distributions(samples, sessions):
-        """Get session distributions as per samples."""
-        if samples < sessions:
-            sessions_distributions = [samples]
-        else:
-            sessions_distributions = [sessions for _ in range(int(samples / sessions))]
-            if samples % sessions:
-                sessions_distributions.extend([samples % sessions])
-        return sessions_distributions
-
-    async def schedule_api_sessions(self, sessions, func, *args, **kwargs):
-        """Schedule session for function as per sessions."""
-        tasks = []
-        kwargs["cntr"] = kwargs.get("cntr", 0)
-        for _ in range(1, sessions + 1):
-            tasks.append(func(*args, **kwargs))
-            kwargs["cntr"] += 1
-        if tasks:
-            self.log.info("Scheduling tasks: %s.", tasks)
-            await schedule_tasks(self.log, tasks)
-            self.log.info("completed tasks: %s.", tasks)
-
-    def create_sessions(self, func, *args, **kwargs):
-        """
-        Start workload execution.
+        await self.run_operations(workers or sessions, sessions, upload_s3object, cntr=kcnt)
 
-        :param func: Name of the function.
-        """
-        self.log.info("Execution started for %s", func.__name__)
-        run_event_loop_until_complete(self.log, func, *args, **kwargs)
-        self.log.info("Execution completed for %s", func.__name__)
-
-    def get_s3bucket(self, operations: str, bucket_name: str, obj_size: int):
+    async def get_s3bucket(self, operations: str, bucket_name: str, obj_size: int):
         """Get/Create the s3 io bucket."""
         buckets = [
             bkt
-            for bkt in self.list_s3_buckets()
+            for bkt in await self.list_buckets()
             if (bucket_name == bkt or bkt.startswith(f"iobkt-size{obj_size}-samples"))
         ]
         if operations == "write" and not buckets:
-            self.create_s3_bucket(bucket_name)
+            await self.create_bucket(bucket_name)
         else:
             if not buckets:
                 raise AssertionError(f"Bucket does not exists: {bucket_name}")
             bucket_name = buckets[-1]
         return bucket_name
 
-    # pylint: disable=too-many-branches, too-many-nested-blocks
     def execute_workload(self, operations, sessions=1, **kwargs):
         """
-        Execute s3 workload distribution.
+        Execute s3 workload distribution on a new event loop.
 
+        Used from synchronous callers, coroutines should await execute_workload_async.
         :param operations: Supported operations are 'write', 'read', 'delete', 'validate' and
         'cleanup' in parallel as per sessions and distribution.
         :param sessions: Number of sessions.
+        """
+        self.log.info("Execution started for %s", operations)
+        run_event_loop_until_complete(
+            self.log,
+            self.execute_and_close,
+            self.execute_workload_async,
+            operations,
+            sessions,
+            **kwargs,
+        )
+        self.log.info("Execution completed for %s", operations)
+
+    # pylint: disable=too-many-branches, too-many-nested-blocks
+    async def execute_workload_async(self, operations, sessions=1, **kwargs):
+        """
+        Execute s3 workload distribution on the running event loop.
+
+        Samples of an object size are run by sessions workers pulling them from a queue, so
+        sessions requests are in flight till all samples are done.
+        :param operations: Supported operations are 'write', 'read', 'delete', 'validate' and
+        'cleanup' in parallel as per sessions and distribution.
+        :param sessions: Number of sessions(parallel workers).
         :keyword distribution: Distribution of object size and number of samples.
             ex: {1024: 115, 2048: 100, 4096: 225}
         :keyword validate: Optional and used in case of read operations.
@@ -725,55 +695,47 @@ class S3ApiParallelIO(S3Api):
                 bucket_name = kwargs.get("bucket_name", f"iobkt-size{obj_size}-samples{num_sample}")
                 object_prefix = kwargs.get("object_prefix", f"object-{obj_size}")
                 if operations == "write":
-                    bucket_name = self.get_s3bucket(operations, bucket_name, obj_size)
-                    for clients in self.get_session_distributions(num_sample, sessions):
-                        self.create_sessions(
-                            self.write_data,
-                            bucket_name=bucket_name,
-                            object_size=obj_size,
-                            object_prefix=object_prefix,
-                            sessions=clients,
-                        )
+                    bucket_name = await self.get_s3bucket(operations, bucket_name, obj_size)
+                    await self.write_data(
+                        bucket_name=bucket_name,
+                        object_size=obj_size,
+                        object_prefix=object_prefix,
+                        sessions=num_sample,
+                        workers=sessions,
+                    )
                 if operations == "read":
                     validate = kwargs.get("validate", False)
-                    bucket_name = self.get_s3bucket(operations, bucket_name, obj_size)
-                    for clients in self.get_session_distributions(num_sample, sessions):
-                        self.create_sessions(
-                            self.read_data,
-                            bucket_name=bucket_name,
-                            object_size=obj_size,
-                            object_prefix=object_prefix,
-                            sessions=clients,
-                            validate=validate,
-                        )
+                    bucket_name = await self.get_s3bucket(operations, bucket_name, obj_size)
+                    await self.read_data(
+                        bucket_name=bucket_name,
+                        object_size=obj_size,
+                        object_prefix=object_prefix,
+                        sessions=num_sample,
+                        validate=validate,
+                        workers=sessions,
+                    )
                 if operations == "validate":
-                    bucket_name = self.get_s3bucket(operations, bucket_name, obj_size)
-                    for clients in self.get_session_distributions(num_sample, sessions):
-                        self.create_sessions(
-                            self.validate_data,
-                            bucket_name=bucket_name,
-                            object_size=obj_size,
-                            object_prefix=object_prefix,
-                            sessions=clients,
-                        )
+                    bucket_name = await self.get_s3bucket(operations, bucket_name, obj_size)
+                    await self.validate_data(
+                        bucket_name=bucket_name,
+                        object_size=obj_size,
+                        object_prefix=object_prefix,
+                        sessions=num_sample,
+                        workers=sessions,
+                    )
                 if operations == "delete":
-                    bucket_name = self.get_s3bucket(operations, bucket_name, obj_size)
-                    for clients in self.get_session_distributions(num_sample, sessions):
-                        self.create_sessions(
-                            self.delete_data,
-                            bucket_name=bucket_name,
-                            object_size=obj_size,
-                            object_prefix=object_prefix,
-                            sessions=clients,
-                        )
-                        for key in self.deleted_files[bucket_name]["keys"]:
-                            if key in self.io_ops_dict[bucket_name]:
-                                self.io_ops_dict[bucket_name].pop(key)
+                    bucket_name = await self.get_s3bucket(operations, bucket_name, obj_size)
+                    # Keys are deleted in delete_objects batches, delete_concurrency at a time.
+                    await self.delete_data(
+                        bucket_name=bucket_name,
+                        object_size=obj_size,
+                        object_prefix=object_prefix,
+                        sessions=num_sample,
+                    )
                     self.log.info(
                         "Bucket: %s, Deleted keys: %s",
                         bucket_name,
                         self.deleted_files[bucket_name]["keys"],
                     )
         if operations == "cleanup":
-            for clients in self.get_session_distributions(len(self.io_ops_dict), sessions):
-                self.create_sessions(self.cleanup_data, sessions=clients)
+            await self.cleanup_data(sessions=sessions)
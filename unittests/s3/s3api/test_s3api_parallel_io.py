@@ -62,11 +62,11 @@ class TestS3ApiParallelIO(unittest.TestCase):
         self.s3obj.execute_workload(
             operations="write", sessions=5, distribution=self.write_distribution
         )
-        for bucket in list(self.s3obj.io_ops_dict):
+        for bucket in self.s3obj.catalog.get_buckets():
             for object_size, samples in self.write_distribution.items():
                 if str(object_size) in bucket:
                     assert (
-                        len(self.s3obj.io_ops_dict[bucket]) == samples
+                        self.s3obj.catalog.count(bucket) == samples
                     ), f"failed write distribution: {object_size}:{samples}"
 
     def test_2_read_data(self):
@@ -112,15 +112,15 @@ class TestS3ApiParallelIO(unittest.TestCase):
     def test_5_complete_delete(self):
         """Test complete delete."""
         distribution = {}
-        for bucket in list(self.s3obj.io_ops_dict):
+        for bucket in self.s3obj.catalog.get_buckets():
             for object_size in self.object_sizes:
                 if str(object_size) in bucket:
-                    distribution[object_size] = len(self.s3obj.io_ops_dict[bucket])
+                    distribution[object_size] = self.s3obj.catalog.count(bucket)
         self.s3obj.log.info(distribution)
         self.s3obj.execute_workload(operations="delete", sessions=5, distribution=distribution)
-        for bucket in list(self.s3obj.io_ops_dict):
+        for bucket in self.s3obj.catalog.get_buckets():
             assert (
-                len(self.s3obj.io_ops_dict[bucket]) == 0
+                self.s3obj.catalog.count(bucket) == 0
             ), f"Failed to complete data from {bucket}"
 
     def test_6_cleanup(self):
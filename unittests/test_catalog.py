@@ -0,0 +1,115 @@
+"""Unit tests for compact object catalog"""
+import os
+import tempfile
+import unittest
+
+from src.libs.s3api.catalog import ObjectCatalog
+from src.libs.s3api.catalog import SQLiteObjectCatalog
+
+
+class TestObjectCatalog(unittest.TestCase):
+    """Test object catalog"""
+
+    def setUp(self):
+        self.catalog = self.new_catalog()
+        for i in range(5):
+            self.catalog.add("bkt1", f"obj-1k-{i}", 1024, "obj-1k", checksum="ab" * 32)
+        for i in range(3):
+            self.catalog.add("bkt1", f"obj-2k-{i}", 2048, "obj-2k", version=1)
+        self.catalog.add_record(
+            {"bucket": "bkt2", "key": "obj", "key_size": 1, "key_checksum": "00ff", "etag": "e"}
+        )
+
+    def test_index(self):
+        """Positional access by bucket and by size, prefix"""
+        self.assertEqual(self.catalog.count("bkt1"), 8)
+        self.assertEqual(self.catalog.count("bkt1", 1024, "obj-1k"), 5)
+        self.assertEqual(self.catalog.count("bkt1", 2048, "obj-1k"), 0)
+        self.assertEqual(self.catalog.at("bkt1", 1, 2048, "obj-2k").key, "obj-2k-1")
+        self.assertEqual(self.catalog.choice("bkt1", 1024, "obj-1k").size, 1024)
+        record = self.catalog.get("bkt2", "obj")
+        self.assertEqual((record.checksum, record.etag, record.version), ("00ff", "e", 0))
+        self.assertEqual(self.catalog.get_buckets(), ["bkt1", "bkt2"])
+
+    def test_remove(self):
+        """Swap remove keeps positions of remaining records"""
+        self.assertEqual(self.catalog.remove("bkt1", "obj-1k-1").key, "obj-1k-1")
+        self.assertIsNone(self.catalog.remove("bkt1", "obj-1k-1"))
+        self.assertIsNone(self.catalog.get("bkt1", "obj-1k-1"))
+        for size, prefix in ((None, None), (1024, "obj-1k")):
+            for pos in range(self.catalog.count("bkt1", size, prefix)):
+                record = self.catalog.at("bkt1", pos, size, prefix)
+                self.assertNotEqual(record.key, "obj-1k-1")
+                self.assertEqual(pos, record.index_pos if size else record.bucket_pos)
+        self.assertEqual(self.catalog.count("bkt1", 1024, "obj-1k"), 4)
+
+    def test_replace_and_remove_bucket(self):
+        """Overwrite replaces record, removed bucket drops its records"""
+        self.catalog.add("bkt1", "obj-1k-0", 1024, "obj-1k", version=2)
+        self.assertEqual(self.catalog.count("bkt1", 1024, "obj-1k"), 5)
+        self.assertEqual(self.catalog.get("bkt1", "obj-1k-0").version, 2)
+        self.catalog.remove_bucket("bkt1")
+        self.assertEqual(self.catalog.get_buckets(), ["bkt2"])
+        self.assertEqual(self.catalog.count("bkt1"), 0)
+        self.assertIsNone(self.catalog.get("bkt1", "obj-1k-0"))
+
+    @staticmethod
+    def new_catalog():
+        """Get empty catalog"""
+        return ObjectCatalog()
+
+
+class TestSQLiteObjectCatalog(TestObjectCatalog):
+    """Test on-disk object catalog"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        super().setUp()
+
+    def tearDown(self):
+        self.catalog.close()
+        self.tmp_dir.cleanup()
+
+    def new_catalog(self, resume=False):
+        """Get catalog of database in temp directory"""
+        return SQLiteObjectCatalog(
+            os.path.join(self.tmp_dir.name, "catalog.db"), resume=resume, batch_size=4
+        )
+
+    def test_resume(self):
+        """Resumed catalog has objects and positions of previous run"""
+        self.catalog.remove("bkt1", "obj-1k-0")
+        self.catalog.close()
+        self.catalog = self.new_catalog(resume=True)
+        self.assertEqual(self.catalog.get_buckets(), ["bkt1", "bkt2"])
+        self.assertEqual(self.catalog.count("bkt1", 1024, "obj-1k"), 4)
+        self.assertEqual(self.catalog.at("bkt1", 3, 1024, "obj-1k").checksum, "ab" * 32)
+        self.assertEqual(self.catalog.total_size(), 4 * 1024 + 3 * 2048 + 1)
+        self.catalog.close()
+        self.catalog = self.new_catalog()
+        self.assertEqual(self.catalog.get_buckets(), [])
+
+    def test_meta(self):
+        """Settings stored on create are restored on resume, stale WAL is removed"""
+        self.catalog.close()
+        self.catalog = SQLiteObjectCatalog(
+            os.path.join(self.tmp_dir.name, "meta.db"), meta={"seed": 5, "chunk_size": 1024}
+        )
+        self.catalog.close()
+        self.catalog = SQLiteObjectCatalog(
+            os.path.join(self.tmp_dir.name, "meta.db"), resume=True, meta={"seed": 6}
+        )
+        self.assertEqual(self.catalog.meta, {"seed": 5, "chunk_size": 1024})
+        self.catalog.close()
+        wal_path = os.path.join(self.tmp_dir.name, "meta.db-wal")
+        with open(wal_path, "wb") as f_out:
+            f_out.write(b"stale")
+        self.catalog = SQLiteObjectCatalog(
+            os.path.join(self.tmp_dir.name, "meta.db"), meta={"seed": 6}
+        )
+        self.assertEqual(self.catalog.meta, {"seed": 6})
+        self.assertEqual(self.catalog.get_buckets(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
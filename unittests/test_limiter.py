@@ -0,0 +1,76 @@
+"""Unit tests for adaptive concurrency limiter"""
+import asyncio
+import unittest
+
+from aiobotocore.awsrequest import AioAWSResponse
+
+from src.libs.s3api import S3Api
+from src.libs.s3api.limiter import AdaptiveLimiter
+
+ENDPOINT = "http://throttle.test:5055"
+
+
+class Body:
+    """Raw body of injected response"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    async def read(self) -> bytes:
+        """Body data"""
+        return self.data
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    """Test throttling reaches limiter when botocore retries it"""
+
+    def setUp(self):
+        AdaptiveLimiter.limiters.pop(ENDPOINT, None)
+        self.limiter = AdaptiveLimiter(ENDPOINT, 8, decrease_factor=0.5, decrease_interval=60)
+        AdaptiveLimiter.limiters[ENDPOINT] = self.limiter
+
+    def tearDown(self):
+        AdaptiveLimiter.limiters.pop(ENDPOINT, None)
+
+    def test_botocore_retried_throttle(self):
+        """Throttled attempt retried by botocore shrinks the limit of endpoint"""
+        attempts = []
+
+        def send(request, **_):
+            attempts.append(request.url)
+            if len(attempts) == 1:
+                return AioAWSResponse(
+                    request.url, 503, {}, Body(b"<Error><Code>SlowDown</Code></Error>")
+                )
+            return AioAWSResponse(request.url, 200, {}, Body(b""))
+
+        async def head_bucket():
+            s3api = S3Api(
+                "access", "secret", endpoint_url=ENDPOINT, use_ssl=False, test_id="UnitTest"
+            )
+            try:
+                async with s3api.get_client() as client:
+                    client.meta.events.register("before-send.s3", send)
+                    await client.head_bucket(Bucket="throttled")
+            finally:
+                await s3api.close()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(head_bucket())
+        finally:
+            loop.close()
+        self.assertEqual(len(attempts), 2)
+        self.assertLess(self.limiter.limit, 8)
+
+    def test_no_throttle(self):
+        """Other errors keep the limit"""
+        AdaptiveLimiter.on_needs_retry(
+            response=(AioAWSResponse(ENDPOINT, 404, {}, None), {"Error": {"Code": "404"}}),
+            endpoint=type("Endpoint", (), {"host": ENDPOINT}),
+        )
+        self.assertEqual(self.limiter.limit, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,6 +32,42 @@ class TestMasterConfig(unittest.TestCase):
             apply_master_config(test_set, self.master_config)
         self.assertIn("Wrong parameter range_read in test_1", str(context.exception))
 
+    def test_optional_parameter(self):
+        """Optional parameters scenario"""
+        te_yaml = """
+        test_1:
+          TEST_ID: TEST-35748
+          checksum_algorithm: crc32c
+          tool: s3api
+          operation: copy_object
+        test_2:
+          TEST_ID: TEST-35749
+          tool: s3api
+          operation: copy_object
+        """
+        test_set = yaml.safe_load(te_yaml)
+        out = apply_master_config(test_set, self.master_config)
+        self.assertEqual(out["test_1"]["checksum_algorithm"], "crc32c")
+        self.assertNotIn("checksum_algorithm", out["test_2"])
+
+    def test_mixed_object_ops(self):
+        """Mixed object operations workload scenario"""
+        te_yaml = """
+        test_1:
+          TEST_ID: TEST-40043
+          op_mix:
+            get: 80
+            put: 20
+          tool: s3api
+          operation: mixed_object_ops
+        """
+        test_set = yaml.safe_load(te_yaml)
+        out = apply_master_config(test_set, self.master_config)
+        master_config = self.master_config["s3api"]["mixed_object_ops"]
+        self.assertEqual(out["test_1"]["op_mix"], {"get": 80, "put": 20})
+        self.assertEqual(out["test_1"]["dataset_objects"], master_config["dataset_objects"])
+        self.assertEqual(out["test_1"]["object_size"], master_config["object_size"])
+
     def test_no_parameter(self):
         """No parameters scenario"""
         te_yaml = """